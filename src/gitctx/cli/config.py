@@ -1,14 +1,18 @@
 """Config command for gitctx CLI."""
+# ruff: noqa: PLC0415 # Inline imports: this sub-app is registered on every CLI start
 
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 import typer
-from pydantic import ValidationError
 from rich.console import Console
 
 from gitctx.cli.symbols import SYMBOLS
 from gitctx.cli.tips import is_first_run, show_tip
-from gitctx.config.settings import GitCtxSettings, init_repo_config
+
+if TYPE_CHECKING:
+    from pydantic import ValidationError
 
 console = Console()
 console_err = Console(stderr=True)
@@ -74,6 +78,8 @@ def config_init(
 
     Run this once per repository before setting repo-level config.
     """
+    from gitctx.config.settings import init_repo_config
+
     try:
         init_repo_config()
 
@@ -122,6 +128,10 @@ def config_set(
         $ gitctx config set api_keys.openai sk-abc123
         $ gitctx config set search.limit 20
     """
+    from pydantic import ValidationError
+
+    from gitctx.config.settings import GitCtxSettings
+
     try:
         # Load settings, update value, save
         settings = GitCtxSettings()
@@ -181,6 +191,8 @@ def config_get(
         $ gitctx config get api_keys.openai --verbose
         api_keys.openai = sk-...123 (from user config)
     """
+    from gitctx.config.settings import GitCtxSettings
+
     try:
         settings = GitCtxSettings()
 
@@ -254,6 +266,8 @@ def config_list(
         search.limit=10 (default)
         model.embedding=text-embedding-3-large (default)
     """
+    from gitctx.config.settings import GitCtxSettings
+
     settings = GitCtxSettings()
 
     # Flatten nested models to dot notation
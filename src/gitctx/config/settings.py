@@ -9,9 +9,13 @@ Precedence:
 """
 # ruff: noqa: PLC0415 # Conditional imports for config validation (avoid circular imports)
 
+import copy
+import hashlib
 import os
+import re
 from collections.abc import Callable
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -21,9 +25,17 @@ from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
     SettingsConfigDict,
-    YamlConfigSettingsSource,
 )
 
+from gitctx import __version__
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # ===================================================================
 # Enums
 # ===================================================================
@@ -87,6 +99,156 @@ def _get_user_home() -> Path:
     return Path(os.environ.get("HOME", str(Path.home())))
 
 
+# The version pins the schema the body was validated against: a file saved
+# by another gitctx release is treated as hand-edited.
+_TRUSTED_HEADER = f"# gitctx-config {__version__} sha256=".encode()
+
+
+def _trusted_header(body: bytes) -> bytes:
+    """Header line that RepoConfig.save() prepends to the YAML body it writes."""
+    return _TRUSTED_HEADER + hashlib.sha256(body).hexdigest().encode() + b"\n"
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> tuple[dict[str, Any], bool]:  # noqa: ARG001
+    """Parse a YAML config file, memoized on its stat signature.
+
+    mtime_ns and size are part of the cache key only, so editing the file
+    invalidates the entry without re-reading it on every construction. The
+    file is read in one call and handed to libyaml as bytes, which also does
+    the encoding detection, instead of streaming it through a text wrapper.
+
+    Returns:
+        Tuple of (parsed mapping, trusted), where trusted means the file
+        starts with this release's save() header and its checksum matches
+        the body.
+    """
+    raw = Path(path).read_bytes()
+    trusted = False
+    if raw.startswith(_TRUSTED_HEADER):
+        header, _, body = raw.partition(b"\n")
+        trusted = header + b"\n" == _trusted_header(body)
+    return yaml.load(raw, Loader=_YamlLoader) or {}, trusted
+
+
+def _read_yaml_config(
+    yaml_file: Path, st: os.stat_result | None = None
+) -> tuple[dict[str, Any], bool]:
+    """Return the cached (mapping, trusted) parse of yaml_file; callers must not mutate it."""
+    if st is None:
+        st = yaml_file.stat()
+    return _load_yaml_cached(os.path.abspath(yaml_file), st.st_mtime_ns, st.st_size)
+
+
+def _load_yaml_config(yaml_file: Path, st: os.stat_result | None = None) -> dict[str, Any]:
+    """Load a YAML config file through the stat-keyed cache.
+
+    Args:
+        yaml_file: Config file path (relative paths resolve against the cwd)
+        st: stat result the caller already has for yaml_file, to avoid a re-stat
+
+    Returns:
+        A deep copy of the parsed mapping, so callers cannot poison the cache.
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read (e.g. PermissionError)
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    data, _ = _read_yaml_config(yaml_file, st)
+    return copy.deepcopy(data)
+
+
+def _write_config_atomic(
+    config_path: Path, payload: bytes, mode: int, *, durable: bool = False
+) -> None:
+    """Replace config_path with payload so readers never see a torn file.
+
+    The bytes go to a sibling temp file that is fsynced and chmodded before
+    being os.replace()d over the target. A symlinked config_path is resolved
+    first, so the link is kept and the file it points to is replaced. Only
+    with durable=True is the parent directory fsynced as well, which makes the
+    rename itself crash-safe; that extra sync is skipped by default and on
+    Windows, which cannot open directories for it.
+
+    Args:
+        config_path: Final config file path
+        payload: Complete file contents
+        mode: Permission bits for the final file
+        durable: Also fsync the parent directory after the rename
+
+    Raises:
+        OSError: If the temp file cannot be written or renamed (e.g. PermissionError)
+    """
+    config_path = config_path.resolve()
+    tmp_path = config_path.with_name(f".{config_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.chmod(mode)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if durable and os.name != "nt":
+        dir_fd = os.open(config_path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+# Strings YAML emits unquoted and reads back as the same str (no bools/nulls)
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z][\w.\-]*", re.ASCII)
+_YAML_RESERVED_WORDS = frozenset({"y", "n", "yes", "no", "true", "false", "on", "off", "null"})
+
+
+def _is_plain_scalar(value: Any) -> bool:
+    """Return True if value round-trips through YAML as an unquoted str."""
+    return (
+        isinstance(value, str)
+        and _PLAIN_SCALAR_RE.fullmatch(value) is not None
+        and value.lower() not in _YAML_RESERVED_WORDS
+    )
+
+
+def _dump_user_yaml(data: dict[str, Any]) -> bytes:
+    """Serialize user config data exactly as yaml.dump would.
+
+    The user config schema is fixed (api_keys.openai and theme), so when every
+    value is a plain scalar the document is formatted directly instead of
+    walking PyYAML's representer; anything else falls back to yaml.dump.
+
+    Args:
+        data: Mapping built by UserConfig.save()
+
+    Returns:
+        UTF-8 encoded YAML document
+    """
+    api_keys = data.get("api_keys", {})
+    if (
+        data
+        and data.keys() <= {"api_keys", "theme"}
+        and api_keys.keys() <= {"openai"}
+        and ("api_keys" not in data or _is_plain_scalar(api_keys.get("openai")))
+        and ("theme" not in data or _is_plain_scalar(data["theme"]))
+    ):
+        text = ""
+        if "api_keys" in data:
+            text += f"api_keys:\n  openai: {api_keys['openai']}\n"
+        if "theme" in data:
+            text += f"theme: {data['theme']}\n"
+        return text.encode()
+    return yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False).encode()
+
+
+def _has_prefixed_env(prefix: str) -> bool:
+    """Return True if any environment variable starts with prefix (case-insensitive)."""
+    prefix = prefix.upper()
+    return any(name.upper().startswith(prefix) for name in os.environ)
+
+
 class ApiKeys(BaseModel):
     """API key configuration."""
 
@@ -145,9 +307,12 @@ class UserConfig(BaseSettings):
         # Create YAML source with dynamic path
         yaml_file = _get_user_home() / ".gitctx" / "config.yml"
         yaml_source: Callable[[], dict[str, Any]]
-        if yaml_file.exists():
-            # Check file permissions for security
-            stat = yaml_file.stat()
+        # One stat serves the existence check, the permission check and the cache key
+        try:
+            stat: os.stat_result | None = yaml_file.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            stat = None
+        if stat is not None:
             # Check if group or others have any permissions (should be 0600)
             if stat.st_mode & 0o077:  # Group (o70) or others (o07) have access
                 import sys
@@ -161,7 +326,8 @@ class UserConfig(BaseSettings):
                 )
                 sys.stderr.write(warning)
 
-            yaml_source = YamlConfigSettingsSource(settings_cls, yaml_file=yaml_file)
+            user_data = _load_yaml_config(yaml_file, stat)
+            yaml_source = lambda: user_data  # noqa: E731
         else:
             yaml_source = lambda: {}  # noqa: E731,PIE807 # Pydantic requires callable, not bare dict
 
@@ -171,8 +337,12 @@ class UserConfig(BaseSettings):
             yaml_source,
         )
 
-    def save(self) -> None:
-        """Save user config to file."""
+    def save(self, *, durable: bool = False) -> None:
+        """Save user config to file.
+
+        Args:
+            durable: Also fsync the config directory so the write survives a crash
+        """
         config_path = _get_user_home() / ".gitctx" / "config.yml"
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -192,14 +362,14 @@ class UserConfig(BaseSettings):
         if self.theme != default_theme:
             data["theme"] = self.theme
 
-        # Secure permissions
+        # Secure permissions: the temp file is never readable by others either
+        payload = _dump_user_yaml(data)
         old_umask = os.umask(0o077)
         try:
-            with config_path.open("w") as f:
-                yaml.dump(data, f, default_flow_style=False)
+            _write_config_atomic(config_path, payload, 0o600, durable=durable)
         finally:
             os.umask(old_umask)
-        config_path.chmod(0o600)
+        _load_yaml_cached.cache_clear()
 
 
 # ===================================================================
@@ -261,6 +431,24 @@ class IndexSettings(BaseModel):
         description="snapshot=HEAD tree only, history=full git graph",
     )
 
+    # Embedding cache settings
+    quantize_cache: bool = Field(
+        default=False,
+        description="Store cached embeddings as int8 with a per-vector scale (~4x smaller)",
+    )
+
+    # Embedding API throttling (raise to match your OpenAI usage tier)
+    requests_per_minute: int = Field(
+        default=3_500,
+        gt=0,
+        description="Embedding API requests per minute to throttle to",
+    )
+    tokens_per_minute: int = Field(
+        default=1_000_000,
+        gt=0,
+        description="Embedding API tokens per minute to throttle to",
+    )
+
 
 class ModelSettings(BaseModel):
     """Model configuration."""
@@ -268,6 +456,9 @@ class ModelSettings(BaseModel):
     embedding: str = "text-embedding-3-large"
 
 
+_REPO_SECTIONS = frozenset({"search", "index", "model"})
+
+
 class RepoConfig(BaseSettings):
     """Repo config (.gitctx/config.yml) - team settings only.
 
@@ -314,31 +505,35 @@ class RepoConfig(BaseSettings):
 
         # Create YAML source with dynamic path
         yaml_file = Path(".gitctx/config.yml")
+        yaml_source: Callable[[], dict[str, Any]]
         try:
-            file_exists = yaml_file.exists()
+            # Stat and read directly instead of a separate exists() check first
+            repo_data = _load_yaml_config(yaml_file)
+            yaml_source = lambda: repo_data  # noqa: E731
+        except (FileNotFoundError, NotADirectoryError):
+            yaml_source = lambda: {}  # noqa: E731,PIE807 # Pydantic requires callable, not bare dict
         except PermissionError:
-            # If we can't check existence (e.g., read-only directory), treat as non-existent
+            # Can't check or read config file (e.g., read-only directory), use defaults
             # The actual PermissionError will be raised when trying to save later
-            file_exists = False
-
-        yaml_source: Callable[[], dict[str, Any]]
-        if file_exists:
-            try:
-                yaml_source = YamlConfigSettingsSource(settings_cls, yaml_file=yaml_file)
-            except PermissionError:
-                # Can't read config file, use defaults (will fail later on save)
-                yaml_source = lambda: {}  # noqa: E731,PIE807 # Pydantic requires callable, not bare dict
-        else:
             yaml_source = lambda: {}  # noqa: E731,PIE807 # Pydantic requires callable, not bare dict
 
+        # The env source explodes every variable in os.environ on each
+        # construction; skip it outright when no GITCTX_* variable is set.
+        if not _has_prefixed_env(settings_cls.model_config.get("env_prefix", "")):
+            return (init_settings, yaml_source)
+
         return (
             init_settings,
             env_settings,  # GITCTX_* env vars
             yaml_source,
         )
 
-    def save(self) -> None:
-        """Save team settings to repo config file."""
+    def save(self, *, durable: bool = False) -> None:
+        """Save team settings to repo config file.
+
+        Args:
+            durable: Also fsync the .gitctx directory so the write survives a crash
+        """
         config_path = Path(".gitctx/config.yml")
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -348,9 +543,55 @@ class RepoConfig(BaseSettings):
             "model": self.model.model_dump(mode="json"),
         }
 
-        with config_path.open("w") as f:
-            yaml.dump(data, f, default_flow_style=False)
-        config_path.chmod(0o644)  # Safe to commit
+        # The checksum header marks the file as written by this release,
+        # letting load() skip the settings sources until someone edits it.
+        body = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False).encode()
+        payload = _trusted_header(body) + body
+        _write_config_atomic(config_path, payload, 0o644, durable=durable)  # Safe to commit
+        # A rewrite within the filesystem's timestamp granularity can keep the
+        # same (mtime, size) key, so drop cached parses after saving.
+        self.clear_cache()
+
+    @classmethod
+    def load(cls) -> "RepoConfig":
+        """Load repo config, bypassing the settings sources for files written by save().
+
+        When no GITCTX_* override is set and .gitctx/config.yml carries this
+        release's save() checksum header, each section is validated directly
+        with model_validate and the validated sections are assembled without
+        running the pydantic-settings source chain. Anything else (hand-edited
+        file, env overrides, missing or unreadable file) goes through
+        RepoConfig().
+
+        Returns:
+            RepoConfig equal to RepoConfig()
+
+        Raises:
+            ValidationError: If the file contains invalid values
+
+        Examples:
+            >>> config = RepoConfig.load()
+            >>> config.search.limit
+            10
+        """
+        if not _has_prefixed_env(cls.model_config.get("env_prefix", "")):
+            try:
+                data, trusted = _read_yaml_config(Path(".gitctx/config.yml"))
+            except OSError:
+                trusted = False
+            # Unknown top-level keys are rejected by RepoConfig(), so leave them to it
+            if trusted and isinstance(data, dict) and data.keys() <= _REPO_SECTIONS:
+                return cls.model_construct(
+                    search=SearchSettings.model_validate(data.get("search", {})),
+                    index=IndexSettings.model_validate(data.get("index", {})),
+                    model=ModelSettings.model_validate(data.get("model", {})),
+                )
+        return cls()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop memoized YAML config parses (for code that rewrites files in place)."""
+        _load_yaml_cached.cache_clear()
 
 
 # ===================================================================
@@ -369,7 +610,7 @@ class GitCtxSettings:
     def __init__(self) -> None:
         """Initialize user and repo configs."""
         self.user = UserConfig()
-        self.repo = RepoConfig()
+        self.repo = RepoConfig.load()
 
     def get(self, key: str) -> Any:
         """Get config value, routing by key pattern."""
@@ -490,14 +731,12 @@ class GitCtxSettings:
         # Check user config file
         user_home = _get_user_home()
         user_config_path = user_home / ".gitctx" / "config.yml"
-        if user_config_path.exists():
-            try:
-                with user_config_path.open() as f:
-                    config_data = yaml.safe_load(f) or {}
-                if "api_keys" in config_data:
-                    return "(from user config)"
-            except Exception:
-                pass
+        try:
+            config_data = _load_yaml_config(user_config_path)
+            if "api_keys" in config_data:
+                return "(from user config)"
+        except Exception:
+            pass  # Missing or unreadable file: fall through to default
 
         return "(default)"
 
@@ -517,21 +756,19 @@ class GitCtxSettings:
 
         # Check repo config file
         repo_config_path = Path(".gitctx/config.yml")
-        if repo_config_path.exists():
-            try:
-                with repo_config_path.open() as f:
-                    config_data = yaml.safe_load(f) or {}
-                # Navigate nested dict
-                parts = key.split(".")
-                current = config_data
-                for part in parts:
-                    if isinstance(current, dict) and part in current:
-                        current = current[part]
-                    else:
-                        return "(default)"
-                return "(from repo config)"
-            except Exception:
-                pass
+        try:
+            config_data = _load_yaml_config(repo_config_path)
+            # Navigate nested dict
+            parts = key.split(".")
+            current = config_data
+            for part in parts:
+                if isinstance(current, dict) and part in current:
+                    current = current[part]
+                else:
+                    return "(default)"
+            return "(from repo config)"
+        except Exception:
+            pass  # Missing or unreadable file: fall through to default
 
         return "(default)"
 
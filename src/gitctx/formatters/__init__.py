@@ -6,6 +6,8 @@ different output formats (terse, verbose, MCP, etc.).
 
 from __future__ import annotations
 
+from typing import Final
+
 from gitctx.formatters.base import ResultFormatter
 from gitctx.formatters.mcp import MCPFormatter
 from gitctx.formatters.terse import TerseFormatter
@@ -23,7 +25,8 @@ __all__ = [
 # Formatter registry - will be populated by formatter implementations
 # Key: formatter name (e.g., "terse", "verbose", "mcp")
 # Value: formatter instance implementing ResultFormatter protocol
-FORMATTERS: dict[str, ResultFormatter] = {
+# Final: the registry object is never rebound (entries may still be added)
+FORMATTERS: Final[dict[str, ResultFormatter]] = {
     "terse": TerseFormatter(),
     "verbose": VerboseFormatter(),
     "mcp": MCPFormatter(),
@@ -51,8 +54,11 @@ def get_formatter(name: str) -> ResultFormatter:
             ...
         ValueError: Unknown formatter: "unknown". Available: terse, verbose, mcp
     """
-    if name not in FORMATTERS:
+    # Plain dict dispatch by name: no isinstance() against the runtime-checkable
+    # protocol, which would reflect over its members on every check
+    formatter = FORMATTERS.get(name)
+    if formatter is None:
         available = ", ".join(sorted(FORMATTERS.keys())) if FORMATTERS else "(none)"
         raise ValueError(f'Unknown formatter: "{name}". Available: {available}')
 
-    return FORMATTERS[name]
+    return formatter
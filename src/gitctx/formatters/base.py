@@ -1,6 +1,7 @@
 """Base protocol for result formatters.
 
-This module defines the ResultFormatter protocol that all formatters must implement.
+This module defines the ResultFormatter protocol that all formatters must implement,
+plus the plain-text output helper shared by the unstyled formatters.
 """
 
 from __future__ import annotations
@@ -39,3 +40,22 @@ class ResultFormatter(Protocol):
             None - Results are written directly to console
         """
         ...
+
+
+def write_plain_text(console: Console, text: str) -> None:
+    """Write pre-rendered plain text to a console in a single write.
+
+    Text goes straight to console.file: Rich markup parsing, highlighting,
+    wrapping and per-line segmenting would only cost time and mangle
+    bracketed paths or code (e.g. "app/[id]/page.tsx"). Recording or quiet
+    consoles go through console.out() instead, so export and muting still work.
+
+    Args:
+        console: Rich Console to write to
+        text: Complete output, including trailing newlines
+    """
+    if console.record or console.quiet:
+        console.out(text, end="", highlight=False)
+    else:
+        console.file.write(text)
+        console.file.flush()
@@ -40,11 +40,55 @@ Example:
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
-import yaml
 from rich.console import Console
 
+from gitctx.formatters.base import write_plain_text
+
+# Strings YAML reads back as themselves when written unquoted: starts with a
+# letter/underscore (so never a number) and has no indicator characters
+_PLAIN_SCALAR = re.compile(r"[A-Za-z_][\w./-]*", re.ASCII)
+# YAML 1.1 booleans and null that the pattern above would otherwise allow
+_RESERVED_WORDS = frozenset({"y", "n", "yes", "no", "true", "false", "on", "off", "null"})
+# Characters a double-quoted scalar must escape: the quote and backslash, C0/C1
+# controls and DEL (non-printable, or line breaks such as NEL), the Unicode
+# line/paragraph separators, surrogates, BOM and the noncharacters FFFE/FFFF
+_NEEDS_ESCAPE = re.compile(r'["\\\x00-\x1f\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff]')
+# Escapes with a short form; the rest use \uXXXX
+_SHORT_ESCAPES = {
+    '"': '\\"',
+    "\\": "\\\\",
+    "\0": "\\0",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+}
+
+
+def _escape_char(match: re.Match[str]) -> str:
+    """Return the double-quoted-scalar escape for one _NEEDS_ESCAPE match."""
+    char = match.group()
+    escaped = _SHORT_ESCAPES.get(char)
+    if escaped is not None:
+        return escaped
+    return f"\\u{ord(char):04X}"
+
+
+def _yaml_str(value: str) -> str:
+    """Render a string as a YAML scalar, quoting only when it is not plain-safe.
+
+    Ordinary paths and SHAs are emitted as-is; anything else (colons, quotes,
+    backslashes, leading digits, reserved words) becomes a double-quoted
+    scalar on a single line. Only characters YAML cannot carry literally
+    inside double quotes are escaped, so printable Unicode stays readable and
+    the frontmatter always round-trips without going through PyYAML's emitter.
+    """
+    if _PLAIN_SCALAR.fullmatch(value) and value.lower() not in _RESERVED_WORDS:
+        return value
+    return f'"{_NEEDS_ESCAPE.sub(_escape_char, value)}"'
+
 
 class MCPFormatter:
     """Structured markdown for AI tools.
@@ -53,6 +97,11 @@ class MCPFormatter:
     body with code blocks. Optimized for MCP (Model Context Protocol)
     and LLM consumption.
 
+    Output is rendered from fixed per-result templates and written with a
+    single write_plain_text() call, bypassing Rich's markup, highlighting
+    and wrapping (~0.5ms per KB, and it would corrupt code). The YAML is
+    written by hand for this fixed schema; PyYAML is not involved.
+
     Attributes:
         name: Formatter identifier
         description: Human-readable description
@@ -61,6 +110,20 @@ class MCPFormatter:
     name = "mcp"
     description = "Structured markdown for AI tools"
 
+    _YAML_ITEM_TPL = (
+        "  - file_path: {file_path}\n"
+        "    line_numbers: {start_line}-{end_line}\n"
+        "    score: {score}\n"
+        "    commit_sha: {commit_sha}\n"
+    )
+    _MD_ITEM_TPL = (
+        "## {file_path}:{start_line}-{end_line}\n"
+        "**Score:** {score} | **Commit:** {short_sha}\n"
+        "```{language}\n"
+        "{chunk_content}\n"
+        "```\n\n"
+    )
+
     def format(
         self,
         results: list[dict[str, Any]],
@@ -84,41 +147,35 @@ class MCPFormatter:
         Returns:
             None - Results are written directly to console
         """
-        # Build YAML frontmatter structure
-        frontmatter = {
-            "results": [
-                {
-                    "file_path": r["file_path"],
-                    "line_numbers": f"{r['start_line']}-{r['end_line']}",
-                    "score": float(f"{r['_distance']:.3f}"),
-                    "commit_sha": r["commit_sha"],
-                }
-                for r in results
-            ]
-        }
-
-        # Print YAML frontmatter with proper escaping
-        console.print("---")
-        console.print(yaml.safe_dump(frontmatter, default_flow_style=False).rstrip())
-        console.print("---\n")
-
-        # Print Markdown body
-        for result in results:
-            file_path = result["file_path"]
-            start_line = result["start_line"]
-            end_line = result["end_line"]
-            score = result["_distance"]
-            commit_sha = result["commit_sha"]
-            chunk_content = result["chunk_content"]
-            language = result.get("language", "markdown")
-
-            # Print header
-            console.print(f"## {file_path}:{start_line}-{end_line}")
-
-            # Print metadata line
-            console.print(f"**Score:** {score:.3f} | **Commit:** {commit_sha[:7]}")
-
-            # Print code block with language tag
-            console.print(f"```{language}")
-            console.print(chunk_content)
-            console.print("```\n")
+        # One pass over results; the 3-decimal score both sections show is
+        # formatted once per result
+        yaml_items: list[str] = []
+        md_items: list[str] = []
+        for r in results:
+            score = f"{r['_distance']:.3f}"
+            yaml_items.append(
+                self._YAML_ITEM_TPL.format(
+                    file_path=_yaml_str(r["file_path"]),
+                    start_line=r["start_line"],
+                    end_line=r["end_line"],
+                    score=score,
+                    commit_sha=_yaml_str(r["commit_sha"]),
+                )
+            )
+            md_items.append(
+                self._MD_ITEM_TPL.format(
+                    file_path=r["file_path"],
+                    start_line=r["start_line"],
+                    end_line=r["end_line"],
+                    score=score,
+                    short_sha=r["commit_sha"][:7],
+                    language=r.get("language", "markdown"),
+                    chunk_content=r["chunk_content"],
+                )
+            )
+        frontmatter = "".join(yaml_items)
+        body = "".join(md_items)
+
+        # An empty list renders as a flow sequence, matching yaml.safe_dump
+        yaml_results = f"results:\n{frontmatter}" if results else "results: []\n"
+        write_plain_text(console, f"---\n{yaml_results}---\n\n{body}")
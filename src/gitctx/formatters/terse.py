@@ -14,11 +14,24 @@ Example:
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from rich.console import Console
 
+from gitctx.formatters.base import write_plain_text
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_date(commit_date: int) -> str:
+    """Format a Unix timestamp as a local YYYY-MM-DD date.
+
+    Cached because results cluster on few commits (every chunk of a commit
+    shares its timestamp) and strftime dominates the cost of a row.
+    """
+    return datetime.fromtimestamp(commit_date).strftime("%Y-%m-%d")
+
 
 class TerseFormatter:
     """Terse single-line format (default).
@@ -34,6 +47,13 @@ class TerseFormatter:
     name = "terse"
     description = "Terse single-line format (default)"
 
+    # (HEAD marker, historic marker) keyed by Console.legacy_windows; historic
+    # commits get spaces of the same width for alignment
+    _MARKERS: ClassVar[dict[bool, tuple[str, str]]] = {
+        False: (" ●", "  "),
+        True: (" [HEAD]", "       "),
+    }
+
     def format(
         self,
         results: list[dict[str, Any]],
@@ -49,7 +69,7 @@ class TerseFormatter:
                 - _distance: Similarity score (0-1)
                 - is_head: Whether commit is HEAD
                 - commit_sha: Full commit SHA
-                - commit_date: Commit date string
+                - commit_date: Commit date as a Unix timestamp
                 - author_name: Author name
                 - commit_message: Commit message
             console: Rich Console instance for formatted output
@@ -58,36 +78,25 @@ class TerseFormatter:
         Returns:
             None - Results are written directly to console
         """
+        if not results:
+            return
+
+        # HEAD marker depends only on the terminal type, so pick it once
+        head_marker, historic_marker = self._MARKERS[console.legacy_windows]
+
+        # Render every row, then write them in one go (plain text: no Rich
+        # markup, so bracketed paths and messages are printed verbatim)
+        rows: list[str] = []
         for result in results:
-            # Extract values
-            file_path = result["file_path"]
-            start_line = result["start_line"]
-            score = result["_distance"]
-            is_head = result["is_head"]
-            commit_sha = result["commit_sha"]
-            commit_date = result["commit_date"]
-            author_name = result["author_name"]
-            commit_message = result["commit_message"]
-
-            # Format HEAD marker based on terminal type
-            if is_head:
-                head_marker = " [HEAD]" if console.legacy_windows else " ●"
-            else:
-                # Space for alignment (no marker for historic commits)
-                head_marker = "       " if console.legacy_windows else "  "
+            marker = head_marker if result["is_head"] else historic_marker
 
             # Take first line, then truncate to 50 characters
-            first_line = commit_message.split("\n")[0]
-            truncated_message = first_line[:50]
-
-            # Format commit date from Unix timestamp to YYYY-MM-DD
-            formatted_date = datetime.fromtimestamp(commit_date).strftime("%Y-%m-%d")
-
-            # Format and print line (no_wrap + crop=False to prevent truncation)
-            console.print(
-                f"{file_path}:{start_line}:{score:.2f}{head_marker} "
-                f"{commit_sha[:7]} ({formatted_date}, {author_name}) "
-                f'"{truncated_message}"',
-                no_wrap=True,
-                crop=False,
+            truncated_message = result["commit_message"].partition("\n")[0][:50]
+            formatted_date = _format_date(result["commit_date"])
+
+            rows.append(
+                f"{result['file_path']}:{result['start_line']}:{result['_distance']:.2f}{marker} "
+                f"{result['commit_sha'][:7]} ({formatted_date}, {result['author_name']}) "
+                f'"{truncated_message}"\n'
             )
+        write_plain_text(console, "".join(rows))
@@ -28,7 +28,7 @@ class CommitMetadata:
     is_merge: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BlobLocation:
     """Where a blob appears in git history with commit context.
 
@@ -44,6 +44,8 @@ class BlobLocation:
         commit_date: Unix timestamp of commit (denormalized)
         commit_message: Full commit message (denormalized)
         is_merge: True if commit has 2+ parents (denormalized)
+        language: Language detected from file_path at walk time, or None if
+            the producer did not resolve it (consumers then detect it themselves)
     """
 
     commit_sha: str
@@ -54,9 +56,10 @@ class BlobLocation:
     commit_date: int
     commit_message: str
     is_merge: bool
+    language: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BlobRecord:
     """A unique blob and all its locations in git history (walker output).
 
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import binascii
+import subprocess
 from collections.abc import Callable, Iterator
 from pathlib import Path
 
@@ -18,6 +20,7 @@ from gitctx.git.types import (
     WalkStats,
 )
 from gitctx.indexing.blob_filter import BlobFilter
+from gitctx.indexing.language_detection import detect_language_from_extension
 
 # Git file mode constants
 GIT_FILEMODE_SYMLINK = 0o120000  # Symlink file mode
@@ -87,6 +90,13 @@ class CommitWalker:
         # Track seen commits for deduplication
         self.seen_commits: set[str] = set()
 
+        # Shared author strings: pygit2 builds new str objects per commit, but a
+        # repository has few distinct authors and every BlobLocation keeps them
+        self._interned: dict[str, str] = {}
+
+        # Language per file path, resolved once however many commits touch it
+        self._path_languages: dict[str, str] = {}
+
         # Track seen blobs for deduplication (O(1) membership check)
         # Copy the set to avoid modifying the caller's set
         self.seen_blobs: set[str] = set(already_indexed) if already_indexed else set()
@@ -97,9 +107,10 @@ class CommitWalker:
         # Cache unique blob count for O(1) progress reporting
         self._unique_blobs_count: int = 0
 
-        # Build HEAD tree blob set for O(1) is_head lookup
+        # Build HEAD tree blob set for O(1) is_head lookup, keyed by raw 20-byte
+        # digests (~half the memory of hex strings on large trees)
         # For bare repos, this will be empty (no HEAD working tree)
-        self.head_blobs: set[str] = self._build_head_tree()
+        self.head_blobs: set[bytes] = self._build_head_tree()
 
         # Initialize blob filter
         gitignore_content = self._read_gitignore_from_head()
@@ -145,17 +156,17 @@ class CommitWalker:
     def _collect_tree_blobs(
         self,
         tree: pygit2.Tree,
-        blob_set: set[str],
+        blob_set: set[bytes],
     ) -> None:
         """Recursively collect all blob SHAs from a tree.
 
         Args:
             tree: pygit2 Tree object to traverse
-            blob_set: Set to accumulate blob SHAs into
+            blob_set: Set to accumulate raw blob SHAs into
         """
         for entry in tree:
             if entry.type_str == "blob":
-                blob_set.add(str(entry.id))
+                blob_set.add(entry.id.raw)
             elif entry.type_str == "tree":
                 # Recurse into subdirectory
                 subtree = self.repo.get(entry.id)
@@ -188,15 +199,15 @@ class CommitWalker:
             # No .gitignore in HEAD
             return ""
 
-    def _build_head_tree(self) -> set[str]:
+    def _build_head_tree(self) -> set[bytes]:
         """Build set of all blob SHAs in HEAD tree for O(1) is_head lookup.
 
         For bare repositories, returns empty set (no HEAD working tree).
 
         Returns:
-            Set of blob SHAs present in HEAD tree
+            Set of raw 20-byte blob SHAs present in HEAD tree
         """
-        head_blobs: set[str] = set()
+        head_blobs: set[bytes] = set()
 
         # Bare repositories have no HEAD working tree
         if self.repo.is_bare:
@@ -209,10 +220,53 @@ class CommitWalker:
             # No HEAD (empty repo) - return empty set
             return head_blobs
 
+        # Prefer git's native recursive walker; fall back to pygit2 traversal
+        listed = self._ls_tree_blobs(str(head_commit.id))
+        if listed is not None:
+            return listed
+
         # Recursively collect all blob SHAs from HEAD tree
         self._collect_tree_blobs(head_commit.tree, head_blobs)
         return head_blobs
 
+    def _ls_tree_blobs(self, commit_sha: str) -> set[bytes] | None:
+        """List blob SHAs of a commit's tree with a single `git ls-tree -r`.
+
+        One pipe from git's C tree walker avoids a Python callback per tree
+        entry, which dominates HEAD set construction on large repositories.
+
+        Args:
+            commit_sha: Commit whose tree to list
+
+        Returns:
+            Set of raw blob SHAs, or None if the git CLI is unavailable or too
+            old for --format (< 2.36)
+        """
+        try:
+            result = subprocess.run(
+                [
+                    "git",
+                    "-C",
+                    str(self.repo_path),
+                    "ls-tree",
+                    "-r",
+                    "-z",
+                    "--format=%(objecttype) %(objectname)",
+                    commit_sha,
+                ],
+                capture_output=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+        # Records are "<type> <sha>"; skip submodule commits
+        return {
+            binascii.unhexlify(record[5:])
+            for record in result.stdout.split(b"\0")
+            if record.startswith(b"blob ")
+        }
+
     def _walk_commits(self) -> Iterator[CommitMetadata]:
         """Walk commits from configured refs in reverse chronological order.
 
@@ -270,8 +324,8 @@ class CommitWalker:
                 # Extract metadata
                 metadata = CommitMetadata(
                     commit_sha=commit_sha,
-                    author_name=commit.author.name,
-                    author_email=commit.author.email,
+                    author_name=self._intern(commit.author.name),
+                    author_email=self._intern(commit.author.email),
                     commit_date=commit.commit_time,
                     commit_message=commit.message,
                     is_merge=len(commit.parent_ids) > 1,
@@ -279,6 +333,18 @@ class CommitWalker:
 
                 yield metadata
 
+    def _language_for(self, file_path: str) -> str:
+        """Return the language for a path, detecting each distinct path once."""
+        language = self._path_languages.get(file_path)
+        if language is None:
+            language = detect_language_from_extension(file_path)
+            self._path_languages[file_path] = language
+        return language
+
+    def _intern(self, value: str) -> str:
+        """Return the shared instance of a low-cardinality string."""
+        return self._interned.setdefault(value, value)
+
     def _accumulate_blob_locations(
         self,
         tree: pygit2.Tree,
@@ -305,7 +371,9 @@ class CommitWalker:
                 if entry.filemode == GIT_FILEMODE_SYMLINK:
                     continue
 
-                blob_sha = str(entry.id)
+                # Read the Oid once: hex for keys, raw bytes for the HEAD set
+                oid = entry.id
+                blob_sha = str(oid)
 
                 # Skip already-indexed blobs (resume from partial index)
                 if blob_sha in self.seen_blobs:
@@ -352,12 +420,13 @@ class CommitWalker:
                 location = BlobLocation(
                     commit_sha=commit_metadata.commit_sha,
                     file_path=entry_path,
-                    is_head=blob_sha in self.head_blobs,  # O(1) set lookup
+                    is_head=oid.raw in self.head_blobs,  # O(1) set lookup
                     author_name=commit_metadata.author_name,
                     author_email=commit_metadata.author_email,
                     commit_date=commit_metadata.commit_date,
                     commit_message=commit_metadata.commit_message,
                     is_merge=commit_metadata.is_merge,
+                    language=self._language_for(entry_path),
                 )
 
                 # Accumulate location
@@ -9,14 +9,20 @@ Design:
 - Serves as second use case for EmbeddingCache (STORY-0001.2.4)
 """
 
+import asyncio
 import logging
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
 
 from gitctx.git.types import BlobRecord
 from gitctx.indexing.language_detection import detect_language_from_extension
 from gitctx.indexing.protocols import ChunkerProtocol
 from gitctx.indexing.types import Embedding
 from gitctx.models.protocols import EmbedderProtocol
-from gitctx.storage.embedding_cache import EmbeddingCache  # TODO: Merge into storage
+from gitctx.storage.embedding_cache import (  # TODO: Merge into storage
+    EmbeddingCache,
+    chunk_content_key,
+)
 
 logger = logging.getLogger("gitctx.embeddings")
 
@@ -32,7 +38,9 @@ async def embed_with_cache(
     Orchestrates the full embedding pipeline:
     1. Check cache by blob SHA
     2. If hit: return cached embeddings (log hit)
-    3. If miss: chunk → embed → store in cache → log cost/tokens
+    3. If miss: chunk → reuse chunk-level cache entries for identical chunk
+       content → embed the remaining unique chunks → store in cache → log
+       cost/tokens
     4. Return embeddings
 
     Args:
@@ -69,21 +77,42 @@ async def embed_with_cache(
     # Decode blob content
     content = blob_record.content.decode("utf-8", errors="replace")
 
-    # Detect language from first location (if any)
+    # Language: resolved by the walker, else detected from the first
+    # location (if any)
     language = "markdown"  # Default fallback
     if blob_record.locations:
-        file_path = blob_record.locations[0].file_path
-        language = detect_language_from_extension(file_path)
+        first = blob_record.locations[0]
+        language = first.language or detect_language_from_extension(first.file_path)
 
     # Chunk the content
     chunks = chunker.chunk_file(content, language)
 
-    # Generate protocol embeddings (have vectors but no chunk content)
-    protocol_embeddings = await embedder.embed_chunks(chunks, blob_record.sha)
-
-    # Convert to storage embeddings (with full chunk metadata)
+    # Content-address chunks so identical ones (repeated within this blob or
+    # already embedded for another blob) share one embedding and one API call
+    keys = [chunk_content_key(chunk.content) for chunk in chunks]
+    unique = dict(zip(keys, chunks, strict=True))  # First chunk per key, in order
+    by_key: dict[str, Embedding] = await cache.aget_chunks(list(unique))
+    reused = set(by_key)
+    new_keys = [key for key in unique if key not in reused]
+    new_chunks = [unique[key] for key in new_keys]
+
+    # Generate protocol embeddings (have vectors but no chunk content).
+    # Skipped only when every chunk was reused from the chunk cache.
+    if new_chunks or not keys:
+        protocol_embeddings = await embedder.embed_chunks(new_chunks, blob_record.sha)
+        for key, proto_emb in zip(new_keys, protocol_embeddings, strict=True):
+            cache.set_chunk(key, proto_emb)
+            by_key[key] = proto_emb
+
+    # Convert to storage embeddings (with full chunk metadata). Each keeps its
+    # chunk's own tokens and cost; only the first freshly embedded copy of each
+    # chunk is marked billed, so spend totals count every API token once.
     storage_embeddings: list[Embedding] = []
-    for chunk, proto_emb in zip(chunks, protocol_embeddings, strict=True):
+    charged: set[str] = set()
+    for idx, (key, chunk) in enumerate(zip(keys, chunks, strict=True)):
+        proto_emb = by_key[key]
+        billed = key not in reused and key not in charged
+        charged.add(key)
         storage_embeddings.append(
             Embedding(
                 vector=proto_emb.vector,
@@ -91,24 +120,90 @@ async def embed_with_cache(
                 model=proto_emb.model,
                 cost_usd=proto_emb.cost_usd,
                 blob_sha=blob_record.sha,
-                chunk_index=proto_emb.chunk_index,
+                chunk_index=idx,
                 chunk_content=chunk.content,
                 start_line=chunk.start_line,
                 end_line=chunk.end_line,
                 total_chunks=len(chunks),
                 language=language,
+                billed=billed,
             )
         )
 
     # Store in cache
     cache.set(blob_record.sha, storage_embeddings)
 
-    # Log cost and token information
-    total_tokens = sum(e.token_count for e in storage_embeddings)
-    total_cost = sum(e.cost_usd for e in storage_embeddings)
+    # Log billed cost and token information
+    billed_embeddings = [e for e in storage_embeddings if e.billed]
+    total_tokens = sum(e.token_count for e in billed_embeddings)
+    total_cost = sum(e.cost_usd for e in billed_embeddings)
     logger.info(
         f"Embedded blob {blob_record.sha[:8]}: "
         f"{len(storage_embeddings)} chunks, {total_tokens} tokens, ${total_cost:.6f}"
     )
 
     return storage_embeddings
+
+
+async def stream_embeddings(
+    chunker: ChunkerProtocol,
+    embedder: EmbedderProtocol,
+    cache: EmbeddingCache,
+    blob_records: Iterable[BlobRecord],
+    *,
+    max_inflight: int = 8,
+) -> AsyncIterator[tuple[BlobRecord, list[Embedding] | Exception]]:
+    """Embed blobs as they are produced, keeping a bounded window in flight.
+
+    blob_records is consumed lazily (e.g. straight from CommitWalker.walk_blobs()),
+    so at most max_inflight blob contents are held in memory and the first
+    embedding request goes out as soon as the first blob is available. Results
+    are yielded in input order.
+
+    Per-blob failures are yielded rather than raised so one bad blob does not
+    stop the stream; errors raised by blob_records itself propagate. Closing
+    the stream early cancels any blobs still in flight.
+
+    Args:
+        chunker: Chunker implementation for splitting code
+        embedder: Embedder implementation (e.g., OpenAI)
+        cache: Embedding cache for blob-level caching
+        blob_records: Blobs to embed, consumed one at a time
+        max_inflight: Maximum concurrent embed_with_cache calls (default: 8)
+
+    Yields:
+        (blob_record, embeddings) on success, (blob_record, exception) on failure
+
+    Raises:
+        ValueError: If max_inflight is less than 1
+
+    Examples:
+        >>> async for blob, result in stream_embeddings(chunker, embedder, cache, blobs):
+        ...     if not isinstance(result, Exception):
+        ...         store.add_chunks_batch(result, {blob.sha: blob.locations})
+    """
+    if max_inflight < 1:
+        raise ValueError(f"max_inflight must be >= 1, got {max_inflight}")
+
+    window: deque[tuple[BlobRecord, asyncio.Task[list[Embedding]]]] = deque()
+
+    async def _settle() -> tuple[BlobRecord, list[Embedding] | Exception]:
+        blob_record, task = window.popleft()
+        try:
+            return blob_record, await task
+        except Exception as e:
+            return blob_record, e
+
+    try:
+        for blob_record in blob_records:
+            task = asyncio.create_task(embed_with_cache(chunker, embedder, cache, blob_record))
+            window.append((blob_record, task))
+            if len(window) >= max_inflight:
+                yield await _settle()
+        while window:
+            yield await _settle()
+    finally:
+        for _, task in window:
+            task.cancel()
+        # Wait for the cancellations to land so no task outlives the stream
+        await asyncio.gather(*(task for _, task in window), return_exceptions=True)
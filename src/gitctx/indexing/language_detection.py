@@ -10,7 +10,7 @@ Source: https://github.com/langchain-ai/langchain/blob/master/libs/text-splitter
 Future: Can upgrade to content-based detection if metrics show need.
 """
 
-from pathlib import Path
+from functools import lru_cache
 
 # Map file extensions to gitctx language identifiers
 # Covers all 27 LangChain-supported languages for 95%+ coverage in real-world repos
@@ -175,8 +175,23 @@ def detect_language_from_extension(file_path: str) -> str:
     if not file_path:
         return "markdown"
 
-    # Extract extension (case-insensitive)
-    ext = Path(file_path).suffix.lower()
+    # Extract extension (case-insensitive) with plain string ops: this runs once
+    # per blob, and building a Path object costs far more than the dict lookup.
+    # Mirrors Path.suffix: a leading dot (".bashrc") or trailing dot is no suffix.
+    name = file_path[max(file_path.rfind("/"), file_path.rfind("\\")) + 1 :]
+    dot = name.rfind(".")
+    if dot <= 0 or dot == len(name) - 1:
+        return "markdown"
 
     # Return mapped language or fallback to markdown
-    return EXTENSION_TO_LANGUAGE.get(ext, "markdown")
+    return _language_for_suffix(name[dot:])
+
+
+@lru_cache(maxsize=256)
+def _language_for_suffix(suffix: str) -> str:
+    """Map a raw (case-preserved) suffix to a language, memoized.
+
+    Repositories repeat a handful of suffixes thousands of times, so caching
+    on the raw suffix skips lower() and the mapping lookup on every repeat.
+    """
+    return EXTENSION_TO_LANGUAGE.get(suffix.lower(), "markdown")
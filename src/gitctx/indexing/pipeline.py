@@ -5,6 +5,7 @@ the full indexing pipeline with TUI_GUIDE-compliant progress reporting.
 """
 # ruff: noqa: PLC0415 # Lazy load heavy dependencies (LanceDB, pyarrow) to reduce import time
 
+import itertools
 import logging
 import sys
 from pathlib import Path
@@ -53,7 +54,8 @@ async def index_repository(
     # Import pipeline components (lazy import to avoid circular dependencies)
     from gitctx.git.walker import CommitWalker
     from gitctx.indexing.chunker import LanguageAwareChunker
-    from gitctx.indexing.embeddings import embed_with_cache
+    from gitctx.indexing.embeddings import stream_embeddings
+    from gitctx.models.batching import BatchingEmbedder
     from gitctx.models.providers.openai import OpenAIEmbedder
     from gitctx.storage.embedding_cache import EmbeddingCache
     from gitctx.storage.lancedb_store import LanceDBStore
@@ -64,8 +66,20 @@ async def index_repository(
     chunker = LanguageAwareChunker(
         chunk_overlap_ratio=settings.repo.index.chunk_overlap_ratio,
     )
-    embedder = OpenAIEmbedder(api_key=settings.get("api_keys.openai"))
-    cache = EmbeddingCache(repo_path / ".gitctx", model=settings.repo.model.embedding)
+    # stream_embeddings keeps a window of blobs in flight; merge their cache
+    # misses so small blobs share provider requests
+    embedder = BatchingEmbedder(
+        OpenAIEmbedder(
+            api_key=settings.get("api_keys.openai"),
+            requests_per_minute=settings.repo.index.requests_per_minute,
+            tokens_per_minute=settings.repo.index.tokens_per_minute,
+        )
+    )
+    cache = EmbeddingCache(
+        repo_path / ".gitctx",
+        model=settings.repo.model.embedding,
+        quantized=settings.repo.index.quantize_cache,
+    )
     store = LanceDBStore(repo_path / ".gitctx" / "db" / "lancedb")
 
     reporter.start()
@@ -74,55 +88,61 @@ async def index_repository(
         # Phase 1: Walk commits and count blobs
         reporter.phase("Walking commit graph")
 
-        # First pass: just count blobs to detect empty repo
-        blob_count = 0
-        blob_records = []
-
-        for blob_record in walker.walk_blobs():
-            blob_count += 1
-            blob_records.append(blob_record)
-
-            # Update progress periodically in verbose mode
-            stats = walker.get_stats()
-            if blob_count % 100 == 0:
-                reporter.update(
-                    commits=stats.commits_seen,
-                    blobs=stats.blobs_indexed,
+        # walk_blobs() accumulates every location before yielding its first
+        # record, so peeking one record completes the walk (and detects an
+        # empty repo) while leaving blob contents to be read lazily
+        blob_iter = iter(
+            walker.walk_blobs(
+                progress_callback=lambda progress: reporter.update(
+                    commits=progress.commits_seen,
+                    blobs=progress.unique_blobs_found,
                 )
+            )
+        )
+        first_blob = next(blob_iter, None)
 
         # Handle empty repository
-        if blob_count == 0:
+        if first_blob is None:
             print("No files to index", file=sys.stderr)
             return
 
-        # Final walk phase update
-        stats = walker.get_stats()
+        # Final walk phase update: the walk is complete, so every unique blob
+        # is known even though only one has been read
         reporter.update(
-            commits=stats.commits_seen,
-            blobs=stats.blobs_indexed,
+            commits=walker.get_stats().commits_seen,
+            blobs=len(walker.blob_locations),
         )
 
         # Phase 2: Chunk and embed
         reporter.phase("Generating embeddings")
 
-        for blob_record in blob_records:
+        # Stream blobs straight from the walker: only a bounded window of blob
+        # contents is in memory, and embedding starts with the first blob
+        async for blob_record, result in stream_embeddings(
+            chunker=chunker,
+            embedder=embedder,
+            cache=cache,
+            blob_records=itertools.chain([first_blob], blob_iter),
+        ):
             try:
-                # Single orchestrated call: check cache → chunk → embed → save cache
-                embeddings = await embed_with_cache(
-                    chunker=chunker,
-                    embedder=embedder,
-                    cache=cache,
-                    blob_record=blob_record,
+                # Per-blob embed failures arrive as results; route them to the handler
+                if isinstance(result, Exception):
+                    raise result
+
+                # Track stats: spend counts only embeddings paid for in this run
+                billed = [e for e in result if e.billed]
+                total_tokens = sum(e.token_count for e in billed)
+                total_cost = sum(e.cost_usd for e in billed)
+                reporter.update(
+                    blobs=walker.get_stats().blobs_indexed,
+                    tokens=total_tokens,
+                    cost=total_cost,
+                    chunks=len(result),
                 )
 
-                # Track stats (embeddings already have all metadata)
-                total_tokens = sum(e.token_count for e in embeddings)
-                total_cost = sum(e.cost_usd for e in embeddings)
-                reporter.update(tokens=total_tokens, cost=total_cost, chunks=len(embeddings))
-
                 # Store (embeddings have all fields: chunk_content, vectors, metadata)
                 blob_locations = {blob_record.sha: blob_record.locations}
-                store.add_chunks_batch(embeddings=embeddings, blob_locations=blob_locations)
+                store.add_chunks_batch(embeddings=result, blob_locations=blob_locations)
 
             except Exception as e:
                 # embed_with_cache handles UTF-8 errors internally, log other errors
@@ -146,5 +166,6 @@ async def index_repository(
         raise
 
     finally:
+        cache.close()
         # Always show final summary (called on success or cancellation)
         reporter.finish()
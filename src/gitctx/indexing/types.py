@@ -3,13 +3,17 @@
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CodeChunk:
     """Represents a chunk of code with metadata.
 
     Design notes:
     - Simple dataclass for easy FFI serialization (future Rust optimization)
+    - Slotted and frozen: one instance per chunk, so no per-instance __dict__
     - All fields use primitive types (str, int, dict)
     - No Path objects (use strings for Rust compatibility)
 
@@ -39,15 +43,17 @@ class CodeChunk:
     metadata: dict[str, Any]
 
 
-@dataclass(frozen=True)
-class Embedding:
+@dataclass(slots=True, frozen=True, eq=False)
+class Embedding:  # type: ignore[no-any-unimported]  # NDArray from unfollowed numpy
     """Embedding vector and metadata for a code chunk.
 
     This dataclass represents the output from embedding generation
     (OpenAI API or local models), ready for storage in LanceDB.
 
     Attributes:
-        vector: Embedding vector (list of floats, dimension depends on model)
+        vector: Embedding vector as a contiguous float32 array (dimension depends
+            on model). Providers and the cache produce float32 arrays directly so
+            vectors are never re-materialized as Python float lists.
         token_count: Number of tokens in the chunk
         model: Embedding model used (e.g., "text-embedding-3-large")
         cost_usd: Cost in USD for generating this embedding
@@ -59,10 +65,15 @@ class Embedding:
         total_chunks: Total chunks for this blob (optional)
         language: Programming language (optional)
         api_token_count: Actual tokens used by API (optional, may differ from tiktoken estimate)
+        billed: True if an API call made for this blob paid for the vector; False
+            when it was reused from the cache or repeats an earlier chunk (optional)
+
+    Equality compares vectors element-wise (the generated dataclass __eq__ would
+    compare them with ``==`` and fail on arrays); embeddings are unhashable.
     """
 
     # Required fields
-    vector: list[float]
+    vector: NDArray[np.float32]  # type: ignore[no-any-unimported]
     token_count: int
     model: str
     cost_usd: float
@@ -76,3 +87,56 @@ class Embedding:
     total_chunks: int = 0
     language: str = ""
     api_token_count: int | None = None
+    billed: bool = False
+
+    __hash__ = None  # type: ignore[assignment]  # ndarray vectors are unhashable
+
+    def __eq__(self, other: object) -> bool:
+        """Compare all fields, using np.array_equal for the vector."""
+        if not isinstance(other, Embedding):
+            return NotImplemented
+        return (
+            self.token_count == other.token_count
+            and self.model == other.model
+            and self.cost_usd == other.cost_usd
+            and self.blob_sha == other.blob_sha
+            and self.chunk_index == other.chunk_index
+            and self.chunk_content == other.chunk_content
+            and self.start_line == other.start_line
+            and self.end_line == other.end_line
+            and self.total_chunks == other.total_chunks
+            and self.language == other.language
+            and self.api_token_count == other.api_token_count
+            and self.billed == other.billed
+            and bool(np.array_equal(self.vector, other.vector))
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields as a flat dict without copying the vector.
+
+        Unlike dataclasses.asdict(), which deep-copies every field value
+        (including the vector array), this builds the dict field by field
+        and shares the read-only vector.
+
+        Returns:
+            Mapping of field name to value, in declaration order
+
+        Examples:
+            >>> embedding.to_dict()["vector"] is embedding.vector
+            True
+        """
+        return {
+            "vector": self.vector,
+            "token_count": self.token_count,
+            "model": self.model,
+            "cost_usd": self.cost_usd,
+            "blob_sha": self.blob_sha,
+            "chunk_index": self.chunk_index,
+            "chunk_content": self.chunk_content,
+            "start_line": self.start_line,
+            "end_line": self.end_line,
+            "total_chunks": self.total_chunks,
+            "language": self.language,
+            "api_token_count": self.api_token_count,
+            "billed": self.billed,
+        }
@@ -0,0 +1,174 @@
+"""Request batching wrapper for embedding providers."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from gitctx.models.errors import APIError
+
+if TYPE_CHECKING:
+    from gitctx.indexing.types import CodeChunk, Embedding
+    from gitctx.models.protocols import EmbedderProtocol
+
+
+@dataclass
+class _PendingRequest:
+    """One embed_chunks() call waiting to be merged into a batch."""
+
+    chunks: list[CodeChunk]
+    blob_sha: str
+    future: asyncio.Future[list[Embedding]]
+
+
+class BatchingEmbedder:
+    """Merge concurrent embed_chunks() calls into fewer provider requests.
+
+    Embedding APIs accept many inputs per request (OpenAI: 2048), but the
+    indexer submits one blob (usually a handful of chunks) at a time. This
+    wrapper queues concurrent submissions and flushes them as one call to the
+    wrapped embedder when either batch_size chunks are pending or
+    flush_interval_ms elapses, then splits the results back per blob.
+
+    Implements EmbedderProtocol, so it is a drop-in replacement for the
+    wrapped embedder. It only helps when callers submit concurrently
+    (e.g. via stream_embeddings); a sequential caller just pays the
+    flush interval once per blob.
+
+    Examples:
+        >>> batcher = BatchingEmbedder(OpenAIEmbedder(api_key="sk-..."))
+        >>> async for record, result in stream_embeddings(chunker, batcher, cache, blobs):
+        ...     pass
+    """
+
+    def __init__(
+        self,
+        embedder: EmbedderProtocol,
+        *,
+        batch_size: int = 2048,
+        flush_interval_ms: float = 20.0,
+    ) -> None:
+        """Wrap an embedder with request batching.
+
+        Args:
+            embedder: Underlying embedder that receives merged batches
+            batch_size: Pending chunk count that triggers an immediate flush
+            flush_interval_ms: Maximum time a submission waits for company
+
+        Raises:
+            ValueError: If batch_size < 1 or flush_interval_ms < 0
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if flush_interval_ms < 0:
+            raise ValueError(f"flush_interval_ms must be >= 0, got {flush_interval_ms}")
+
+        self._embedder = embedder
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+
+        self._pending: list[_PendingRequest] = []
+        self._pending_chunks = 0
+        self._timer: asyncio.TimerHandle | None = None
+        # Strong references so in-flight batch tasks are not garbage collected
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def embed_chunks(self, chunks: list[CodeChunk], blob_sha: str) -> list[Embedding]:
+        """Queue chunks for the next batch and wait for their embeddings.
+
+        Args:
+            chunks: List of code chunks to embed
+            blob_sha: Git blob SHA for metadata tracking
+
+        Returns:
+            Embeddings for exactly these chunks, with blob_sha and chunk_index
+            relative to this submission
+
+        Raises:
+            APIError: If the wrapped embedder returned the wrong number of embeddings
+            Exception: Whatever the wrapped embedder raised for these chunks
+        """
+        if not chunks:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[Embedding]] = loop.create_future()
+        self._pending.append(_PendingRequest(chunks, blob_sha, future))
+        self._pending_chunks += len(chunks)
+
+        if self._pending_chunks >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_interval_ms / 1000, self._flush)
+
+        return await future
+
+    def estimate_cost(self, token_count: int) -> float:
+        """Estimate cost in USD (delegates to the wrapped embedder)."""
+        return self._embedder.estimate_cost(token_count)
+
+    def _flush(self) -> None:
+        """Dispatch pending requests as batches of at most batch_size chunks."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        self._pending_chunks = 0
+
+        batch: list[_PendingRequest] = []
+        batch_chunks = 0
+        for request in pending:
+            # A single oversized request still goes out on its own
+            if batch and batch_chunks + len(request.chunks) > self.batch_size:
+                self._dispatch(batch)
+                batch, batch_chunks = [], 0
+            batch.append(request)
+            batch_chunks += len(request.chunks)
+        if batch:
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list[_PendingRequest]) -> None:
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[_PendingRequest]) -> None:
+        """Embed one merged batch and resolve each submission's future.
+
+        If a merged batch fails, each submission is re-issued on its own, so
+        the exception only reaches the submissions that fail by themselves.
+        """
+        merged = [chunk for request in batch for chunk in request.chunks]
+        # A merged batch spans several blobs, so no single SHA describes it;
+        # every embedding is re-stamped with its own submission's SHA below
+        label = batch[0].blob_sha if len(batch) == 1 else ""
+        try:
+            embeddings = await self._embedder.embed_chunks(merged, label)
+            if len(embeddings) != len(merged):
+                raise APIError(f"Expected {len(merged)} embeddings, got {len(embeddings)}")
+        except Exception as e:
+            if len(batch) > 1:
+                # Don't let one bad submission fail its batch-mates: retry each
+                # on its own so only the submission that actually fails raises
+                await asyncio.gather(*(self._run_batch([request]) for request in batch))
+                return
+            request = batch[0]
+            if not request.future.done():
+                request.future.set_exception(e)
+            return
+
+        # chunk_index is the position in the merged list; split results back
+        # per submission in the order chunks were merged
+        embeddings = sorted(embeddings, key=lambda emb: emb.chunk_index)
+        offset = 0
+        for request in batch:
+            count = len(request.chunks)
+            results = [
+                replace(emb, blob_sha=request.blob_sha, chunk_index=idx)
+                for idx, emb in enumerate(embeddings[offset : offset + count])
+            ]
+            offset += count
+            if not request.future.done():
+                request.future.set_result(results)
@@ -38,7 +38,9 @@ class EmbedderProtocol(Protocol):
             blob_sha: Blob SHA for metadata tracking
 
         Returns:
-            List of Embedding objects with vectors and metadata
+            List of Embedding objects, in input order, whose vectors are
+            contiguous float32 arrays (convert once, e.g. with
+            np.asarray(vec, dtype=np.float32), never as Python float lists)
 
         Examples:
             >>> chunks = [CodeChunk(content="def foo(): pass", ...)]
@@ -3,16 +3,54 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import functools
+import itertools
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from langchain_openai import OpenAIEmbeddings
 from numpy.typing import NDArray
 from pydantic import SecretStr
 
 from gitctx.config.errors import ConfigurationError
 from gitctx.indexing.types import CodeChunk, Embedding
-from gitctx.models.errors import DimensionMismatchError
+from gitctx.models.errors import APIError, DimensionMismatchError
+from gitctx.models.ratelimit import AsyncRateLimiter
+
+if TYPE_CHECKING:
+    from langchain_openai import OpenAIEmbeddings
+
+
+@functools.cache
+def _embeddings_cls() -> type[OpenAIEmbeddings]:  # type: ignore[no-any-unimported]
+    """Import LangChain's OpenAIEmbeddings on first use.
+
+    langchain_openai takes over a second to import (httpx, openai, tiktoken,
+    LangChain core), so it is only loaded once a client is actually needed;
+    e.g. a re-index whose blobs are all cached never pays for it.
+    """
+    from langchain_openai import OpenAIEmbeddings
+
+    return OpenAIEmbeddings  # type: ignore[no-any-return]
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_sync_client(  # type: ignore[no-any-unimported]
+    model_name: str, api_key: str, dimensions: int
+) -> OpenAIEmbeddings:
+    """LangChain client shared by OpenAIProviders with the same settings.
+
+    Building a client costs ~60ms, almost all of it TLS context setup for
+    its HTTP clients. Sharing is only safe for synchronous calls: the async
+    client's connection pool is bound to the event loop it first ran on, so
+    OpenAIEmbedder (async) keeps a client per instance.
+    """
+    return _embeddings_cls()(
+        model=model_name,
+        api_key=SecretStr(api_key),
+        dimensions=dimensions,
+    )
 
 
 class OpenAIEmbedder:
@@ -22,17 +60,24 @@ class OpenAIEmbedder:
     for code chunks using OpenAI's text-embedding-3-large model.
 
     Design notes:
-    - Uses LangChain for API abstraction and retry logic
+    - Uses LangChain for API abstraction and retry logic; the client (and
+      langchain_openai itself) is only loaded on the first API request
     - Validates embedding dimensions match expected 3072
     - Tracks cost using OpenAI pricing ($0.13 per 1M tokens)
-    - Batches requests efficiently (max 2048 chunks per batch)
+    - Batches requests efficiently (max 2048 chunks and 300k tokens per
+      batch); larger inputs are split and the batches sent concurrently (up
+      to max_concurrency)
+    - Throttles requests client-side to the account's requests/min and
+      tokens/min quotas, so large ingests wait instead of burning retries on 429s
     - API key validation delegated to OpenAI SDK
 
     Attributes:
         MODEL: OpenAI model name (text-embedding-3-large)
         DIMENSIONS: Expected embedding dimensions (3072)
         COST_PER_MILLION_TOKENS: Cost in USD per 1M tokens ($0.13)
+        NANO_USD_PER_TOKEN: The same price as integer nano-USD per token (derived)
         MAX_BATCH_SIZE: Maximum chunks per API batch (2048)
+        MAX_TOKENS_PER_BATCH: OpenAI's per-request token limit (300,000)
 
     Examples:
         >>> embedder = OpenAIEmbedder(api_key="sk-...")
@@ -44,10 +89,21 @@ class OpenAIEmbedder:
     MODEL = "text-embedding-3-large"
     DIMENSIONS = 3072
     COST_PER_MILLION_TOKENS = 0.13
+    NANO_USD_PER_TOKEN = round(COST_PER_MILLION_TOKENS * 1000)
     MAX_BATCH_SIZE = 2048
-
-    def __init__(
-        self, api_key: str, max_retries: int = 3, show_progress: bool = False, **kwargs: Any
+    MAX_TOKENS_PER_BATCH = 300_000
+
+    def __init__(  # noqa: PLR0913 # Tuning knobs are keyword-only
+        self,
+        api_key: str,
+        max_retries: int = 3,
+        show_progress: bool = False,
+        *,
+        max_concurrency: int = 4,
+        max_tokens_per_batch: int = MAX_TOKENS_PER_BATCH,
+        requests_per_minute: int = 3_500,
+        tokens_per_minute: int = 1_000_000,
+        **kwargs: Any,
     ) -> None:
         """Initialize embedder with OpenAI API key.
 
@@ -55,10 +111,19 @@ class OpenAIEmbedder:
             api_key: OpenAI API key
             max_retries: Maximum retry attempts for API calls (default: 3)
             show_progress: Show progress bar during embedding (default: False)
+            max_concurrency: Maximum API requests in flight per embed_chunks()
+                call when the input spans several batches (default: 4)
+            max_tokens_per_batch: Token budget per request, summed over
+                CodeChunk.token_count (default: 300,000)
+            requests_per_minute: Request quota to throttle to (default: 3,500)
+            tokens_per_minute: Token quota to throttle to, summed over
+                CodeChunk.token_count (default: 1,000,000)
             **kwargs: Additional arguments passed to OpenAIEmbeddings
 
         Raises:
             ConfigurationError: If API key is missing
+            ValueError: If max_concurrency or max_tokens_per_batch is less than 1,
+                or a per-minute quota is not positive
 
         Examples:
             >>> embedder = OpenAIEmbedder(api_key="sk-test123")
@@ -71,31 +136,52 @@ class OpenAIEmbedder:
             raise ConfigurationError(
                 "OpenAI API key required. Set OPENAI_API_KEY env var or configure in settings."
             )
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if max_tokens_per_batch < 1:
+            raise ValueError(f"max_tokens_per_batch must be >= 1, got {max_tokens_per_batch}")
+
+        self.max_concurrency = max_concurrency
+        self.max_tokens_per_batch = max_tokens_per_batch
+        self._request_limiter = AsyncRateLimiter(requests_per_minute)
+        self._token_limiter = AsyncRateLimiter(tokens_per_minute)
+        self._client_kwargs: dict[str, Any] = {
+            "max_retries": max_retries,
+            "show_progress_bar": show_progress,
+            "api_key": SecretStr(api_key),
+            **kwargs,
+        }
 
-        self._embeddings = OpenAIEmbeddings(
+    @functools.cached_property
+    def _embeddings(self) -> OpenAIEmbeddings:  # type: ignore[no-any-unimported]
+        """LangChain client, built (and langchain_openai imported) on first API call."""
+        return _embeddings_cls()(
             model=self.MODEL,
             dimensions=self.DIMENSIONS,
             chunk_size=self.MAX_BATCH_SIZE,
-            max_retries=max_retries,
-            show_progress_bar=show_progress,
             tiktoken_enabled=True,
             check_embedding_ctx_length=True,
-            api_key=SecretStr(api_key),
-            **kwargs,
+            **self._client_kwargs,
         )
 
     async def embed_chunks(self, chunks: list[CodeChunk], blob_sha: str) -> list[Embedding]:
         """Generate embeddings for code chunks.
 
+        Inputs larger than MAX_BATCH_SIZE chunks or max_tokens_per_batch
+        tokens are packed into several batches that are sent concurrently (at
+        most max_concurrency at a time), so their round-trips overlap. If any
+        batch fails, the others are cancelled.
+
         Args:
             chunks: List of code chunks to embed
             blob_sha: Git blob SHA for metadata tracking
 
         Returns:
-            List of Embedding objects with vectors and metadata
+            List of Embedding objects with vectors and metadata, in input order
 
         Raises:
             DimensionMismatchError: If returned embeddings have wrong dimensions
+            APIError: If a response holds fewer or more embeddings than inputs
             Exception: API errors from OpenAI (network, rate limit, etc.)
 
         Examples:
@@ -103,10 +189,115 @@ class OpenAIEmbedder:
             >>> embeddings = await embedder.embed_chunks(chunks, "abc123")
             >>> len(embeddings[0].vector)  # 3072
         """
+        embeddings = [embedding async for embedding in self.aembed_chunks_iter(chunks, blob_sha)]
+        # Batches arrive in completion order; chunk_index restores input order
+        embeddings.sort(key=lambda embedding: embedding.chunk_index)
+        return embeddings
+
+    async def aembed_chunks_iter(
+        self, chunks: list[CodeChunk], blob_sha: str
+    ) -> AsyncIterator[Embedding]:
+        """Yield embeddings for code chunks as their batches complete.
+
+        Batches are packed as in embed_chunks(), but only max_concurrency of
+        them are in flight at once and the next one is sent as a finished one
+        is handed over. Peak memory is therefore bounded by max_concurrency
+        batches rather than the whole input, and a consumer (e.g. a vector
+        store writer) can ingest results while later batches are fetched.
+
+        Args:
+            chunks: List of code chunks to embed
+            blob_sha: Git blob SHA for metadata tracking
+
+        Yields:
+            Embedding objects in batch completion order (within a batch, in
+            input order); use Embedding.chunk_index to restore input order
+
+        Raises:
+            DimensionMismatchError: If returned embeddings have wrong dimensions
+            APIError: If a response holds fewer or more embeddings than inputs
+            Exception: API errors from OpenAI (network, rate limit, etc.)
+
+        Examples:
+            >>> async for embedding in embedder.aembed_chunks_iter(chunks, "abc123"):
+            ...     store.add(embedding)
+        """
         if not chunks:
-            return []
+            return
+        batches = iter(self._pack_batches(chunks))
+        pending: set[asyncio.Task[list[Embedding]]] = set()
+
+        def _refill() -> None:
+            for start, batch in itertools.islice(batches, self.max_concurrency - len(pending)):
+                pending.add(asyncio.create_task(self._embed_batch(batch, blob_sha, start)))
+
+        # Cancels in-flight batches if one fails or the consumer stops early
+        try:
+            _refill()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # exception() marks every failure as retrieved, not just the raised one
+                failed = [task for task in done if task.exception() is not None]
+                if failed:
+                    raise failed[0].exception()  # type: ignore[misc]
+                _refill()
+                for task in done:
+                    for embedding in task.result():
+                        yield embedding
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _pack_batches(self, chunks: list[CodeChunk]) -> list[tuple[int, list[CodeChunk]]]:
+        """Greedily pack chunks, in order, into request-sized batches.
+
+        A batch is closed when adding the next chunk would exceed
+        MAX_BATCH_SIZE chunks or max_tokens_per_batch tokens. A single chunk
+        over the token budget still goes out on its own (the API rejects it
+        with a clear error rather than this method silently dropping it).
+
+        Args:
+            chunks: Chunks to embed, in input order
+
+        Returns:
+            (index of the batch's first chunk, batch) pairs covering every chunk
+        """
+        batches: list[tuple[int, list[CodeChunk]]] = []
+        start = 0
+        tokens = 0
+        for idx, chunk in enumerate(chunks):
+            if idx > start and (
+                idx - start >= self.MAX_BATCH_SIZE
+                or tokens + chunk.token_count > self.max_tokens_per_batch
+            ):
+                batches.append((start, chunks[start:idx]))
+                start, tokens = idx, 0
+            tokens += chunk.token_count
+        batches.append((start, chunks[start:]))
+        return batches
+
+    async def _embed_batch(
+        self, chunks: list[CodeChunk], blob_sha: str, first_index: int
+    ) -> list[Embedding]:
+        """Embed one API request's worth of chunks.
 
+        Args:
+            chunks: Chunks for a single request (at most MAX_BATCH_SIZE)
+            blob_sha: Git blob SHA for metadata tracking
+            first_index: chunk_index of chunks[0] within the embed_chunks() input
+
+        Returns:
+            Embeddings for chunks, with cost distributed over this request's usage
+        """
+        # Column views of the batch, extracted once and shared by the request,
+        # the rate limiter and the cost split below
         contents = [chunk.content for chunk in chunks]
+        token_counts = [chunk.token_count for chunk in chunks]
+        batch_tokens = sum(token_counts)
+
+        await self._request_limiter.acquire()
+        await self._token_limiter.acquire(batch_tokens)
 
         # Call OpenAI API directly to get usage data
         response = await self._embeddings.async_client.create(
@@ -120,56 +311,52 @@ class OpenAIEmbedder:
 
         vectors = [item["embedding"] for item in response_dict["data"]]
         api_token_count = response_dict.get("usage", {}).get("total_tokens")
-
-        # Validate dimensions
-        for vector in vectors:
-            if len(vector) != self.DIMENSIONS:
-                raise DimensionMismatchError(
-                    f"Expected {self.DIMENSIONS} dimensions, got {len(vector)}"
-                )
-
-        # Calculate total cost for the batch, then distribute proportionally
+        if len(vectors) != len(chunks):
+            raise APIError(f"Expected {len(chunks)} embeddings, got {len(vectors)}")
+
+        # Pack into one contiguous float32 matrix (each Embedding gets a row
+        # view) and validate dimensions with a single shape check
+        try:
+            matrix = np.asarray(vectors, dtype=np.float32)
+        except ValueError:
+            # Ragged response: vectors of differing lengths
+            matrix = None
+        if matrix is None or (vectors and matrix.shape[1:] != (self.DIMENSIONS,)):
+            got = next(len(v) for v in vectors if len(v) != self.DIMENSIONS)
+            raise DimensionMismatchError(f"Expected {self.DIMENSIONS} dimensions, got {got}")
+
+        # Distribute the API-reported batch cost proportionally to tiktoken
+        # token counts (API doesn't tell us per-chunk breakdown)
         if api_token_count is not None:
             total_batch_cost = self.estimate_cost(api_token_count)
-            # Distribute cost proportionally based on tiktoken token counts
-            # (API doesn't tell us per-chunk breakdown, so use tiktoken proportions)
-            total_tiktoken_tokens = sum(chunk.token_count for chunk in chunks)
-            cost_per_tiktoken_token = (
-                total_batch_cost / total_tiktoken_tokens if total_tiktoken_tokens > 0 else 0.0
-            )
+            cost_per_token = total_batch_cost / batch_tokens if batch_tokens > 0 else 0.0
+            costs = [count * cost_per_token for count in token_counts]
         else:
-            # Fallback: no API token count, calculate per chunk
-            total_batch_cost = sum(self.estimate_cost(chunk.token_count) for chunk in chunks)
-            cost_per_tiktoken_token = None
-
-        # Build Embeddings with proportionally distributed costs
-        embeddings = []
-        for idx, (chunk, vector) in enumerate(zip(chunks, vectors, strict=False)):
-            # Proportional cost based on this chunk's tiktoken token share
-            if cost_per_tiktoken_token is not None:
-                chunk_cost = chunk.token_count * cost_per_tiktoken_token
-            else:
-                # Fallback: estimate from tiktoken
-                chunk_cost = self.estimate_cost(chunk.token_count)
-
-            embeddings.append(
-                Embedding(
-                    vector=vector,
-                    token_count=chunk.token_count,
-                    model=self.MODEL,
-                    cost_usd=chunk_cost,
-                    blob_sha=blob_sha,
-                    chunk_index=idx,
-                    api_token_count=api_token_count,  # Keep batch total for reference
-                )
+            # Fallback: no API token count, estimate per chunk from tiktoken
+            costs = [self.estimate_cost(count) for count in token_counts]
+
+        return [
+            Embedding(
+                vector=vector,
+                token_count=count,
+                model=self.MODEL,
+                cost_usd=cost,
+                blob_sha=blob_sha,
+                chunk_index=first_index + idx,
+                api_token_count=api_token_count,  # Keep batch total for reference
             )
-
-        return embeddings
+            for idx, (count, cost, vector) in enumerate(
+                zip(token_counts, costs, matrix, strict=True)
+            )
+        ]
 
     def estimate_cost(self, token_count: int) -> float:
         """Estimate API cost for embedding token_count tokens.
 
         Uses OpenAI pricing for text-embedding-3-large: $0.13 per 1M tokens.
+        The price is kept as integer nano-USD, so the only rounding is the
+        final division and results are exact to float precision (no
+        0.00013000000000000002 drift from chaining two float operations).
 
         Args:
             token_count: Number of tokens to embed
@@ -182,7 +369,7 @@ class OpenAIEmbedder:
             >>> embedder.estimate_cost(1000)       # 0.00013
             >>> embedder.estimate_cost(0)          # 0.0
         """
-        return (token_count / 1_000_000) * self.COST_PER_MILLION_TOKENS
+        return token_count * self.NANO_USD_PER_TOKEN / 1_000_000_000
 
 
 class OpenAIProvider:
@@ -218,12 +405,8 @@ class OpenAIProvider:
         self.model_name = model_name
         self.spec = base.spec
 
-        # Initialize LangChain client
-        self._client = OpenAIEmbeddings(
-            model=model_name,
-            api_key=SecretStr(api_key),
-            dimensions=base.dimensions,
-        )
+        # LangChain client (sync calls only, so shared across providers)
+        self._client = _shared_sync_client(model_name, api_key, base.dimensions)
 
     @property
     def max_tokens(self) -> int:
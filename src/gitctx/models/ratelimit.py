@@ -0,0 +1,69 @@
+"""Client-side rate limiting for embedding providers."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+
+
+class AsyncRateLimiter:
+    """Token-bucket limiter for per-minute API quotas.
+
+    The bucket holds up to rate_per_minute units and refills continuously at
+    rate_per_minute / 60 units per second. acquire() waits until enough units
+    are available, so callers are throttled before the provider starts
+    returning 429s. Waiters are served first come, first served.
+
+    The bucket starts full, so a short burst up to the quota goes out
+    immediately. A request larger than the whole quota is clamped to it: it
+    waits for a full bucket instead of blocking forever.
+
+    Examples:
+        >>> tokens = AsyncRateLimiter(1_000_000)
+        >>> await tokens.acquire(sum(chunk.token_count for chunk in batch))
+    """
+
+    def __init__(
+        self, rate_per_minute: float, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate_per_minute: Quota, in units per minute
+            clock: Monotonic time source in seconds (injectable for tests)
+
+        Raises:
+            ValueError: If rate_per_minute is not positive
+        """
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be > 0, got {rate_per_minute}")
+
+        self.rate_per_minute = rate_per_minute
+        self._clock = clock
+        self._level = float(rate_per_minute)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until amount units are available, then take them.
+
+        Args:
+            amount: Units to consume (e.g. 1 request, or a batch's token count)
+        """
+        amount = min(amount, self.rate_per_minute)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._level >= amount:
+                    self._level -= amount
+                    return
+                await asyncio.sleep((amount - self._level) * 60 / self.rate_per_minute)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        self._level = min(
+            float(self.rate_per_minute), self._level + elapsed * self.rate_per_minute / 60
+        )
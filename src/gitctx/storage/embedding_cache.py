@@ -1,18 +1,48 @@
 """Embedding cache using safetensors for persistent storage."""
 
-import json
+import asyncio
+import functools
+import hashlib
 import logging
+import os
 import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import zstandard as zstd
-from safetensors.numpy import load, save
+from numpy.typing import NDArray
+from safetensors.numpy import save
 
 from gitctx.indexing.types import Embedding
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson arrives with langchain-core (via langsmith) but is optional
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# safetensors dtype tags written by this cache (F16: quantization scales of older entries)
+_SAFETENSORS_DTYPES = {"F32": np.float32, "F16": np.float16, "I8": np.int8}
+
+
+def chunk_content_key(content: str) -> str:
+    """Content-address a chunk for cross-blob deduplication.
+
+    Args:
+        content: Chunk text
+
+    Returns:
+        40-character hex digest (blake2b, 160-bit)
+
+    Examples:
+        >>> chunk_content_key("def foo(): pass") == chunk_content_key("def foo(): pass")
+        True
+    """
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=20).hexdigest()
+
 
 class EmbeddingCache:
     """Persistent filesystem cache for embeddings by blob SHA.
@@ -24,6 +54,7 @@ class EmbeddingCache:
 
     Cache structure:
         .gitctx/embeddings/{model}/{blob_sha}.safetensors
+        .gitctx/embeddings/{model}/chunks/{key[:2]}/{content_key}.safetensors
 
     Example:
         >>> cache = EmbeddingCache(Path(".gitctx"), model="text-embedding-3-large")
@@ -36,16 +67,44 @@ class EmbeddingCache:
     # Level 3: Balance of speed and ratio (zstd recommendation)
     COMPRESSION_LEVEL = 3
 
-    def __init__(self, cache_dir: Path, model: str = "text-embedding-3-large"):
+    # Symmetric int8 range used when quantizing vectors
+    INT8_MAX = 127
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        model: str = "text-embedding-3-large",
+        quantized: bool = False,
+        max_workers: int | None = None,
+    ):
         """Initialize cache for a specific model.
 
         Args:
             cache_dir: Root cache directory (.gitctx/)
             model: Model name for namespacing (default: text-embedding-3-large)
+            quantized: Store vectors as int8 with a per-vector float32 scale
+                (~4x smaller entries, max abs error ~0.4% of the vector's
+                largest component). Reading always honors how an entry was
+                written, so quantized and float32 entries can coexist.
+            max_workers: Threads for aget_chunks() reads (default:
+                ThreadPoolExecutor's default)
         """
         self.cache_dir = cache_dir / "embeddings" / model
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.model = model
+        self.quantized = quantized
+        self._max_workers = max_workers
+
+    @functools.cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Reader pool shared by every aget_chunks() call, started on first use."""
+        return ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="gitctx-cache")
+
+    def close(self) -> None:
+        """Shut down the reader pool, if one was started."""
+        executor = self.__dict__.pop("_executor", None)
+        if executor is not None:
+            executor.shutdown()
 
     def get(self, blob_sha: str) -> list[Embedding] | None:
         """Load cached embeddings with transparent decompression.
@@ -56,7 +115,83 @@ class EmbeddingCache:
         Returns:
             List of Embedding objects if cached, None if not found
         """
-        path = self.cache_dir / f"{blob_sha}.safetensors.zst"
+        return self._load(self.cache_dir / f"{blob_sha}.safetensors.zst", blob_sha)
+
+    def set(self, blob_sha: str, embeddings: list[Embedding]) -> None:
+        """Save embeddings with zstd compression.
+
+        Args:
+            blob_sha: Git blob SHA
+            embeddings: List of Embedding objects to cache
+        """
+        self._store(self.cache_dir / f"{blob_sha}.safetensors.zst", blob_sha, embeddings)
+
+    def get_chunk(self, content_key: str) -> Embedding | None:
+        """Load a cached embedding for one chunk by content key.
+
+        Chunk entries are addressed by chunk_content_key(), so identical
+        chunks in different blobs (vendored files, license headers, copied
+        boilerplate) share a single entry and are only embedded once.
+
+        Args:
+            content_key: Key from chunk_content_key()
+
+        Returns:
+            Embedding (vector, token count, cost) if cached, None if not found
+        """
+        loaded = self._load(self._chunk_path(content_key), content_key)
+        return loaded[0] if loaded else None
+
+    async def aget_chunks(self, content_keys: list[str]) -> dict[str, Embedding]:
+        """Load many chunk entries without blocking the event loop.
+
+        File reads and zstd decompression run on the cache's shared thread
+        pool (they release the GIL), so concurrent callers overlap their
+        lookups and other coroutines keep running meanwhile.
+
+        Args:
+            content_keys: Keys from chunk_content_key()
+
+        Returns:
+            Map of content key to embedding for cache hits only (misses omitted)
+
+        Examples:
+            >>> hits = await cache.aget_chunks([chunk_content_key("def foo(): pass")])
+        """
+        if not content_keys:
+            return {}
+        loop = asyncio.get_running_loop()
+        loaded = await asyncio.gather(
+            *(loop.run_in_executor(self._executor, self.get_chunk, key) for key in content_keys)
+        )
+        return {key: emb for key, emb in zip(content_keys, loaded, strict=True) if emb is not None}
+
+    def set_chunk(self, content_key: str, embedding: Embedding) -> None:
+        """Save the embedding for one chunk by content key.
+
+        Args:
+            content_key: Key from chunk_content_key()
+            embedding: Embedding for the chunk content
+        """
+        path = self._chunk_path(content_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._store(path, content_key, [embedding])
+
+    def _chunk_path(self, content_key: str) -> Path:
+        # Fan out by key prefix (like .git/objects) so no directory holds
+        # every chunk of a large repository
+        return self.cache_dir / "chunks" / content_key[:2] / f"{content_key}.safetensors.zst"
+
+    def _load(self, path: Path, key: str) -> list[Embedding] | None:
+        """Read and decode one cache entry.
+
+        Args:
+            path: Compressed safetensors file
+            key: Blob SHA or chunk content key stored as the entry's blob_sha
+
+        Returns:
+            Decoded embeddings, or None if missing or corrupted
+        """
         if not path.exists():
             return None
 
@@ -68,57 +203,63 @@ class EmbeddingCache:
 
             # Extract metadata from safetensors header
             # (Standard safetensors pattern for bytes - see https://huggingface.co/docs/safetensors/metadata_parsing)
+            # Both parsers take the UTF-8 bytes directly (no str decode step)
             header_size = struct.unpack("<Q", decompressed[:8])[0]
-            json_header = decompressed[8 : 8 + header_size].decode("utf-8")
-            header = json.loads(json_header)
+            header = _json_loads(decompressed[8 : 8 + header_size])
             metadata = header.get("__metadata__", {})
 
-            # Load tensors from decompressed bytes
-            tensors = load(decompressed)
+            # Zero-copy views into the decompressed buffer (no per-tensor copy)
+            tensors = self._tensor_views(decompressed, header, 8 + header_size)
 
             # Reconstruct Embedding objects from tensors + metadata
-            embeddings = []
             chunk_count = int(metadata.get("chunks", 0))
-            for i in range(chunk_count):
-                tensor = tensors[f"chunk_{i}"]
-                vector = tensor.tolist()
-                embeddings.append(
-                    Embedding(
-                        vector=vector,
-                        token_count=int(metadata.get(f"chunk_{i}_tokens", 0)),
-                        model=self.model,
-                        cost_usd=float(metadata.get(f"chunk_{i}_cost", 0.0)),
-                        blob_sha=blob_sha,
-                        chunk_index=i,
-                    )
+            quantized = metadata.get("quantized") == "1"
+            return [
+                Embedding(
+                    vector=(
+                        self._dequantize(tensors[f"chunk_{i}"], tensors[f"chunk_{i}_scale"])
+                        if quantized
+                        else tensors[f"chunk_{i}"]
+                    ),
+                    token_count=int(metadata.get(f"chunk_{i}_tokens", 0)),
+                    model=self.model,
+                    cost_usd=float(metadata.get(f"chunk_{i}_cost", 0.0)),
+                    blob_sha=key,
+                    chunk_index=i,
                 )
-            return embeddings
+                for i in range(chunk_count)
+            ]
 
         except Exception as e:
             # Corrupted file - log and return None
-            logger.warning(f"Failed to load cache for {blob_sha[:8]}: {e}")
+            logger.warning(f"Failed to load cache for {key[:8]}: {e}")
             return None
 
-    def set(self, blob_sha: str, embeddings: list[Embedding]) -> None:
-        """Save embeddings with zstd compression.
+    def _store(self, path: Path, key: str, embeddings: list[Embedding]) -> None:
+        """Encode and write one cache entry.
 
         Args:
-            blob_sha: Git blob SHA
-            embeddings: List of Embedding objects to cache
+            path: Compressed safetensors file to write
+            key: Blob SHA or chunk content key recorded in metadata
+            embeddings: Embeddings to serialize
         """
-        path = self.cache_dir / f"{blob_sha}.safetensors.zst"
-
         # Convert Embedding list to numpy arrays for safetensors
         tensors = {}
         metadata = {}
 
         for i, emb in enumerate(embeddings):
-            tensors[f"chunk_{i}"] = np.array(emb.vector, dtype=np.float32)
+            # asarray: no copy when the vector is already a float32 array
+            vector = np.asarray(emb.vector, dtype=np.float32)
+            if self.quantized:
+                tensors[f"chunk_{i}"], tensors[f"chunk_{i}_scale"] = self._quantize(vector)
+            else:
+                tensors[f"chunk_{i}"] = vector
             metadata[f"chunk_{i}_tokens"] = str(emb.token_count)
             metadata[f"chunk_{i}_cost"] = str(emb.cost_usd)
 
+        metadata["quantized"] = "1" if self.quantized else "0"
         metadata["model"] = self.model
-        metadata["blob_sha"] = blob_sha
+        metadata["blob_sha"] = key
         metadata["chunks"] = str(len(embeddings))
 
         # Serialize to bytes (NOT file)
@@ -128,5 +269,62 @@ class EmbeddingCache:
         cctx = zstd.ZstdCompressor(level=self.COMPRESSION_LEVEL)
         compressed = cctx.compress(safetensors_bytes)
 
-        # Write compressed bytes
-        path.write_bytes(compressed)
+        # Write to a temp file and rename so readers never see a partial entry
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(compressed)
+        tmp_path.replace(path)
+
+    @staticmethod
+    def _tensor_views(  # type: ignore[no-any-unimported]
+        buffer: bytes, header: dict[str, Any], data_start: int
+    ) -> dict[str, NDArray[Any]]:
+        """Map safetensors header entries to read-only numpy views of buffer.
+
+        Args:
+            buffer: Decompressed safetensors bytes
+            header: Parsed JSON header
+            data_start: Offset of the tensor data section (8 + header size)
+
+        Returns:
+            Tensor name -> array viewing buffer (shares its memory)
+        """
+        views = {}
+        for name, info in header.items():
+            if name == "__metadata__":
+                continue
+            begin, end = info["data_offsets"]
+            dtype = np.dtype(_SAFETENSORS_DTYPES[info["dtype"]])
+            views[name] = np.frombuffer(
+                buffer,
+                dtype=dtype,
+                count=(end - begin) // dtype.itemsize,
+                offset=data_start + begin,
+            ).reshape(info["shape"])
+        return views
+
+    @classmethod
+    def _quantize(  # type: ignore[no-any-unimported]
+        cls, vector: NDArray[np.float32]
+    ) -> tuple[NDArray[np.int8], NDArray[np.float32]]:
+        """Quantize a float32 vector to int8 with a per-vector scale.
+
+        Args:
+            vector: float32 embedding vector
+
+        Returns:
+            Tuple of (int8 values, 1-element float32 scale)
+        """
+        peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+        # float32 scale: a float16 one underflows to 0 for peaks below ~7.6e-6
+        # (and overflows for huge ones), which would divide to inf/NaN
+        scale = np.array([peak / cls.INT8_MAX if peak > 0 else 1.0], dtype=np.float32)
+        q = np.clip(np.rint(vector / scale), -cls.INT8_MAX, cls.INT8_MAX)
+        return q.astype(np.int8), scale
+
+    @staticmethod
+    def _dequantize(  # type: ignore[no-any-unimported]
+        q: NDArray[np.int8], scale: NDArray[np.float32] | NDArray[np.float16]
+    ) -> NDArray[np.float32]:
+        """Restore a float32 vector from int8 values and its (float32 or legacy float16) scale."""
+        restored: NDArray[np.float32] = q.astype(np.float32) * np.float32(scale[0])  # type: ignore[no-any-unimported]
+        return restored
@@ -231,52 +231,60 @@ class LanceDBStore:
         """
         from datetime import UTC, datetime
 
-        records = []
-        skipped_count = 0
+        # Resolve each blob's location once, not once per chunk
+        # (most recent by commit_date when blob appears in multiple commits)
+        latest: dict[str, BlobLocation] = {
+            sha: max(locations, key=lambda location: location.commit_date)
+            for sha, locations in blob_locations.items()
+            if locations
+        }
+
+        # Build columns directly (struct-of-arrays) instead of one dict per chunk
+        kept: list[Embedding] = []
+        locs: list[BlobLocation] = []
         skipped_blob_shas = []
         for emb in embeddings:
-            # Get BlobLocation for this chunk's blob
-            locations = blob_locations.get(emb.blob_sha, [])
-            if not locations:
+            loc = latest.get(emb.blob_sha)
+            if loc is None:
                 logger.warning(f"No location found for blob {emb.blob_sha[:8]}... - skipping chunk")
-                skipped_count += 1
                 skipped_blob_shas.append(emb.blob_sha[:8])
                 continue
-
-            # Use most recent location by commit_date (when blob appears in multiple commits)
-            loc = max(locations, key=lambda location: location.commit_date)
-
-            record = {
-                "vector": emb.vector,
-                "chunk_content": emb.chunk_content,
-                "token_count": emb.token_count,
-                "blob_sha": emb.blob_sha,
-                "chunk_index": emb.chunk_index,
-                "start_line": emb.start_line,
-                "end_line": emb.end_line,
-                "total_chunks": emb.total_chunks,
-                "file_path": loc.file_path,
-                "language": emb.language,
-                "commit_sha": loc.commit_sha,
-                "author_name": loc.author_name,
-                "author_email": loc.author_email,
-                "commit_date": loc.commit_date,
-                "commit_message": loc.commit_message,
-                "is_head": loc.is_head,
-                "is_merge": loc.is_merge,
-                "embedding_model": emb.model,
-                "indexed_at": datetime.now(UTC).isoformat(),
-            }
-            records.append(record)
+            kept.append(emb)
+            locs.append(loc)
 
         # Batch insert
-        if records:
+        if kept:
             assert self.chunks_table is not None
-            self.chunks_table.add(records)
-            logger.info(f"Inserted {len(records)} chunks into LanceDB")
-        elif skipped_count > 0:
+            vectors = np.stack([np.asarray(e.vector, dtype=np.float32) for e in kept])
+            columns = {
+                "vector": pa.FixedSizeListArray.from_arrays(
+                    pa.array(vectors.ravel(), type=pa.float32()), vectors.shape[1]
+                ),
+                "chunk_content": [e.chunk_content for e in kept],
+                "token_count": [e.token_count for e in kept],
+                "blob_sha": [e.blob_sha for e in kept],
+                "chunk_index": [e.chunk_index for e in kept],
+                "start_line": [e.start_line for e in kept],
+                "end_line": [e.end_line for e in kept],
+                "total_chunks": [e.total_chunks for e in kept],
+                "file_path": [loc.file_path for loc in locs],
+                "language": [e.language for e in kept],
+                "commit_sha": [loc.commit_sha for loc in locs],
+                "author_name": [loc.author_name for loc in locs],
+                "author_email": [loc.author_email for loc in locs],
+                "commit_date": [loc.commit_date for loc in locs],
+                "commit_message": [loc.commit_message for loc in locs],
+                "is_head": [loc.is_head for loc in locs],
+                "is_merge": [loc.is_merge for loc in locs],
+                "embedding_model": [e.model for e in kept],
+                "indexed_at": [datetime.now(UTC).isoformat()] * len(kept),
+            }
+            table = pa.Table.from_pydict(columns, schema=self.chunks_table.schema)
+            self.chunks_table.add(table)
+            logger.info(f"Inserted {len(kept)} chunks into LanceDB")
+        elif skipped_blob_shas:
             logger.warning(
-                f"Skipped {skipped_count} chunks with no blob location: "
+                f"Skipped {len(skipped_blob_shas)} chunks with no blob location: "
                 f"{', '.join(skipped_blob_shas)}"
             )
 
@@ -10,10 +10,13 @@ Future Expansion: See roadmap in comments below
 Author: gitctx team
 """
 
+import functools
 import os
 import platform
 import re
+import shutil
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -98,10 +101,12 @@ class StrippedResult:
         return getattr(self._result, name)
 
 
+@functools.cache
 def is_windows() -> bool:
     """Check if running on Windows platform.
 
     Centralized platform detection to avoid duplication across test files.
+    Cached: the platform cannot change mid-session.
 
     Returns:
         bool: True if running on Windows, False otherwise
@@ -188,13 +193,21 @@ def git_isolation_base(tmp_path: Path) -> dict[str, str]:
     }
 
 
+@pytest.fixture(scope="session")
+def _session_home(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Allocate one HOME directory per session (per xdist worker)."""
+    return tmp_path_factory.mktemp("test_home")
+
+
 @pytest.fixture
-def temp_home(tmp_path: Path) -> Path:
+def temp_home(_session_home: Path) -> Iterator[Path]:
     """
     Create isolated HOME directory for tests.
 
-    Creates a temporary home directory with .gitctx subdirectory already
+    Provides a home directory with .gitctx subdirectory already
     initialized. Use this when you need direct access to a home directory.
+    The directory itself is allocated once per session; everything inside it
+    is removed again after each test, so tests still start from a clean home.
 
     Returns:
         Path: Temporary home directory with .gitctx subdir
@@ -214,10 +227,14 @@ def temp_home(tmp_path: Path) -> Path:
     See also:
     - For most tests, use isolated_env instead (cleaner API)
     """
-    home = tmp_path / "test_home"
-    home.mkdir()
-    (home / ".gitctx").mkdir()
-    return home
+    (_session_home / ".gitctx").mkdir(exist_ok=True)
+    yield _session_home
+
+    for child in _session_home.iterdir():
+        if child.is_dir() and not child.is_symlink():
+            shutil.rmtree(child, ignore_errors=True)
+        else:
+            child.unlink(missing_ok=True)
 
 
 @pytest.fixture
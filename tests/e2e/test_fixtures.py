@@ -7,14 +7,13 @@ When adding new E2E fixtures, add tests here.
 # ruff: noqa: PLC0415 # Inline imports for fixture testing
 
 import os
-import platform
 import subprocess
 import sys
 from pathlib import Path
 
 import pytest
 
-from tests.conftest import get_platform_null_device, get_platform_ssh_command
+from tests.conftest import get_platform_null_device, get_platform_ssh_command, is_windows
 
 
 def test_e2e_git_isolation_env_security(e2e_git_isolation_env: dict[str, str]) -> None:
@@ -70,7 +69,7 @@ def test_e2e_git_isolation_prevents_ssh(e2e_git_isolation_env: dict[str, str]) -
     except (subprocess.TimeoutExpired, FileNotFoundError):
         # Windows: SSH may timeout or not be found - both are acceptable
         # This proves SSH is not easily accessible in the isolated environment
-        if platform.system() != "Windows":
+        if not is_windows():
             raise  # On Unix, timeout is unexpected
 
 
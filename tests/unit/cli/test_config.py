@@ -1,5 +1,7 @@
 """Unit tests for config command."""
 
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -18,6 +20,23 @@ def test_config_command_exists(isolated_cli_runner):
     assert "Manage" in result.stdout or "configuration" in result.stdout.lower()
 
 
+def test_config_app_registration_defers_settings_import():
+    """Registering the config sub-app must not pull in pydantic-settings or PyYAML."""
+    # ARRANGE
+    code = (
+        "import sys, gitctx.cli.main; "
+        "print(sorted({'pydantic_settings', 'yaml', 'gitctx.config.settings'} & set(sys.modules)))"
+    )
+
+    # ACT
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    # ASSERT
+    assert result.stdout.strip() == "[]"
+
+
 def test_config_set_command(isolated_cli_runner):
     """Verify config set subcommand works."""
     result = isolated_cli_runner.invoke(app, ["config", "set", "api_keys.openai", "sk-test123"])
@@ -232,7 +251,7 @@ def test_config_set_permission_error_on_save(isolated_cli_runner, monkeypatch):
     original_open = Path.open
 
     def mock_open(self, *args, **kwargs):
-        if str(self).endswith("config.yml") and "w" in str(args):
+        if "config.yml" in self.name and "w" in str(args):
             raise PermissionError("Permission denied")
         return original_open(self, *args, **kwargs)
 
@@ -336,7 +355,7 @@ def test_config_init_file_exists_error_non_quiet(isolated_cli_runner, monkeypatc
     def mock_init_repo_config():
         raise FileExistsError(".gitctx/ already exists")
 
-    monkeypatch.setattr("gitctx.cli.config.init_repo_config", mock_init_repo_config)
+    monkeypatch.setattr("gitctx.config.settings.init_repo_config", mock_init_repo_config)
 
     # Run init again without --quiet
     result = isolated_cli_runner.invoke(app, ["config", "init"])
@@ -461,7 +480,7 @@ def test_config_list_truly_empty(isolated_cli_runner, monkeypatch):
 def test_config_set_greater_than_validation():
     """Test setting value below minimum constraint (greater_than error)."""
 
-    with patch("gitctx.cli.config.GitCtxSettings") as MockSettings:
+    with patch("gitctx.config.settings.GitCtxSettings") as MockSettings:
         mock_settings = Mock()
         MockSettings.return_value = mock_settings
 
@@ -486,7 +505,7 @@ def test_config_set_greater_than_validation():
 def test_config_set_less_than_validation():
     """Test setting value above maximum constraint (less_than error)."""
 
-    with patch("gitctx.cli.config.GitCtxSettings") as MockSettings:
+    with patch("gitctx.config.settings.GitCtxSettings") as MockSettings:
         mock_settings = Mock()
         MockSettings.return_value = mock_settings
 
@@ -511,7 +530,7 @@ def test_config_set_less_than_validation():
 def test_config_set_bool_validation_error():
     """Test setting invalid boolean value."""
 
-    with patch("gitctx.cli.config.GitCtxSettings") as MockSettings:
+    with patch("gitctx.config.settings.GitCtxSettings") as MockSettings:
         mock_settings = Mock()
         MockSettings.return_value = mock_settings
 
@@ -534,7 +553,7 @@ def test_config_set_bool_validation_error():
 def test_config_set_generic_exception():
     """Test generic exception handler in config_set."""
 
-    with patch("gitctx.cli.config.GitCtxSettings") as MockSettings:
+    with patch("gitctx.config.settings.GitCtxSettings") as MockSettings:
         mock_settings = Mock()
         MockSettings.return_value = mock_settings
 
@@ -556,7 +575,7 @@ def test_config_list_no_items():
     triggering the 'No configuration set' message.
     """
 
-    with patch("gitctx.cli.config.GitCtxSettings") as MockSettings:
+    with patch("gitctx.config.settings.GitCtxSettings") as MockSettings:
         mock_settings = Mock()
         MockSettings.return_value = mock_settings
 
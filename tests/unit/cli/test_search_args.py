@@ -335,8 +335,6 @@ def test_format_and_verbose_any_value(isolated_cli_runner):
 
 def test_tiktoken_import_error_fallback():
     """Test that query validation gracefully handles missing tiktoken."""
-    from unittest.mock import patch  # noqa: PLC0415 # Test-specific import for mocking
-
     from gitctx.cli.search import (  # noqa: PLC0415 # Import private function for testing
         _get_query_text,
     )
@@ -0,0 +1,30 @@
+"""Shared fixtures for config unit tests."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def gitctx_dir(tmp_path: Path, monkeypatch) -> Path:
+    """Run the test from tmp_path with an empty .gitctx/ directory in place."""
+    monkeypatch.chdir(tmp_path)
+    config_dir = tmp_path / ".gitctx"
+    config_dir.mkdir()
+    return config_dir
+
+
+@pytest.fixture
+def write_repo_yaml(gitctx_dir: Path) -> Callable[[bytes], Path]:
+    """Factory writing .gitctx/config.yml for the current test; returns its path.
+
+    Takes the document as bytes literals so nothing is re-encoded per test.
+    """
+
+    def _write(content: bytes) -> Path:
+        config_file = gitctx_dir / "config.yml"
+        config_file.write_bytes(content)
+        return config_file
+
+    return _write
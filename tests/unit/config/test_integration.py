@@ -10,6 +10,7 @@ See:
 - src/gitctx/core/config.py
 """
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -19,10 +20,24 @@ from gitctx.config.settings import GitCtxSettings
 from gitctx.models.providers.openai import OpenAIEmbedder
 
 
+@pytest.fixture
+def load_settings(isolated_env: Path) -> Callable[..., GitCtxSettings]:
+    """Factory building GitCtxSettings, optionally writing ~/.gitctx/config.yml first."""
+
+    def _load(user_config: bytes | None = None) -> GitCtxSettings:
+        if user_config is not None:
+            (isolated_env / ".gitctx" / "config.yml").write_bytes(user_config)
+        return GitCtxSettings()
+
+    return _load
+
+
 class TestConfigIntegration:
     """Test OpenAIEmbedder integration with GitCtxSettings."""
 
-    def test_embedder_reads_api_key_from_settings(self, isolated_env: Path) -> None:
+    def test_embedder_reads_api_key_from_settings(
+        self, load_settings: Callable[..., GitCtxSettings]
+    ) -> None:
         """OpenAIEmbedder uses API key from GitCtxSettings.
 
         Given: GitCtxSettings configured with OpenAI API key
@@ -30,13 +45,9 @@ class TestConfigIntegration:
         Then: Embedder initializes successfully
         """
         # ARRANGE - Set up config with API key
-        config_dir = isolated_env / ".gitctx"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        config_file = config_dir / "config.yml"
-        config_file.write_text("api_keys:\n  openai: sk-test-key-from-config\n")
+        settings = load_settings(b"api_keys:\n  openai: sk-test-key-from-config\n")
 
         # ACT - Create embedder with key from settings
-        settings = GitCtxSettings()
         api_key = settings.get("api_keys.openai")
         embedder = OpenAIEmbedder(api_key=api_key)
 
@@ -44,7 +55,9 @@ class TestConfigIntegration:
         assert embedder is not None
         assert embedder.MODEL == "text-embedding-3-large"
 
-    def test_embedder_raises_if_no_api_key(self, isolated_env: Path) -> None:
+    def test_embedder_raises_if_no_api_key(
+        self, load_settings: Callable[..., GitCtxSettings]
+    ) -> None:
         """OpenAIEmbedder raises ConfigurationError when API key missing.
 
         Given: GitCtxSettings has no OpenAI API key configured
@@ -52,19 +65,16 @@ class TestConfigIntegration:
         Then: ConfigurationError is raised with helpful message
         """
         # ARRANGE - Ensure no API key in settings
-        settings = GitCtxSettings()
+        settings = load_settings()
         api_key = settings.get("api_keys.openai")
         assert api_key is None, "API key should not be configured"
 
-        # ACT & ASSERT - Should raise ConfigurationError
-        with pytest.raises(ConfigurationError) as exc_info:
+        # ACT & ASSERT - Should raise ConfigurationError with a helpful message
+        with pytest.raises(
+            ConfigurationError, match=r"OpenAI API key required.*(OPENAI_API_KEY|settings)"
+        ):
             OpenAIEmbedder(api_key=api_key)  # type: ignore
 
-        # Verify error message is helpful
-        error_msg = str(exc_info.value)
-        assert "OpenAI API key required" in error_msg
-        assert "OPENAI_API_KEY" in error_msg or "settings" in error_msg
-
     def test_embedder_respects_env_var(self, isolated_env: Path, monkeypatch) -> None:
         """OpenAIEmbedder can use OPENAI_API_KEY env var.
 
@@ -93,10 +103,6 @@ class TestConfigIntegration:
         # ARRANGE - Empty API key
         empty_key = ""
 
-        # ACT & ASSERT - Should raise ConfigurationError
-        with pytest.raises(ConfigurationError) as exc_info:
+        # ACT & ASSERT - Should raise ConfigurationError with a helpful message
+        with pytest.raises(ConfigurationError, match=r"(?i)required"):
             OpenAIEmbedder(api_key=empty_key)
-
-        # Verify error message is helpful
-        error_msg = str(exc_info.value)
-        assert "required" in error_msg.lower()
@@ -19,7 +19,7 @@ class TestGitCtxSettingsRouting:
 
         # Create user config
         config_file = temp_home / ".gitctx" / "config.yml"
-        config_file.write_text("api_keys:\n  openai: sk-test123\n")
+        config_file.write_bytes(b"api_keys:\n  openai: sk-test123\n")
 
         # Act
         settings = GitCtxSettings()
@@ -29,20 +29,16 @@ class TestGitCtxSettingsRouting:
         assert value == "sk-test123"
 
     # @pytest.mark.skip(reason="RED phase - module doesn't exist yet")
-    def test_gitctx_settings_routes_settings_to_repo(self, tmp_path, monkeypatch):
+    def test_gitctx_settings_routes_settings_to_repo(self, tmp_path, monkeypatch, write_repo_yaml):
         """Repo settings should be routed to repo config."""
 
         # Setup
-        monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("HOME", str(tmp_path / "home"))
         # Clear OPENAI_API_KEY to prevent env var interference
         monkeypatch.delenv("OPENAI_API_KEY", raising=False)
 
         # Create repo config
-        config_dir = tmp_path / ".gitctx"
-        config_dir.mkdir()
-        config_file = config_dir / "config.yml"
-        config_file.write_text("search:\n  limit: 25\n")
+        write_repo_yaml(b"search:\n  limit: 25\n")
 
         # Act
         settings = GitCtxSettings()
@@ -122,7 +118,7 @@ class TestGetSource:
 
         # Create user config
         config_file = temp_home / ".gitctx" / "config.yml"
-        config_file.write_text("api_keys:\n  openai: sk-file123\n")
+        config_file.write_bytes(b"api_keys:\n  openai: sk-file123\n")
 
         # Act
         settings = GitCtxSettings()
@@ -150,20 +146,16 @@ class TestGetSource:
         assert source == "(from GITCTX_SEARCH__LIMIT)"
 
     # @pytest.mark.skip(reason="RED phase - module doesn't exist yet")
-    def test_get_source_repo_config(self, tmp_path, monkeypatch):
+    def test_get_source_repo_config(self, tmp_path, monkeypatch, write_repo_yaml):
         """Should detect repo config file as source."""
 
         # Setup
-        monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("HOME", str(tmp_path / "home"))
         # Clear OPENAI_API_KEY to prevent env var interference
         monkeypatch.delenv("OPENAI_API_KEY", raising=False)
 
         # Create repo config
-        config_dir = tmp_path / ".gitctx"
-        config_dir.mkdir()
-        config_file = config_dir / "config.yml"
-        config_file.write_text("search:\n  limit: 25\n")
+        write_repo_yaml(b"search:\n  limit: 25\n")
 
         # Act
         settings = GitCtxSettings()
@@ -351,7 +343,7 @@ class TestConfigErrorHandling:
         config_file = tmp_path / ".gitctx" / "config.yml"
         config_file.parent.mkdir(parents=True, exist_ok=True)
         # Set to default value (limit 10 is default)
-        config_file.write_text("search:\n  limit: 10\n")
+        config_file.write_bytes(b"search:\n  limit: 10\n")
 
         settings = GitCtxSettings()
         source = settings.get_source("search.limit")
@@ -366,7 +358,7 @@ class TestConfigErrorHandling:
 
         # Create user config with API key
         config_file = temp_home / ".gitctx" / "config.yml"
-        config_file.write_text("api_keys:\n  openai: sk-secret789\n")
+        config_file.write_bytes(b"api_keys:\n  openai: sk-secret789\n")
 
         settings = GitCtxSettings()
         # This should exercise the hasattr(current, "get_secret_value") path
@@ -393,52 +385,46 @@ class TestConfigErrorHandling:
 
         # Create valid user config first so initialization succeeds
         config_file = temp_home / ".gitctx" / "config.yml"
-        config_file.write_text("api_keys:\n  openai: sk-test123\n")
+        config_file.write_bytes(b"api_keys:\n  openai: sk-test123\n")
 
         settings = GitCtxSettings()
 
         # Now corrupt the file AFTER initialization but BEFORE get_source reads it
-        config_file.write_text("api_keys:\n  openai: [unclosed")
+        config_file.write_bytes(b"api_keys:\n  openai: [unclosed")
 
         # Should handle YAML error gracefully and return default
         source = settings.get_source("api_keys.openai")
         assert source == "(default)"
 
-    def test_get_source_repo_config_missing_nested_key(self, tmp_path, monkeypatch):
+    def test_get_source_repo_config_missing_nested_key(
+        self, tmp_path, monkeypatch, write_repo_yaml
+    ):
         """Test get_source when nested dict navigation fails in repo config."""
 
-        monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("HOME", str(tmp_path / "home"))
         monkeypatch.delenv("OPENAI_API_KEY", raising=False)
 
         # Create repo config without the searched key
-        config_dir = tmp_path / ".gitctx"
-        config_dir.mkdir()
-        config_file = config_dir / "config.yml"
-        config_file.write_text("search:\n  rerank: true\n")
+        write_repo_yaml(b"search:\n  rerank: true\n")
 
         settings = GitCtxSettings()
         # Should return default when nested key missing
         source = settings.get_source("index.chunk_size")
         assert source == "(default)"
 
-    def test_get_source_repo_config_yaml_error(self, tmp_path, monkeypatch):
+    def test_get_source_repo_config_yaml_error(self, tmp_path, monkeypatch, write_repo_yaml):
         """Test get_source handles YAML parsing errors in repo config."""
 
-        monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("HOME", str(tmp_path / "home"))
         monkeypatch.delenv("OPENAI_API_KEY", raising=False)
 
         # Create valid repo config first so initialization succeeds
-        config_dir = tmp_path / ".gitctx"
-        config_dir.mkdir()
-        config_file = config_dir / "config.yml"
-        config_file.write_text("search:\n  limit: 20\n")
+        config_file = write_repo_yaml(b"search:\n  limit: 20\n")
 
         settings = GitCtxSettings()
 
         # Now corrupt the file AFTER initialization but BEFORE get_source reads it
-        config_file.write_text("search:\n  limit: {invalid yaml")
+        config_file.write_bytes(b"search:\n  limit: {invalid yaml")
 
         # Should handle YAML error gracefully and return default
         source = settings.get_source("search.limit")
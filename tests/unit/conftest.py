@@ -17,6 +17,19 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    """Drop memoized config parses after each test.
+
+    temp_home reuses one HOME per session, so the next test can write the same
+    config path again within one mtime tick and hit a stale parse.
+    """
+    yield
+    from gitctx.config.settings import RepoConfig
+
+    RepoConfig.clear_cache()
+
+
 @pytest.fixture
 def isolated_env(temp_home: Path, monkeypatch):
     """
@@ -39,6 +52,10 @@ def isolated_env(temp_home: Path, monkeypatch):
     Returns:
         Path: The isolated home directory (temp_home)
 
+    The HOME directory itself comes from temp_home and is allocated once per
+    session (per xdist worker), so this fixture only touches the environment.
+    It does not chdir; request isolated_cli_runner for a working directory.
+
     See also:
     - temp_home: Creates isolated ~/.gitctx directory
     - isolated_cli_runner: Full CLI isolation with working directory
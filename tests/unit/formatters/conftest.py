@@ -0,0 +1,28 @@
+"""Formatter test fixtures."""
+
+from __future__ import annotations
+
+from io import StringIO
+from typing import cast
+
+import pytest
+from rich.console import Console
+
+
+@pytest.fixture(scope="module")
+def _module_console() -> Console:
+    """Plain-text Console built once per test module (construction probes the environment)."""
+    return Console(file=StringIO(), legacy_windows=False, width=200, markup=False)
+
+
+@pytest.fixture
+def console(_module_console: Console) -> Console:
+    """Shared plain-text Console, writing to a fresh StringIO for each test."""
+    _module_console.file = StringIO()
+    return _module_console
+
+
+@pytest.fixture
+def output(console: Console) -> StringIO:
+    """The StringIO the console fixture writes to in this test."""
+    return cast(StringIO, console.file)
@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
-import re
 from io import StringIO
+from types import MappingProxyType
 
+import pytest
 import yaml
 from rich.console import Console
 
 from gitctx.formatters.mcp import MCPFormatter
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Read-only result shared by the tests; each overrides only the fields it checks
+_BASE_RESULT = MappingProxyType(
+    {
+        "file_path": "test.py",
+        "start_line": 1,
+        "end_line": 5,
+        "_distance": 0.85,
+        "commit_sha": "abc1234",  # pragma: allowlist secret
+        "chunk_content": "code",
+        "language": "python",
+    }
+)
+
 
 def test_mcp_formatter_has_name_and_description() -> None:
     """Test that MCPFormatter has required name and description attributes."""
@@ -21,23 +40,11 @@ def test_mcp_formatter_has_name_and_description() -> None:
     assert len(formatter.description) > 0
 
 
-def test_mcp_formatter_starts_with_yaml_delimiter() -> None:
+def test_mcp_formatter_starts_with_yaml_delimiter(console: Console, output: StringIO) -> None:
     """Test that output starts with YAML frontmatter delimiter."""
 
-    results = [
-        {
-            "file_path": "test.py",
-            "start_line": 1,
-            "end_line": 5,
-            "_distance": 0.85,
-            "commit_sha": "abc1234",  # pragma: allowlist secret
-            "chunk_content": "code",
-            "language": "python",
-        }
-    ]
+    results = [_BASE_RESULT]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -46,23 +53,11 @@ def test_mcp_formatter_starts_with_yaml_delimiter() -> None:
     assert result.startswith("---")
 
 
-def test_mcp_formatter_yaml_has_results_key() -> None:
+def test_mcp_formatter_yaml_has_results_key(console: Console, output: StringIO) -> None:
     """Test that YAML frontmatter has 'results:' key."""
 
-    results = [
-        {
-            "file_path": "test.py",
-            "start_line": 1,
-            "end_line": 5,
-            "_distance": 0.85,
-            "commit_sha": "abc1234",  # pragma: allowlist secret
-            "chunk_content": "code",
-            "language": "python",
-        }
-    ]
+    results = [_BASE_RESULT]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -71,23 +66,11 @@ def test_mcp_formatter_yaml_has_results_key() -> None:
     assert "results:" in result
 
 
-def test_mcp_formatter_yaml_array_structure() -> None:
+def test_mcp_formatter_yaml_array_structure(console: Console, output: StringIO) -> None:
     """Test that results are formatted as YAML array with list items."""
 
-    results = [
-        {
-            "file_path": "test.py",
-            "start_line": 1,
-            "end_line": 5,
-            "_distance": 0.85,
-            "commit_sha": "abc1234",  # pragma: allowlist secret
-            "chunk_content": "code",
-            "language": "python",
-        }
-    ]
+    results = [_BASE_RESULT]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -97,23 +80,20 @@ def test_mcp_formatter_yaml_array_structure() -> None:
     assert ("- " in result and "file_path:" in result) or "- file_path:" in result
 
 
-def test_mcp_formatter_yaml_has_file_path() -> None:
+def test_mcp_formatter_yaml_has_file_path(console: Console, output: StringIO) -> None:
     """Test that YAML contains file_path field."""
 
     results = [
         {
+            **_BASE_RESULT,
             "file_path": "src/auth.py",
             "start_line": 10,
             "end_line": 20,
             "_distance": 0.92,
             "commit_sha": "def456",  # pragma: allowlist secret
-            "chunk_content": "code",
-            "language": "python",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -122,23 +102,17 @@ def test_mcp_formatter_yaml_has_file_path() -> None:
     assert "file_path: src/auth.py" in result
 
 
-def test_mcp_formatter_yaml_has_line_numbers() -> None:
+def test_mcp_formatter_yaml_has_line_numbers(console: Console, output: StringIO) -> None:
     """Test that YAML contains line_numbers field with range."""
 
     results = [
         {
-            "file_path": "test.py",
+            **_BASE_RESULT,
             "start_line": 45,
             "end_line": 52,
-            "_distance": 0.85,
-            "commit_sha": "abc1234",  # pragma: allowlist secret
-            "chunk_content": "code",
-            "language": "python",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -147,23 +121,16 @@ def test_mcp_formatter_yaml_has_line_numbers() -> None:
     assert "line_numbers: 45-52" in result
 
 
-def test_mcp_formatter_yaml_has_score_three_decimals() -> None:
+def test_mcp_formatter_yaml_has_score_three_decimals(console: Console, output: StringIO) -> None:
     """Test that YAML score has 3 decimal places."""
 
     results = [
         {
-            "file_path": "test.py",
-            "start_line": 1,
-            "end_line": 5,
+            **_BASE_RESULT,
             "_distance": 0.85432,
-            "commit_sha": "abc1234",  # pragma: allowlist secret
-            "chunk_content": "code",
-            "language": "python",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -173,23 +140,16 @@ def test_mcp_formatter_yaml_has_score_three_decimals() -> None:
     assert "0.8543" not in result
 
 
-def test_mcp_formatter_yaml_has_commit_sha() -> None:
+def test_mcp_formatter_yaml_has_commit_sha(console: Console, output: StringIO) -> None:
     """Test that YAML contains full commit SHA."""
 
     results = [
         {
-            "file_path": "test.py",
-            "start_line": 1,
-            "end_line": 5,
-            "_distance": 0.85,
+            **_BASE_RESULT,
             "commit_sha": "f9e8d7c1234567890abcdef",  # pragma: allowlist secret
-            "chunk_content": "code",
-            "language": "python",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -198,23 +158,19 @@ def test_mcp_formatter_yaml_has_commit_sha() -> None:
     assert "commit_sha: f9e8d7c1234567890abcdef" in result  # pragma: allowlist secret
 
 
-def test_mcp_formatter_yaml_parses_successfully() -> None:
+def test_mcp_formatter_yaml_parses_successfully(console: Console, output: StringIO) -> None:
     """Test that YAML frontmatter is valid and parseable."""
 
     results = [
         {
-            "file_path": "test.py",
+            **_BASE_RESULT,
             "start_line": 10,
             "end_line": 20,
             "_distance": 0.920,
             "commit_sha": "abc123",  # pragma: allowlist secret
-            "chunk_content": "code",
-            "language": "python",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -227,30 +183,27 @@ def test_mcp_formatter_yaml_parses_successfully() -> None:
     yaml_content = parts[1]
 
     # Should parse without error
-    data = yaml.safe_load(yaml_content)
+    data = yaml.load(yaml_content, Loader=_YamlLoader)
     assert "results" in data
     assert isinstance(data["results"], list)
     assert len(data["results"]) == 1
     assert data["results"][0]["file_path"] == "test.py"
 
 
-def test_mcp_formatter_markdown_headers() -> None:
+def test_mcp_formatter_markdown_headers(console: Console, output: StringIO) -> None:
     """Test that markdown body contains headers with file:line."""
 
     results = [
         {
+            **_BASE_RESULT,
             "file_path": "src/auth.py",
             "start_line": 45,
             "end_line": 52,
             "_distance": 0.92,
             "commit_sha": "def456",  # pragma: allowlist secret
-            "chunk_content": "code",
-            "language": "python",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -259,23 +212,19 @@ def test_mcp_formatter_markdown_headers() -> None:
     assert "## src/auth.py:45-52" in result
 
 
-def test_mcp_formatter_metadata_line() -> None:
+def test_mcp_formatter_metadata_line(console: Console, output: StringIO) -> None:
     """Test that markdown body contains metadata line with score and commit."""
 
     results = [
         {
-            "file_path": "test.py",
+            **_BASE_RESULT,
             "start_line": 10,
             "end_line": 20,
             "_distance": 0.875,
             "commit_sha": "f9e8d7c1234567",  # pragma: allowlist secret
-            "chunk_content": "code",
-            "language": "python",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -285,23 +234,18 @@ def test_mcp_formatter_metadata_line() -> None:
     assert "**Commit:** f9e8d7c" in result
 
 
-def test_mcp_formatter_code_blocks_with_language() -> None:
+def test_mcp_formatter_code_blocks_with_language(console: Console, output: StringIO) -> None:
     """Test that code blocks include language tags."""
 
     results = [
         {
+            **_BASE_RESULT,
             "file_path": "test.js",
-            "start_line": 1,
-            "end_line": 5,
-            "_distance": 0.85,
-            "commit_sha": "abc1234",  # pragma: allowlist secret
             "chunk_content": "function test() { return 42; }",
             "language": "javascript",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -312,7 +256,7 @@ def test_mcp_formatter_code_blocks_with_language() -> None:
     assert "```" in result
 
 
-def test_mcp_formatter_language_fallback_markdown() -> None:
+def test_mcp_formatter_language_fallback_markdown(console: Console, output: StringIO) -> None:
     """Test that missing language falls back to markdown."""
 
     results = [
@@ -327,8 +271,6 @@ def test_mcp_formatter_language_fallback_markdown() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -339,33 +281,30 @@ def test_mcp_formatter_language_fallback_markdown() -> None:
     assert "some content" in result
 
 
-def test_mcp_formatter_escapes_yaml_special_chars() -> None:
+def test_mcp_formatter_escapes_yaml_special_chars(console: Console, output: StringIO) -> None:
     """Test that file paths with YAML special chars are properly escaped."""
 
     # Test paths with YAML special characters
     results = [
         {
+            **_BASE_RESULT,
             "file_path": 'src/auth.py: "password"',  # Colon + quotes
             "start_line": 10,
             "end_line": 20,
-            "_distance": 0.85,
             "commit_sha": "abc123def456",  # pragma: allowlist secret
             "chunk_content": "def test(): pass",
-            "language": "python",
         },
         {
+            **_BASE_RESULT,
             "file_path": "C:\\Users\\file.py",  # Windows path (backslashes)
             "start_line": 30,
             "end_line": 40,
             "_distance": 0.75,
             "commit_sha": "def456ghi789",  # pragma: allowlist secret
             "chunk_content": "# Windows path",
-            "language": "python",
         },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200, markup=False)
     formatter = MCPFormatter()
 
     formatter.format(results, console)
@@ -373,16 +312,130 @@ def test_mcp_formatter_escapes_yaml_special_chars() -> None:
     result = output.getvalue()
 
     # Extract YAML frontmatter (between --- markers)
-    yaml_match = re.search(r"^---\n(.*?)\n---", result, re.DOTALL)
-    assert yaml_match, "YAML frontmatter not found"
-
-    yaml_content = yaml_match.group(1)
+    assert result.startswith("---\n"), "YAML frontmatter not found"
+    yaml_content = result.split("---\n", 2)[1]
 
     # Parse YAML to ensure it's valid
-    parsed = yaml.safe_load(yaml_content)
+    parsed = yaml.load(yaml_content, Loader=_YamlLoader)
 
     # Verify structure
     assert "results" in parsed
     assert len(parsed["results"]) == 2
     assert parsed["results"][0]["file_path"] == 'src/auth.py: "password"'
     assert parsed["results"][1]["file_path"] == "C:\\Users\\file.py"
+
+
+def test_mcp_formatter_quotes_scalars_yaml_would_retype(console: Console, output: StringIO) -> None:
+    """Test that numeric-looking SHAs and YAML keywords stay strings."""
+
+    results = [
+        {
+            **_BASE_RESULT,
+            "file_path": "yes",
+            "commit_sha": "1234567e1",  # pragma: allowlist secret
+        },
+    ]
+
+    formatter = MCPFormatter()
+
+    formatter.format(results, console)
+
+    parsed = yaml.load(output.getvalue().split("---")[1], Loader=_YamlLoader)
+    assert parsed["results"][0]["file_path"] == "yes"
+    assert parsed["results"][0]["commit_sha"] == "1234567e1"  # pragma: allowlist secret
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    [
+        "docs/My File.md",
+        "2024/notes.md",
+        "Null",
+        "tab\there",
+        "line\nbreak",
+        "nel\x85sep\u2028",
+        "bell\x07del\x7f",
+        "日本/ファイル.py",
+        "- [x] & *ref !tag",
+    ],
+)
+def test_mcp_formatter_quoted_paths_round_trip(
+    file_path: str, console: Console, output: StringIO
+) -> None:
+    """Test that paths needing quotes parse back to the exact original string."""
+
+    results = [
+        {
+            **_BASE_RESULT,
+            "file_path": file_path,
+        },
+    ]
+
+    formatter = MCPFormatter()
+
+    formatter.format(results, console)
+
+    frontmatter = output.getvalue().split("---\n")[1]
+    parsed = yaml.load(frontmatter, Loader=_YamlLoader)
+    assert parsed["results"][0]["file_path"] == file_path
+    assert frontmatter.count("\n") == 5  # Every scalar stays on one line
+
+
+def test_mcp_formatter_quotes_str_subclasses(console: Console, output: StringIO) -> None:
+    """Test that str subclasses needing quotes are emitted like plain strings."""
+
+    class PathStr(str):
+        pass
+
+    results = [
+        {
+            **_BASE_RESULT,
+            "file_path": PathStr("src/a.py: b"),
+            "commit_sha": PathStr("abc1234"),
+        },
+    ]
+
+    formatter = MCPFormatter()
+
+    formatter.format(results, console)
+
+    parsed = yaml.load(output.getvalue().split("---")[1], Loader=_YamlLoader)
+    assert parsed["results"][0]["file_path"] == "src/a.py: b"
+    assert parsed["results"][0]["commit_sha"] == "abc1234"
+
+
+def test_mcp_formatter_writes_code_verbatim_on_rich_terminal() -> None:
+    """Test that markup-like code survives a markup-enabled, colored console."""
+
+    code = "x = data[bold]\n" + "y = [1, 2]  # " + "z" * 150
+    results = [
+        {
+            **_BASE_RESULT,
+            "chunk_content": code,
+        },
+    ]
+
+    output = StringIO()
+    console = Console(file=output, force_terminal=True, color_system="truecolor", width=80)
+    formatter = MCPFormatter()
+
+    formatter.format(results, console)
+
+    text = output.getvalue()
+    assert "\x1b[" not in text
+    assert f"```python\n{code}\n```" in text
+
+
+def test_mcp_formatter_recording_console_keeps_output() -> None:
+    """Test that a recording console still captures the document for export."""
+
+    results = [_BASE_RESULT]
+
+    output = StringIO()
+    console = Console(file=output, record=True, width=200)
+    formatter = MCPFormatter()
+
+    formatter.format(results, console)
+
+    assert console.export_text() == output.getvalue()
+    assert "```python\ncode\n```" in output.getvalue()
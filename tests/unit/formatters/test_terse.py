@@ -3,10 +3,25 @@
 from __future__ import annotations
 
 from io import StringIO
+from types import MappingProxyType
 
 from rich.console import Console
 
-from gitctx.formatters.terse import TerseFormatter
+from gitctx.formatters.terse import TerseFormatter, _format_date
+
+# Read-only result shared by the tests; each overrides only the fields it checks
+_BASE_RESULT = MappingProxyType(
+    {
+        "file_path": "src/auth.py",
+        "start_line": 45,
+        "_distance": 0.92,
+        "is_head": False,
+        "commit_sha": "f9e8d7c",  # pragma: allowlist secret
+        "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
+        "author_name": "Alice",
+        "commit_message": "Add OAuth",
+    }
+)
 
 
 def test_terse_formatter_has_name_and_description() -> None:
@@ -19,25 +34,21 @@ def test_terse_formatter_has_name_and_description() -> None:
     assert len(formatter.description) > 0
 
 
-def test_terse_formatter_single_line_format() -> None:
+def test_terse_formatter_single_line_format(console: Console, output: StringIO) -> None:
     """Test that TerseFormatter outputs one line per result."""
 
     results = [
         {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
+            **_BASE_RESULT,
             "is_head": True,
             "commit_sha": "f9e8d7c1234",  # pragma: allowlist secret
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
             "commit_message": "Add OAuth support",
         },
         {
+            **_BASE_RESULT,
             "file_path": "src/login.py",
             "start_line": 23,
             "_distance": 0.76,
-            "is_head": False,
             "commit_sha": "abc1234",  # pragma: allowlist secret
             "commit_date": 1758268800,  # Unix timestamp for 2025-09-15
             "author_name": "Bob",
@@ -45,8 +56,6 @@ def test_terse_formatter_single_line_format() -> None:
         },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -55,24 +64,11 @@ def test_terse_formatter_single_line_format() -> None:
     assert len(lines) == 2
 
 
-def test_terse_formatter_includes_file_path() -> None:
+def test_terse_formatter_includes_file_path(console: Console, output: StringIO) -> None:
     """Test that output includes file path."""
 
-    results = [
-        {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
-            "is_head": False,
-            "commit_sha": "f9e8d7c",
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
-            "commit_message": "Add OAuth",
-        }
-    ]
+    results = [_BASE_RESULT]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -80,24 +76,11 @@ def test_terse_formatter_includes_file_path() -> None:
     assert "src/auth.py" in output.getvalue()
 
 
-def test_terse_formatter_includes_line_number() -> None:
+def test_terse_formatter_includes_line_number(console: Console, output: StringIO) -> None:
     """Test that output includes line number."""
 
-    results = [
-        {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
-            "is_head": False,
-            "commit_sha": "f9e8d7c",
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
-            "commit_message": "Add OAuth",
-        }
-    ]
+    results = [_BASE_RESULT]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -105,24 +88,16 @@ def test_terse_formatter_includes_line_number() -> None:
     assert ":45:" in output.getvalue()
 
 
-def test_terse_formatter_includes_score_two_decimals() -> None:
+def test_terse_formatter_includes_score_two_decimals(console: Console, output: StringIO) -> None:
     """Test that score is formatted with 2 decimal places."""
 
     results = [
         {
-            "file_path": "src/auth.py",
-            "start_line": 45,
+            **_BASE_RESULT,
             "_distance": 0.92345,
-            "is_head": False,
-            "commit_sha": "f9e8d7c",
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
-            "commit_message": "Add OAuth",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -131,24 +106,16 @@ def test_terse_formatter_includes_score_two_decimals() -> None:
     assert "0.923" not in output.getvalue()
 
 
-def test_terse_formatter_includes_commit_sha_short() -> None:
+def test_terse_formatter_includes_commit_sha_short(console: Console, output: StringIO) -> None:
     """Test that commit SHA is shortened to 7 characters."""
 
     results = [
         {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
-            "is_head": False,
+            **_BASE_RESULT,
             "commit_sha": "f9e8d7c1234567890",  # pragma: allowlist secret
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
-            "commit_message": "Add OAuth",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -158,24 +125,11 @@ def test_terse_formatter_includes_commit_sha_short() -> None:
     assert "f9e8d7c1234567890" not in result  # pragma: allowlist secret
 
 
-def test_terse_formatter_includes_commit_date() -> None:
+def test_terse_formatter_includes_commit_date(console: Console, output: StringIO) -> None:
     """Test that commit date is included."""
 
-    results = [
-        {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
-            "is_head": False,
-            "commit_sha": "f9e8d7c",
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
-            "commit_message": "Add OAuth",
-        }
-    ]
+    results = [_BASE_RESULT]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -183,24 +137,11 @@ def test_terse_formatter_includes_commit_date() -> None:
     assert "2025-10-02" in output.getvalue()
 
 
-def test_terse_formatter_includes_author_name() -> None:
+def test_terse_formatter_includes_author_name(console: Console, output: StringIO) -> None:
     """Test that author name is included."""
 
-    results = [
-        {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
-            "is_head": False,
-            "commit_sha": "f9e8d7c",
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
-            "commit_message": "Add OAuth",
-        }
-    ]
+    results = [_BASE_RESULT]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -208,24 +149,18 @@ def test_terse_formatter_includes_author_name() -> None:
     assert "Alice" in output.getvalue()
 
 
-def test_terse_formatter_includes_commit_message_truncated() -> None:
+def test_terse_formatter_includes_commit_message_truncated(
+    console: Console, output: StringIO
+) -> None:
     """Test that commit message is included."""
 
     results = [
         {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
-            "is_head": False,
-            "commit_sha": "f9e8d7c",
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
+            **_BASE_RESULT,
             "commit_message": "Add OAuth support for GitHub and GitLab",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -233,24 +168,16 @@ def test_terse_formatter_includes_commit_message_truncated() -> None:
     assert "Add OAuth" in output.getvalue()
 
 
-def test_terse_formatter_head_marker_modern_terminal() -> None:
+def test_terse_formatter_head_marker_modern_terminal(console: Console, output: StringIO) -> None:
     """Test that HEAD marker shows ● on modern terminals."""
 
     results = [
         {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
+            **_BASE_RESULT,
             "is_head": True,
-            "commit_sha": "f9e8d7c",
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
-            "commit_message": "Add OAuth",
-        }
+        },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -263,15 +190,9 @@ def test_terse_formatter_head_marker_legacy_windows() -> None:
 
     results = [
         {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
+            **_BASE_RESULT,
             "is_head": True,
-            "commit_sha": "f9e8d7c",
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
-            "commit_message": "Add OAuth",
-        }
+        },
     ]
 
     output = StringIO()
@@ -283,24 +204,11 @@ def test_terse_formatter_head_marker_legacy_windows() -> None:
     assert "[HEAD]" in output.getvalue()
 
 
-def test_terse_formatter_historic_no_marker() -> None:
+def test_terse_formatter_historic_no_marker(console: Console, output: StringIO) -> None:
     """Test that historic commits show no marker (space character)."""
 
-    results = [
-        {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
-            "is_head": False,
-            "commit_sha": "f9e8d7c",
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
-            "commit_message": "Add OAuth",
-        }
-    ]
+    results = [_BASE_RESULT]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -312,28 +220,17 @@ def test_terse_formatter_historic_no_marker() -> None:
     assert "[HEAD]" not in result
 
 
-def test_terse_formatter_message_truncated_at_50_chars() -> None:
+def test_terse_formatter_message_truncated_at_50_chars(console: Console, output: StringIO) -> None:
     """Test that commit message is truncated to 50 characters."""
 
     results = [
         {
-            "file_path": "src/auth.py",
-            "start_line": 45,
-            "_distance": 0.92,
-            "is_head": False,
-            "commit_sha": "f9e8d7c",
-            "commit_date": 1759388400,  # Unix timestamp for 2025-10-02
-            "author_name": "Alice",
-            "commit_message": (
-                "This is a very long commit message that should be "
-                "truncated at fifty characters exactly"
-            ),
-        }
+            **_BASE_RESULT,
+            "commit_message": "This is a very long commit message that should be "
+            "truncated at fifty characters exactly",
+        },
     ]
 
-    output = StringIO()
-    # Use large width to prevent console from truncating the line
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
@@ -345,15 +242,51 @@ def test_terse_formatter_message_truncated_at_50_chars() -> None:
     assert "exactly" not in result
 
 
-def test_terse_formatter_zero_results_empty_output() -> None:
+def test_terse_formatter_zero_results_empty_output(console: Console, output: StringIO) -> None:
     """Test that zero results produces no output lines."""
 
     results: list[dict] = []
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False)
     formatter = TerseFormatter()
 
     formatter.format(results, console)
 
     assert output.getvalue() == ""
+
+
+def test_terse_formatter_prints_brackets_verbatim_on_rich_terminal() -> None:
+    """Test that bracketed paths and messages are not read as Rich markup."""
+
+    results = [
+        {
+            **_BASE_RESULT,
+            "file_path": "app/[id]/page.tsx",
+            "start_line": 4,
+            "_distance": 0.9,
+            "is_head": True,
+            "commit_message": "Fix [bold] route",
+        },
+    ]
+
+    output = StringIO()
+    console = Console(file=output, force_terminal=True, color_system="truecolor")
+    formatter = TerseFormatter()
+
+    formatter.format(results, console)
+
+    result = output.getvalue()
+    assert result.startswith("app/[id]/page.tsx:4:0.90 ● f9e8d7c (")
+    assert result.endswith('Alice) "Fix [bold] route"\n')
+    assert "\x1b[" not in result
+
+
+def test_terse_formatter_formats_each_commit_date_once(console: Console, output: StringIO) -> None:
+    """Test that chunks sharing a commit timestamp reuse one formatted date."""
+
+    _format_date.cache_clear()
+    formatter = TerseFormatter()
+
+    formatter.format([_BASE_RESULT, {**_BASE_RESULT, "start_line": 90}], console)
+
+    assert output.getvalue().count("2025-10-02") == 2
+    assert _format_date.cache_info().misses == 1
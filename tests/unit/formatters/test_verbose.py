@@ -4,11 +4,18 @@ from __future__ import annotations
 
 from io import StringIO
 
+import pytest
 from rich.console import Console
 
 from gitctx.formatters.verbose import VerboseFormatter
 
 
+@pytest.fixture(scope="module")
+def _module_console() -> Console:
+    """Markup-enabled shared Console: verbose output uses Rich markup and Syntax."""
+    return Console(file=StringIO(), legacy_windows=False, width=200)
+
+
 def test_verbose_formatter_has_name_and_description() -> None:
     """Test that VerboseFormatter has required name and description attributes."""
 
@@ -19,7 +26,7 @@ def test_verbose_formatter_has_name_and_description() -> None:
     assert len(formatter.description) > 0
 
 
-def test_verbose_formatter_multiline_format() -> None:
+def test_verbose_formatter_multiline_format(console: Console, output: StringIO) -> None:
     """Test that VerboseFormatter outputs multiple lines per result."""
 
     results = [
@@ -36,8 +43,6 @@ def test_verbose_formatter_multiline_format() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -47,7 +52,7 @@ def test_verbose_formatter_multiline_format() -> None:
     assert len(lines) > 3
 
 
-def test_verbose_formatter_header_with_line_range() -> None:
+def test_verbose_formatter_header_with_line_range(console: Console, output: StringIO) -> None:
     """Test that header includes file path with line range."""
 
     results = [
@@ -64,8 +69,6 @@ def test_verbose_formatter_header_with_line_range() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -74,7 +77,7 @@ def test_verbose_formatter_header_with_line_range() -> None:
     assert "src/auth.py:45-52" in result
 
 
-def test_verbose_formatter_score_in_header() -> None:
+def test_verbose_formatter_score_in_header(console: Console, output: StringIO) -> None:
     """Test that score appears in header with 2 decimal places."""
 
     results = [
@@ -91,8 +94,6 @@ def test_verbose_formatter_score_in_header() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -102,7 +103,7 @@ def test_verbose_formatter_score_in_header() -> None:
     assert "0.923" not in result
 
 
-def test_verbose_formatter_head_marker_in_header() -> None:
+def test_verbose_formatter_head_marker_in_header(console: Console, output: StringIO) -> None:
     """Test that HEAD marker appears in header for HEAD commits."""
 
     results = [
@@ -119,8 +120,6 @@ def test_verbose_formatter_head_marker_in_header() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -130,7 +129,7 @@ def test_verbose_formatter_head_marker_in_header() -> None:
     assert "●" in result or "[HEAD]" in result
 
 
-def test_verbose_formatter_commit_sha_in_header() -> None:
+def test_verbose_formatter_commit_sha_in_header(console: Console, output: StringIO) -> None:
     """Test that commit SHA (7 chars) appears in header."""
 
     results = [
@@ -147,8 +146,6 @@ def test_verbose_formatter_commit_sha_in_header() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -158,7 +155,7 @@ def test_verbose_formatter_commit_sha_in_header() -> None:
     assert "f9e8d7c1234567890" not in result  # pragma: allowlist secret
 
 
-def test_verbose_formatter_metadata_line_dimmed() -> None:
+def test_verbose_formatter_metadata_line_dimmed(console: Console, output: StringIO) -> None:
     """Test that metadata line contains commit message."""
 
     results = [
@@ -175,8 +172,6 @@ def test_verbose_formatter_metadata_line_dimmed() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -185,7 +180,7 @@ def test_verbose_formatter_metadata_line_dimmed() -> None:
     assert "Add OAuth support for GitHub" in result
 
 
-def test_verbose_formatter_syntax_highlighting() -> None:
+def test_verbose_formatter_syntax_highlighting(console: Console, output: StringIO) -> None:
     """Test that syntax highlighting is applied (ANSI codes present)."""
 
     results = [
@@ -202,8 +197,6 @@ def test_verbose_formatter_syntax_highlighting() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -214,7 +207,7 @@ def test_verbose_formatter_syntax_highlighting() -> None:
     assert "authenticate" in result
 
 
-def test_verbose_formatter_line_numbers_enabled() -> None:
+def test_verbose_formatter_line_numbers_enabled(console: Console, output: StringIO) -> None:
     """Test that line numbers are shown in code block."""
 
     results = [
@@ -231,8 +224,6 @@ def test_verbose_formatter_line_numbers_enabled() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -242,7 +233,7 @@ def test_verbose_formatter_line_numbers_enabled() -> None:
     assert "45" in result or "46" in result
 
 
-def test_verbose_formatter_start_line_offset() -> None:
+def test_verbose_formatter_start_line_offset(console: Console, output: StringIO) -> None:
     """Test that line numbers start at correct offset."""
 
     results = [
@@ -259,8 +250,6 @@ def test_verbose_formatter_start_line_offset() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -270,7 +259,7 @@ def test_verbose_formatter_start_line_offset() -> None:
     assert "100" in result or "101" in result
 
 
-def test_verbose_formatter_theme_monokai() -> None:
+def test_verbose_formatter_theme_monokai(console: Console, output: StringIO) -> None:
     """Test that monokai theme is used (implicit - just verify no crash)."""
 
     results = [
@@ -287,8 +276,6 @@ def test_verbose_formatter_theme_monokai() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     # Should not crash with monokai theme
@@ -297,7 +284,7 @@ def test_verbose_formatter_theme_monokai() -> None:
     assert len(result) > 0
 
 
-def test_verbose_formatter_language_from_result() -> None:
+def test_verbose_formatter_language_from_result(console: Console, output: StringIO) -> None:
     """Test that language is taken from result metadata."""
 
     results = [
@@ -314,8 +301,6 @@ def test_verbose_formatter_language_from_result() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -325,7 +310,7 @@ def test_verbose_formatter_language_from_result() -> None:
     assert "function" in result
 
 
-def test_verbose_formatter_language_fallback_markdown() -> None:
+def test_verbose_formatter_language_fallback_markdown(console: Console, output: StringIO) -> None:
     """Test that unknown/missing language falls back to markdown."""
 
     results = [
@@ -342,8 +327,6 @@ def test_verbose_formatter_language_fallback_markdown() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     # Should not crash with missing language
@@ -353,7 +336,7 @@ def test_verbose_formatter_language_fallback_markdown() -> None:
     assert "some random content" in result
 
 
-def test_verbose_formatter_blank_line_separator() -> None:
+def test_verbose_formatter_blank_line_separator(console: Console, output: StringIO) -> None:
     """Test that results are separated by blank lines."""
 
     results = [
@@ -381,8 +364,6 @@ def test_verbose_formatter_blank_line_separator() -> None:
         },
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     formatter.format(results, console)
@@ -395,7 +376,7 @@ def test_verbose_formatter_blank_line_separator() -> None:
     assert "\n\n" in result
 
 
-def test_verbose_formatter_custom_theme() -> None:
+def test_verbose_formatter_custom_theme(console: Console, output: StringIO) -> None:
     """Test that custom theme is used for syntax highlighting."""
 
     results = [
@@ -412,8 +393,6 @@ def test_verbose_formatter_custom_theme() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     # Test with custom theme
@@ -425,7 +404,7 @@ def test_verbose_formatter_custom_theme() -> None:
     assert "def test(): pass" in result
 
 
-def test_verbose_formatter_default_theme() -> None:
+def test_verbose_formatter_default_theme(console: Console, output: StringIO) -> None:
     """Test that default theme (monokai) is used when not specified."""
 
     results = [
@@ -442,8 +421,6 @@ def test_verbose_formatter_default_theme() -> None:
         }
     ]
 
-    output = StringIO()
-    console = Console(file=output, legacy_windows=False, width=200)
     formatter = VerboseFormatter()
 
     # Call without theme parameter (should use default)
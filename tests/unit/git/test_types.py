@@ -6,8 +6,10 @@ Following TDD workflow:
 3. Refactor if needed
 """
 
-from gitctx.git.types import WalkError, WalkStats
-from gitctx.indexing.types import CodeChunk
+import pytest
+
+from gitctx.git.types import BlobLocation, BlobRecord, WalkError, WalkStats
+from gitctx.indexing.types import CodeChunk, Embedding
 
 
 class TestCodeChunk:
@@ -70,6 +72,14 @@ class TestCodeChunk:
         assert chunk.content == "x = 1"
 
 
+@pytest.mark.parametrize("cls", [CodeChunk, BlobLocation, BlobRecord, Embedding])
+def test_hot_path_types_are_slotted_and_frozen(cls):
+    """Per-chunk/per-blob types carry no __dict__ and reject mutation."""
+    # ASSERT
+    assert hasattr(cls, "__slots__")
+    assert cls.__dataclass_params__.frozen
+
+
 class TestWalkStats:
     """Test suite for WalkStats dataclass."""
 
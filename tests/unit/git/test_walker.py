@@ -160,6 +160,21 @@ class TestCommitMetadataExtraction:
             expected_num = 3 - i
             assert f"Commit {expected_num}" in commit.commit_message
 
+    def test_author_strings_shared_across_commits(
+        self, git_repo_factory, config_history_mode, isolated_env
+    ):
+        """Commits by the same author reuse one interned name/email instance."""
+        # Arrange
+        repo_path = git_repo_factory(num_commits=3)
+        walker = CommitWalker(str(repo_path), config_history_mode)
+
+        # Act
+        commits = list(walker._walk_commits())
+
+        # Assert - identity, not just equality
+        assert all(c.author_name is commits[0].author_name for c in commits)
+        assert all(c.author_email is commits[0].author_email for c in commits)
+
 
 class TestMergeCommitDetection:
     """Test merge commit detection (is_merge flag)."""
@@ -525,6 +540,28 @@ class TestHeadBlobTracking:
         main_py_blob = next(b for b in blob_records if b.locations[0].file_path == "main.py")
         assert main_py_blob.locations[0].is_head is True
 
+    def test_location_language_resolved_at_walk_time(
+        self, git_repo_factory, git_isolation_base, isolated_env
+    ):
+        """Each BlobLocation carries the language of its file path."""
+        # Arrange
+        repo_path = git_repo_factory(num_commits=1)
+        (repo_path / "README.md").write_text("# Title")
+        subprocess.run(["git", "add", "."], cwd=repo_path, env=git_isolation_base, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "readme"], cwd=repo_path, env=git_isolation_base, check=True
+        )
+        walker = CommitWalker(str(repo_path), GitCtxSettings())
+
+        # Act
+        languages = {
+            loc.file_path: loc.language for b in walker.walk_blobs() for loc in b.locations
+        }
+
+        # Assert
+        assert languages["main.py"] == "python"
+        assert languages["README.md"] == "markdown"
+
     def test_historical_blob_has_is_head_false(
         self, git_repo_factory, git_isolation_base, config_history_mode, isolated_env
     ):
@@ -649,6 +686,28 @@ class TestHeadTreeBuildPerformance:
         # Assert - <100ms for 1001 blobs (main.py + 1000 test files)
         assert duration < 0.1  # 100ms
 
+    def test_head_tree_falls_back_without_git_cli(
+        self, git_repo_factory, isolated_env, monkeypatch
+    ):
+        """pygit2 traversal yields the same HEAD set when the git CLI is unavailable."""
+        # Arrange
+        repo_path = git_repo_factory(num_commits=2)
+        walker = CommitWalker(str(repo_path), GitCtxSettings())
+        listed = walker._build_head_tree()
+
+        def missing_git(*args, **kwargs):
+            raise FileNotFoundError("git")
+
+        monkeypatch.setattr("gitctx.git.walker.subprocess.run", missing_git)
+
+        # Act
+        traversed = walker._build_head_tree()
+
+        # Assert - raw 20-byte digests, identical from either source
+        assert listed
+        assert all(len(sha) == 20 for sha in listed)
+        assert traversed == listed
+
 
 # ============================================================================
 # Edge Cases & Special Repositories
@@ -907,78 +966,43 @@ class TestSubmoduleHandling:
         assert submodule_entries[0].name == "child"
 
 
+@pytest.fixture
+def symlink_tree_and_blobs(symlink_repo, isolated_env):
+    """Walk the symlink fixture once, returning its HEAD tree and blob records."""
+    walker = CommitWalker(str(symlink_repo), GitCtxSettings())
+    blob_records = list(walker.walk_blobs())
+    tree = walker.repo.head.peel().tree  # type: ignore[attr-defined]
+    return tree, blob_records
+
+
 @pytest.mark.skipif(is_windows(), reason="Symlinks not reliably supported on Windows")
 class TestSymlinkHandling:
     """Test symlink detection and skipping (Unix/Linux/macOS only)."""
 
-    def test_symlinks_are_skipped(self, symlink_repo, isolated_env):
-        """Symlinks are not indexed, only regular files."""
-        # Arrange
-        config = GitCtxSettings()
-        walker = CommitWalker(str(symlink_repo), config)
-
-        # Act
-        blob_records = list(walker.walk_blobs())
-
-        # Assert - only regular files indexed, symlinks skipped
-        file_paths = {loc.file_path for b in blob_records for loc in b.locations}
-
-        # Regular files should be present
-        assert "real_file.py" in file_paths
-        assert "target.txt" in file_paths
-
-        # Symlinks should NOT be present
-        assert "symlink_to_file.py" not in file_paths
-        assert "symlink_to_target" not in file_paths
+    # (tree entry name, expected git filemode, expected to be indexed)
+    EXPECTED_ENTRIES = (
+        ("real_file.py", 0o100644, True),
+        ("target.txt", 0o100644, True),
+        ("symlink_to_file.py", 0o120000, False),
+        ("symlink_to_target", 0o120000, False),
+    )
 
-    def test_symlink_count_vs_regular_files(self, symlink_repo, isolated_env):
-        """Only 2 regular files indexed, 2 symlinks skipped."""
+    def test_symlink_invariants(self, symlink_tree_and_blobs):
+        """Symlinks (mode 0o120000) are skipped; only the 2 regular files are indexed."""
         # Arrange
-        config = GitCtxSettings()
-        walker = CommitWalker(str(symlink_repo), config)
+        tree, blob_records = symlink_tree_and_blobs
+        modes = {e.name: e.filemode for e in tree}
+        file_paths = {loc.file_path for b in blob_records for loc in b.locations}
 
-        # Act
-        blob_records = list(walker.walk_blobs())
+        # Assert - tree holds exactly the expected entries with expected modes
+        assert len(modes) == len(self.EXPECTED_ENTRIES)
+        for name, expected_mode, expected_in_blobs in self.EXPECTED_ENTRIES:
+            assert modes[name] == expected_mode, name
+            assert (name in file_paths) is expected_in_blobs, name
 
         # Assert - exactly 2 blobs (real_file.py, target.txt)
         assert len(blob_records) == 2
 
-    def test_symlink_mode_detection(self, symlink_repo, isolated_env):
-        """Symlinks have mode 0o120000 in git tree entries."""
-        # Arrange
-        config = GitCtxSettings()
-        walker = CommitWalker(str(symlink_repo), config)
-
-        # Act - inspect the commit tree directly via pygit2
-        commit = walker.repo.head.peel()  # type: ignore[attr-defined]
-        tree = commit.tree
-
-        # Assert - find symlink entries and verify their mode
-        symlink_entries = [e for e in tree if e.filemode == 0o120000]
-        assert len(symlink_entries) == 2  # Both symlinks detected
-
-        symlink_names = {e.name for e in symlink_entries}
-        assert "symlink_to_file.py" in symlink_names
-        assert "symlink_to_target" in symlink_names
-
-    def test_regular_file_mode_is_not_symlink(self, symlink_repo, isolated_env):
-        """Regular files have mode 0o100644, not 0o120000."""
-        # Arrange
-        config = GitCtxSettings()
-        walker = CommitWalker(str(symlink_repo), config)
-
-        # Act
-        commit = walker.repo.head.peel()  # type: ignore[attr-defined]
-        tree = commit.tree
-
-        # Assert - regular files have different mode
-        regular_entries = [e for e in tree if e.type_str == "blob" and e.filemode != 0o120000]
-        assert len(regular_entries) == 2  # Both regular files
-
-        regular_names = {e.name for e in regular_entries}
-        assert "real_file.py" in regular_names
-        assert "target.txt" in regular_names
-
 
 # ============================================================================
 # Blob Filtering
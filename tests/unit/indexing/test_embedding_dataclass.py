@@ -1,8 +1,11 @@
 """Unit tests for Embedding dataclass."""
 
 from dataclasses import asdict
+from typing import get_type_hints
 
+import numpy as np
 import pytest
+from numpy.typing import NDArray
 
 from gitctx.indexing.types import Embedding
 
@@ -31,28 +34,30 @@ class TestEmbeddingDataclass:
         assert embedding.chunk_index == 0
 
     def test_embedding_uses_primitive_types(self):
-        """Test Embedding uses only primitive types (FFI-compatible)."""
-        embedding = Embedding(
-            vector=[0.1, 0.2],
-            token_count=50,
-            model="test-model",
-            cost_usd=0.00001,
-            blob_sha="sha256",
-            chunk_index=1,
-        )
+        """Test Embedding fields are primitives plus a float32 vector (FFI-compatible)."""
+        # ACT
+        hints = get_type_hints(Embedding)
 
-        # ASSERT - All primitives, no numpy/Path
-        assert isinstance(embedding.vector, list)
-        assert all(isinstance(v, float) for v in embedding.vector)
-        assert isinstance(embedding.token_count, int)
-        assert isinstance(embedding.model, str)
-        assert isinstance(embedding.cost_usd, float)
-        assert isinstance(embedding.blob_sha, str)
-        assert isinstance(embedding.chunk_index, int)
+        # ASSERT - One declared contract; no Path/object fields, the vector is the only array
+        assert hints == {
+            "vector": NDArray[np.float32],
+            "token_count": int,
+            "model": str,
+            "cost_usd": float,
+            "blob_sha": str,
+            "chunk_index": int,
+            "chunk_content": str,
+            "start_line": int,
+            "end_line": int,
+            "total_chunks": int,
+            "language": str,
+            "api_token_count": int | None,
+            "billed": bool,
+        }
 
     def test_embedding_vector_dimensions(self):
         """Test Embedding accepts 3072-dimensional vectors."""
-        vector_3072 = [0.1] * 3072
+        vector_3072 = np.full(3072, 0.1, dtype=np.float32)  # Declared vector dtype, no boxing
         embedding = Embedding(
             vector=vector_3072,
             token_count=200,
@@ -61,7 +66,8 @@ class TestEmbeddingDataclass:
             blob_sha="test_sha",
             chunk_index=0,
         )
-        assert len(embedding.vector) == 3072
+        assert embedding.vector.shape == (3072,)
+        assert embedding.vector is vector_3072  # Stored as given, not copied
 
     def test_embedding_immutability(self):
         """Test Embedding is immutable (frozen dataclass)."""
@@ -78,6 +84,30 @@ class TestEmbeddingDataclass:
         with pytest.raises((AttributeError, TypeError)):
             embedding.token_count = 100  # type: ignore
 
+    def test_embedding_equality_compares_vectors(self):
+        """Test Embeddings with ndarray vectors compare by value."""
+        # ARRANGE
+        fields = {
+            "token_count": 50,
+            "model": "test-model",
+            "cost_usd": 0.00001,
+            "blob_sha": "sha",
+            "chunk_index": 0,
+        }
+        first = Embedding(vector=np.array([0.1, 0.2], dtype=np.float32), **fields)
+        same = Embedding(vector=np.array([0.1, 0.2], dtype=np.float32), **fields)
+        other_vector = Embedding(vector=np.array([0.1, 0.3], dtype=np.float32), **fields)
+        other_field = Embedding(
+            vector=np.array([0.1, 0.2], dtype=np.float32), **{**fields, "chunk_index": 1}
+        )
+
+        # ACT & ASSERT - No "truth value of an array is ambiguous" error
+        assert first == same
+        assert first != other_vector
+        assert first != other_field
+        assert first != "not an embedding"
+        assert [first] == [same]
+
     def test_embedding_serialization(self):
         """Test Embedding can be serialized with asdict()."""
         embedding = Embedding(
@@ -96,3 +126,27 @@ class TestEmbeddingDataclass:
         assert data["vector"] == [0.1, 0.2]
         assert data["token_count"] == 50
         assert data["model"] == "test-model"
+
+    def test_embedding_to_dict_matches_asdict_without_copying_vector(self):
+        """to_dict() has asdict()'s keys and values but shares the vector."""
+        # ARRANGE
+        embedding = Embedding(
+            vector=np.array([0.1, 0.2], dtype=np.float32),
+            token_count=50,
+            model="test-model",
+            cost_usd=0.00001,
+            blob_sha="sha",
+            chunk_index=0,
+            language="python",
+        )
+
+        # ACT
+        data = embedding.to_dict()
+
+        # ASSERT
+        reference = asdict(embedding)
+        assert list(data) == list(reference)
+        assert {k: v for k, v in data.items() if k != "vector"} == {
+            k: v for k, v in reference.items() if k != "vector"
+        }
+        assert data["vector"] is embedding.vector
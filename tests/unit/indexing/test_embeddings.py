@@ -1,18 +1,67 @@
 """Unit tests for embedding orchestration helpers."""
 
+import asyncio
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
+import numpy as np
 import pytest
 
 from gitctx.git.types import BlobLocation, BlobRecord
 from gitctx.indexing.chunker import LanguageAwareChunker
-from gitctx.indexing.embeddings import embed_with_cache
+from gitctx.indexing.embeddings import (
+    embed_with_cache,
+    stream_embeddings,
+)
 from gitctx.indexing.types import CodeChunk, Embedding
 from gitctx.storage.embedding_cache import EmbeddingCache
 
 
+@pytest.fixture(scope="module")
+def shared_cache(tmp_path_factory) -> Iterator[EmbeddingCache]:
+    """One EmbeddingCache reused by every case in this module that opts in."""
+    cache = EmbeddingCache(
+        cache_dir=tmp_path_factory.mktemp("shared_cache"), model="text-embedding-3-large"
+    )
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def single_chunk_chunker() -> Mock:
+    """Chunker mock that splits any blob into one fixed chunk."""
+    chunker = Mock(spec=LanguageAwareChunker)
+    chunker.chunk_file.return_value = [
+        CodeChunk(
+            content="test",
+            start_line=1,
+            end_line=1,
+            token_count=1,
+            metadata={"chunk_index": 0, "total_chunks": 1},
+        )
+    ]
+    return chunker
+
+
+@pytest.fixture
+def single_chunk_embedder() -> AsyncMock:
+    """Embedder mock returning one embedding per call."""
+    embedder = AsyncMock()
+    embedder.embed_chunks.return_value = [
+        Embedding(
+            vector=[0.1] * 3072,
+            token_count=1,
+            model="text-embedding-3-large",
+            cost_usd=0.0000001,
+            blob_sha="test_sha",
+            chunk_index=0,
+        )
+    ]
+    return embedder
+
+
 @pytest.mark.anyio
 class TestEmbedWithCache:
     """Test embed_with_cache orchestration helper."""
@@ -68,7 +117,7 @@ class TestEmbedWithCache:
         # ASSERT - Returns cached embeddings
         assert len(result) == 1
         # Check approximate equality (safetensors uses float32, not exact floats)
-        assert all(abs(v - 0.1) < 0.001 for v in result[0].vector)
+        assert np.allclose(result[0].vector, 0.1, atol=1e-3)
         assert result[0].blob_sha == "test_blob_sha_001"
 
         # ASSERT - Chunker and embedder NOT called (cache hit)
@@ -142,25 +191,18 @@ class TestEmbedWithCache:
 
         # ASSERT - Embeddings returned
         assert len(result) == 1
-        assert all(abs(v - 0.2) < 0.001 for v in result[0].vector)
+        assert np.allclose(result[0].vector, 0.2, atol=1e-3)
         assert result[0].blob_sha == "test_blob_sha_002"
 
         # ASSERT - Embeddings stored in cache
         cached = cache.get("test_blob_sha_002")
         assert cached is not None
         assert len(cached) == 1
-        assert all(abs(v - 0.2) < 0.001 for v in cached[0].vector)
+        assert np.allclose(cached[0].vector, 0.2, atol=1e-3)
 
-    async def test_language_detection_from_file_extension(self, tmp_path: Path):
-        """Language is detected from file extension in blob location.
-
-        Given: Blobs with different file extensions
-        When: I call embed_with_cache
-        Then: Correct language is passed to chunker
-        """
-        # Test data: file extension → expected language
-        # (language codes match language_detection.py)
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("file_path", "expected_lang"),
+        [
             ("main.py", "python"),
             ("app.js", "js"),
             ("app.jsx", "js"),
@@ -169,62 +211,80 @@ class TestEmbedWithCache:
             ("server.go", "go"),
             ("lib.rs", "rust"),
             ("README.md", "markdown"),  # Falls back to markdown
-        ]
+        ],
+    )
+    async def test_language_detection_from_file_extension(
+        self,
+        shared_cache: EmbeddingCache,
+        single_chunk_chunker: Mock,
+        single_chunk_embedder: AsyncMock,
+        file_path: str,
+        expected_lang: str,
+    ):
+        """Language is detected from file extension in blob location.
 
-        cache = EmbeddingCache(cache_dir=tmp_path, model="text-embedding-3-large")
+        Given: A blob with a given file extension (language codes match
+            language_detection.py)
+        When: I call embed_with_cache
+        Then: Correct language is passed to chunker
+        """
+        # ARRANGE - Create blob with specific file extension (unique SHA per case
+        # so the shared cache never short-circuits the chunker)
+        blob_location = BlobLocation(
+            commit_sha="abc" * 14,
+            file_path=file_path,
+            is_head=True,
+            author_name="Test",
+            author_email="test@example.com",
+            commit_date=1234567890,
+            commit_message="Test",
+            is_merge=False,
+        )
+        blob = BlobRecord(
+            sha=f"test_{file_path}",
+            content=b"test content",
+            size=12,
+            locations=[blob_location],
+        )
 
-        for file_path, expected_lang in test_cases:
-            # ARRANGE - Create blob with specific file extension
-            blob_location = BlobLocation(
-                commit_sha="abc" * 14,
-                file_path=file_path,
-                is_head=True,
-                author_name="Test",
-                author_email="test@example.com",
-                commit_date=1234567890,
-                commit_message="Test",
-                is_merge=False,
-            )
-            blob = BlobRecord(
-                sha=f"test_{file_path}",
-                content=b"test content",
-                size=12,
-                locations=[blob_location],
-            )
+        # ACT
+        await embed_with_cache(
+            chunker=single_chunk_chunker,
+            embedder=single_chunk_embedder,
+            cache=shared_cache,
+            blob_record=blob,
+        )
 
-            # Mock chunker and embedder
-            chunker = Mock(spec=LanguageAwareChunker)
-            chunker.chunk_file.return_value = [
-                CodeChunk(
-                    content="test",
-                    start_line=1,
-                    end_line=1,
-                    token_count=1,
-                    metadata={"chunk_index": 0, "total_chunks": 1},
-                )
-            ]
-            embedder = AsyncMock()
-            embedder.embed_chunks.return_value = [
-                Embedding(
-                    vector=[0.1] * 3072,
-                    token_count=1,
-                    model="text-embedding-3-large",
-                    cost_usd=0.0000001,
-                    blob_sha=f"test_{file_path}",
-                    chunk_index=0,
-                )
-            ]
+        # ASSERT - Chunker called with correct language
+        call_args = single_chunk_chunker.chunk_file.call_args
+        assert call_args[0][1] == expected_lang, (
+            f"Expected {expected_lang} for {file_path}, got {call_args[0][1]}"
+        )
 
-            # ACT
-            await embed_with_cache(
-                chunker=chunker, embedder=embedder, cache=cache, blob_record=blob
-            )
+    async def test_walker_resolved_language_preferred(
+        self, tmp_path: Path, single_chunk_chunker: Mock, single_chunk_embedder: AsyncMock
+    ):
+        """A language set on the location by the walker is used as-is."""
+        # ARRANGE - extension says python, walker already resolved something else
+        cache = EmbeddingCache(cache_dir=tmp_path, model="text-embedding-3-large")
+        location = BlobLocation(
+            commit_sha="abc" * 14,
+            file_path="script.py",
+            is_head=True,
+            author_name="Test",
+            author_email="test@example.com",
+            commit_date=1234567890,
+            commit_message="Test",
+            is_merge=False,
+            language="go",
+        )
+        blob = BlobRecord(sha="lang_sha", content=b"x", size=1, locations=[location])
 
-            # ASSERT - Chunker called with correct language
-            call_args = chunker.chunk_file.call_args
-            assert call_args[0][1] == expected_lang, (
-                f"Expected {expected_lang} for {file_path}, got {call_args[0][1]}"
-            )
+        # ACT
+        await embed_with_cache(single_chunk_chunker, single_chunk_embedder, cache, blob)
+
+        # ASSERT
+        assert single_chunk_chunker.chunk_file.call_args[0][1] == "go"
 
     async def test_logging_for_cache_hit_and_miss(self, tmp_path: Path, caplog):
         """Cache hits and misses are logged for cost tracking.
@@ -305,3 +365,214 @@ class TestEmbedWithCache:
             "Cache hit" in record.message and "miss_blo" in record.message
             for record in caplog.records
         )
+
+    async def test_identical_chunks_dedup_across_blobs(self, tmp_path: Path):
+        """Identical chunk content is embedded once across different blobs.
+
+        Given: Two blobs (different SHAs) that share one chunk, one repeated twice
+        When: I call embed_with_cache for both
+        Then: Only unique, unseen chunks reach the embedder and only those are billed
+        """
+        # ARRANGE
+        cache = EmbeddingCache(cache_dir=tmp_path, model="text-embedding-3-large")
+        shared = CodeChunk(
+            content="# Licensed under MIT", start_line=1, end_line=1, token_count=5, metadata={}
+        )
+        unique = CodeChunk(
+            content="def a(): pass", start_line=2, end_line=2, token_count=4, metadata={}
+        )
+        chunker = Mock(spec=LanguageAwareChunker)
+        chunker.chunk_file.side_effect = [[shared, unique, shared], [shared]]
+
+        async def fake_embed_chunks(chunks, blob_sha):
+            return [
+                Embedding(
+                    vector=[float(len(chunk.content))] * 8,
+                    token_count=chunk.token_count,
+                    model="text-embedding-3-large",
+                    cost_usd=0.001,
+                    blob_sha=blob_sha,
+                    chunk_index=idx,
+                )
+                for idx, chunk in enumerate(chunks)
+            ]
+
+        embedder = AsyncMock()
+        embedder.embed_chunks.side_effect = fake_embed_chunks
+
+        # ACT
+        first = await embed_with_cache(chunker, embedder, cache, _make_blob("blob_a", "a.py"))
+        second = await embed_with_cache(chunker, embedder, cache, _make_blob("blob_b", "b.py"))
+
+        # ASSERT - one API call, with the repeated chunk sent once
+        embedder.embed_chunks.assert_awaited_once_with([shared, unique], "blob_a")
+
+        # ASSERT - every chunk still gets its own positioned embedding
+        assert [e.chunk_index for e in first] == [0, 1, 2]
+        assert [e.chunk_content for e in first] == [shared.content, unique.content, shared.content]
+        assert np.allclose(first[2].vector, first[0].vector)
+        assert second[0].blob_sha == "blob_b"
+        assert np.allclose(second[0].vector, first[0].vector)
+
+        # ASSERT - every chunk keeps its own token count; spend is billed once
+        assert [e.token_count for e in first] == [5, 4, 5]
+        assert second[0].token_count == 5
+        assert [e.billed for e in first] == [True, True, False]
+        assert second[0].billed is False
+
+    async def test_unchanged_blob_skips_api_on_reindex(
+        self, tmp_path: Path, single_chunk_chunker: Mock, single_chunk_embedder: AsyncMock
+    ):
+        """A re-index of an unchanged blob sends no API request.
+
+        Given: A blob embedded once by a previous run (fresh cache instance, same dir)
+        When: I call embed_with_cache for the same blob SHA again
+        Then: The embedder is called only for the first run and vectors match
+        """
+        # ARRANGE
+        blob = _make_blob("abc", "a.py")
+        first_run = EmbeddingCache(cache_dir=tmp_path, model="text-embedding-3-large")
+        second_run = EmbeddingCache(cache_dir=tmp_path, model="text-embedding-3-large")
+
+        # ACT
+        first = await embed_with_cache(single_chunk_chunker, single_chunk_embedder, first_run, blob)
+        second = await embed_with_cache(
+            single_chunk_chunker, single_chunk_embedder, second_run, blob
+        )
+
+        # ASSERT - keyed by blob SHA, so the blob is not even re-chunked
+        assert single_chunk_embedder.embed_chunks.await_count == 1
+        single_chunk_chunker.chunk_file.assert_called_once()
+        assert np.allclose(second[0].vector, first[0].vector)
+
+        # ASSERT - the cached copy keeps its token count but bills nothing
+        assert second[0].token_count == first[0].token_count
+        assert (first[0].billed, second[0].billed) == (True, False)
+
+
+def _make_blob(sha: str, file_path: str = "mod.py") -> BlobRecord:
+    """Build a single-location BlobRecord for concurrency tests."""
+    location = BlobLocation(
+        commit_sha="abc" * 14,
+        file_path=file_path,
+        is_head=True,
+        author_name="Test",
+        author_email="test@example.com",
+        commit_date=1234567890,
+        commit_message="Test",
+        is_merge=False,
+    )
+    content = f"{sha} = 1".encode()
+    return BlobRecord(sha=sha, content=content, size=len(content), locations=[location])
+
+
+@pytest.mark.anyio
+class TestStreamEmbeddings:
+    """Test stream_embeddings lazy, bounded consumption."""
+
+    @staticmethod
+    def _chunker() -> Mock:
+        """One chunk per blob, distinct content so chunk-level dedup never applies."""
+        chunker = Mock(spec=LanguageAwareChunker)
+        chunker.chunk_file.side_effect = lambda content, _language: [
+            CodeChunk(content=content, start_line=1, end_line=1, token_count=3, metadata={})
+        ]
+        return chunker
+
+    @staticmethod
+    def _embedder(fail_sha: str | None = None) -> AsyncMock:
+        async def fake_embed_chunks(chunks, blob_sha):
+            if blob_sha == fail_sha:
+                raise RuntimeError("boom")
+            return [
+                Embedding(
+                    vector=[0.1] * 8,
+                    token_count=3,
+                    model="text-embedding-3-large",
+                    cost_usd=0.0,
+                    blob_sha=blob_sha,
+                    chunk_index=0,
+                )
+            ]
+
+        embedder = AsyncMock()
+        embedder.embed_chunks.side_effect = fake_embed_chunks
+        return embedder
+
+    async def test_blobs_consumed_lazily(self, tmp_path: Path):
+        """Only about max_inflight blobs are pulled before the first result."""
+        # ARRANGE
+        cache = EmbeddingCache(cache_dir=tmp_path, model="text-embedding-3-large")
+        pulled = 0
+
+        def blobs():
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield _make_blob(f"blob_{i}")
+
+        stream = stream_embeddings(
+            self._chunker(), self._embedder(), cache, blobs(), max_inflight=4
+        )
+
+        # ACT
+        first_blob, first_result = await anext(stream)
+        await stream.aclose()
+
+        # ASSERT
+        assert first_blob.sha == "blob_0"
+        assert first_result[0].blob_sha == "blob_0"
+        assert pulled == 4
+
+    async def test_failures_yielded_in_order(self, tmp_path: Path):
+        """A failing blob is yielded as its exception; the stream continues."""
+        # ARRANGE
+        cache = EmbeddingCache(cache_dir=tmp_path, model="text-embedding-3-large")
+        blobs = [_make_blob(f"blob_{i}") for i in range(3)]
+
+        # ACT
+        results = [
+            (blob.sha, result)
+            async for blob, result in stream_embeddings(
+                self._chunker(), self._embedder("blob_1"), cache, blobs
+            )
+        ]
+
+        # ASSERT
+        assert [sha for sha, _ in results] == ["blob_0", "blob_1", "blob_2"]
+        assert isinstance(results[1][1], RuntimeError)
+        assert not isinstance(results[2][1], Exception)
+
+    async def test_early_close_waits_for_cancelled_blobs(self, tmp_path: Path):
+        """Closing the stream returns only after in-flight blobs finished cancelling."""
+        # ARRANGE
+        cache = EmbeddingCache(cache_dir=tmp_path, model="text-embedding-3-large")
+        blobs = [_make_blob(f"blob_{i}") for i in range(4)]
+        started = cancelled = 0
+        siblings_blocked, never = asyncio.Event(), asyncio.Event()
+        embed = self._embedder().embed_chunks.side_effect
+
+        async def fake_embed_chunks(chunks, blob_sha):
+            nonlocal started, cancelled
+            if blob_sha == "blob_0":
+                await siblings_blocked.wait()
+                return await embed(chunks, blob_sha)
+            started += 1
+            if started == 3:
+                siblings_blocked.set()
+            try:
+                await never.wait()
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+
+        embedder = AsyncMock()
+        embedder.embed_chunks.side_effect = fake_embed_chunks
+        stream = stream_embeddings(self._chunker(), embedder, cache, blobs, max_inflight=4)
+
+        # ACT
+        await anext(stream)
+        await stream.aclose()
+
+        # ASSERT
+        assert cancelled == 3
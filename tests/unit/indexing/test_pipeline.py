@@ -69,6 +69,8 @@ async def test_keyboard_interrupt_shows_interrupted_message(tmp_path, capsys):
     mock_settings = Mock()
     mock_settings.repo.index.chunk_overlap_ratio = 0.1
     mock_settings.repo.index.max_chunk_tokens = 500
+    mock_settings.repo.index.requests_per_minute = 3_500
+    mock_settings.repo.index.tokens_per_minute = 1_000_000
     mock_settings.repo.model.embedding = DEFAULT_EMBEDDING_MODEL
     mock_settings.get.return_value = "sk-test"
 
@@ -100,6 +102,8 @@ async def test_keyboard_interrupt_shows_partial_statistics(tmp_path, capsys):
     mock_settings = Mock()
     mock_settings.repo.index.chunk_overlap_ratio = 0.1
     mock_settings.repo.index.max_chunk_tokens = 500
+    mock_settings.repo.index.requests_per_minute = 3_500
+    mock_settings.repo.index.tokens_per_minute = 1_000_000
     mock_settings.repo.model.embedding = DEFAULT_EMBEDDING_MODEL
     mock_settings.get.return_value = "sk-test"
 
@@ -130,6 +134,8 @@ async def test_non_keyboard_interrupt_does_not_exit_130(tmp_path, capsys):
     mock_settings = Mock()
     mock_settings.repo.index.chunk_overlap_ratio = 0.1
     mock_settings.repo.index.max_chunk_tokens = 500
+    mock_settings.repo.index.requests_per_minute = 3_500
+    mock_settings.repo.index.tokens_per_minute = 1_000_000
     mock_settings.repo.model.embedding = DEFAULT_EMBEDDING_MODEL
     mock_settings.get.return_value = "sk-test"
 
@@ -157,6 +163,8 @@ async def test_dry_run_shows_cost_estimation(tmp_path, capsys):
     mock_settings = Mock()
     mock_settings.repo.index.chunk_overlap_ratio = 0.1
     mock_settings.repo.index.max_chunk_tokens = 500
+    mock_settings.repo.index.requests_per_minute = 3_500
+    mock_settings.repo.index.tokens_per_minute = 1_000_000
     mock_settings.repo.model.embedding = DEFAULT_EMBEDDING_MODEL
     mock_settings.get.return_value = "sk-test"
 
@@ -233,6 +241,8 @@ async def test_empty_repository_exits_early(tmp_path, capsys):
     mock_settings = Mock()
     mock_settings.repo.index.chunk_overlap_ratio = 0.1
     mock_settings.repo.index.max_chunk_tokens = 500
+    mock_settings.repo.index.requests_per_minute = 3_500
+    mock_settings.repo.index.tokens_per_minute = 1_000_000
     mock_settings.repo.model.embedding = DEFAULT_EMBEDDING_MODEL
 
     with (
@@ -262,6 +272,8 @@ async def test_indexing_processes_single_blob(tmp_path, capsys):
     mock_settings = Mock()
     mock_settings.repo.index.chunk_overlap_ratio = 0.1
     mock_settings.repo.index.max_chunk_tokens = 500
+    mock_settings.repo.index.requests_per_minute = 3_500
+    mock_settings.repo.index.tokens_per_minute = 1_000_000
     mock_settings.repo.model.embedding = DEFAULT_EMBEDDING_MODEL
     mock_settings.get.return_value = "sk-test"
 
@@ -305,6 +317,7 @@ async def test_indexing_processes_single_blob(tmp_path, capsys):
         # Mock walker
         mock_walker = Mock()
         mock_walker.walk_blobs.return_value = iter([mock_blob])
+        mock_walker.blob_locations = {mock_blob.sha: mock_blob.locations}
         mock_walker.get_stats.return_value = Mock(commits_seen=1, blobs_indexed=1)
         mock_walker_cls.return_value = mock_walker
 
@@ -327,7 +340,10 @@ async def test_indexing_processes_single_blob(tmp_path, capsys):
 
         await index_repository(repo_path, mock_settings)
 
-        # Verify components were called
+        # Verify components were called (throttle quotas come from settings)
+        mock_embedder_cls.assert_called_once_with(
+            api_key="sk-test", requests_per_minute=3_500, tokens_per_minute=1_000_000
+        )
         mock_chunker.chunk_file.assert_called_once()
         mock_embedder.embed_chunks.assert_called_once()
         mock_store.add_chunks_batch.assert_called_once()
@@ -346,6 +362,8 @@ async def test_indexing_handles_unicode_decode_error(tmp_path, capsys):
     mock_settings = Mock()
     mock_settings.repo.index.chunk_overlap_ratio = 0.1
     mock_settings.repo.index.max_chunk_tokens = 500
+    mock_settings.repo.index.requests_per_minute = 3_500
+    mock_settings.repo.index.tokens_per_minute = 1_000_000
     mock_settings.repo.model.embedding = DEFAULT_EMBEDDING_MODEL
     mock_settings.get.return_value = "sk-test"
 
@@ -358,16 +376,22 @@ async def test_indexing_handles_unicode_decode_error(tmp_path, capsys):
 
     with (
         patch("gitctx.git.walker.CommitWalker") as mock_walker_cls,
-        patch("gitctx.indexing.chunker.LanguageAwareChunker"),
+        patch("gitctx.indexing.chunker.LanguageAwareChunker") as mock_chunker_cls,
         patch("gitctx.models.providers.openai.OpenAIEmbedder"),
         patch("gitctx.storage.lancedb_store.LanceDBStore"),
     ):
         # Mock walker
         mock_walker = Mock()
         mock_walker.walk_blobs.return_value = iter([mock_blob])
+        mock_walker.blob_locations = {mock_blob.sha: mock_blob.locations}
         mock_walker.get_stats.return_value = Mock(commits_seen=1, blobs_indexed=1)
         mock_walker_cls.return_value = mock_walker
 
+        # Mock chunker rejecting the binary content
+        mock_chunker_cls.return_value.chunk_file.side_effect = UnicodeDecodeError(
+            "utf-8", b"\xff", 0, 1, "invalid start byte"
+        )
+
         await index_repository(repo_path, mock_settings)
 
     # Verify error was recorded (check output for "Errors: 1")
@@ -384,6 +408,8 @@ async def test_indexing_handles_processing_error(tmp_path, capsys):
     mock_settings = Mock()
     mock_settings.repo.index.chunk_overlap_ratio = 0.1
     mock_settings.repo.index.max_chunk_tokens = 500
+    mock_settings.repo.index.requests_per_minute = 3_500
+    mock_settings.repo.index.tokens_per_minute = 1_000_000
     mock_settings.repo.model.embedding = DEFAULT_EMBEDDING_MODEL
     mock_settings.get.return_value = "sk-test"
 
@@ -406,6 +432,7 @@ async def test_indexing_handles_processing_error(tmp_path, capsys):
         # Mock walker
         mock_walker = Mock()
         mock_walker.walk_blobs.return_value = iter([mock_blob])
+        mock_walker.blob_locations = {mock_blob.sha: mock_blob.locations}
         mock_walker.get_stats.return_value = Mock(commits_seen=1, blobs_indexed=1)
         mock_walker_cls.return_value = mock_walker
 
@@ -435,6 +462,8 @@ async def test_indexing_processes_multiple_chunks(tmp_path):
     mock_settings = Mock()
     mock_settings.repo.index.chunk_overlap_ratio = 0.1
     mock_settings.repo.index.max_chunk_tokens = 500
+    mock_settings.repo.index.requests_per_minute = 3_500
+    mock_settings.repo.index.tokens_per_minute = 1_000_000
     mock_settings.repo.model.embedding = DEFAULT_EMBEDDING_MODEL
     mock_settings.get.return_value = "sk-test"
 
@@ -488,6 +517,7 @@ async def test_indexing_processes_multiple_chunks(tmp_path):
         # Mock walker
         mock_walker = Mock()
         mock_walker.walk_blobs.return_value = iter([mock_blob])
+        mock_walker.blob_locations = {mock_blob.sha: mock_blob.locations}
         mock_walker.get_stats.return_value = Mock(commits_seen=1, blobs_indexed=1)
         mock_walker_cls.return_value = mock_walker
 
@@ -5,28 +5,23 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
-from gitctx.models.providers.openai import OpenAIProvider
+from gitctx.models.providers.openai import OpenAIProvider, _shared_sync_client
+
+# Mock 3072-dim vectors, built once; tuples since every consumer copies them into numpy arrays
+_VEC_3072_A = (0.1,) * 3072
+_VEC_3072_B = (0.2,) * 3072
 
 # Import will be added after implementation
-# from gitctx.models.providers.openai import OpenAIProvider
+# from gitctx.models.providers.openai import OpenAIProvider, _shared_sync_client
 
 
 @pytest.fixture
 def mock_openai_embeddings():
-    """Mock LangChain OpenAIEmbeddings."""
-    with patch("gitctx.models.providers.openai.OpenAIEmbeddings") as mock:
-        yield mock
-
-
-def test_openai_provider_init(mock_openai_embeddings):
-    """Test OpenAIProvider initialization."""
-
-    provider = OpenAIProvider("text-embedding-3-large", "fake-key")
-    assert provider.model_name == "text-embedding-3-large"
-    assert provider.dimensions == 3072
-    # Has BaseProvider properties (via composition)
-    assert hasattr(provider, "max_tokens")
-    assert hasattr(provider, "provider")
+    """Mock LangChain OpenAIEmbeddings (the class returned by the lazy importer)."""
+    _shared_sync_client.cache_clear()
+    with patch("gitctx.models.providers.openai._embeddings_cls") as embeddings_cls:
+        yield embeddings_cls.return_value
+    _shared_sync_client.cache_clear()
 
 
 def test_embed_query_shape(mock_openai_embeddings):
@@ -34,7 +29,7 @@ def test_embed_query_shape(mock_openai_embeddings):
 
     # Mock embed_query to return list of floats
     mock_client = MagicMock()
-    mock_client.embed_query.return_value = [0.1] * 3072
+    mock_client.embed_query.return_value = _VEC_3072_A
     mock_openai_embeddings.return_value = mock_client
 
     provider = OpenAIProvider("text-embedding-3-large", "fake-key")
@@ -51,8 +46,8 @@ def test_embed_documents_shape(mock_openai_embeddings):
     # Mock embed_documents to return list of lists
     mock_client = MagicMock()
     mock_client.embed_documents.return_value = [
-        [0.1] * 3072,
-        [0.2] * 3072,
+        _VEC_3072_A,
+        _VEC_3072_B,
     ]
     mock_openai_embeddings.return_value = mock_client
 
@@ -76,9 +71,13 @@ def test_openai_provider_uses_base_provider(mock_openai_embeddings):
 
 
 def test_openai_provider_passes_api_key(mock_openai_embeddings):
-    """Test that API key is passed to LangChain."""
+    """Test OpenAIProvider initialization and that the API key is passed to LangChain."""
 
-    OpenAIProvider("text-embedding-3-large", "test-api-key-123")
+    provider = OpenAIProvider("text-embedding-3-large", "test-api-key-123")
+
+    # Verify provider attributes
+    assert provider.model_name == "text-embedding-3-large"
+    assert provider.dimensions == 3072
 
     # Verify OpenAIEmbeddings was called with correct params
     mock_openai_embeddings.assert_called_once()
@@ -86,3 +85,16 @@ def test_openai_provider_passes_api_key(mock_openai_embeddings):
 
     assert call_kwargs["model"] == "text-embedding-3-large"
     assert call_kwargs["dimensions"] == 3072
+
+
+def test_providers_share_client_per_settings(mock_openai_embeddings):
+    """Test that providers with the same model and key reuse one LangChain client."""
+    mock_openai_embeddings.side_effect = lambda **_: MagicMock()
+
+    first = OpenAIProvider("text-embedding-3-large", "key-a")
+    second = OpenAIProvider("text-embedding-3-large", "key-a")
+    other_key = OpenAIProvider("text-embedding-3-large", "key-b")
+
+    assert first._client is second._client
+    assert other_key._client is not first._client
+    assert mock_openai_embeddings.call_count == 2
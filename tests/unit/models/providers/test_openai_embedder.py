@@ -1,11 +1,60 @@
-"""Unit tests for OpenAIEmbedder cost distribution logic."""
+"""Unit tests for OpenAIEmbedder cost distribution logic.
 
-from unittest.mock import AsyncMock, MagicMock, patch
+Module-level vectors, chunks and the module-scoped embedder are shared
+by every test on an xdist worker: treat them as read-only and patch the
+client only through the mock_create fixture.
+"""
 
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
 import pytest
 
 from gitctx.indexing.types import CodeChunk
+from gitctx.models.errors import APIError, DimensionMismatchError
 from gitctx.models.providers.openai import OpenAIEmbedder
+from gitctx.models.ratelimit import AsyncRateLimiter
+
+# Mock 3072-dim vectors, built once; tuples since every consumer copies them into numpy arrays
+_VEC_3072_A = (0.1,) * 3072
+_VEC_3072_B = (0.2,) * 3072
+
+# Read-only chunk sets shared across tests (embed_chunks never mutates its input)
+_CHUNKS_EQUAL = tuple(
+    CodeChunk(
+        content="x" * 800, start_line=1, end_line=10, token_count=200, metadata={"chunk_index": i}
+    )
+    for i in range(3)
+)
+_CHUNKS_UNEQUAL = (
+    CodeChunk(content="x" * 400, start_line=1, end_line=10, token_count=100, metadata={}),
+    CodeChunk(content="x" * 800, start_line=11, end_line=20, token_count=200, metadata={}),
+    CodeChunk(content="x" * 1200, start_line=21, end_line=30, token_count=300, metadata={}),
+)
+_CHUNK_600 = CodeChunk(content="x" * 2400, start_line=1, end_line=10, token_count=600, metadata={})
+_CHUNK_EMPTY = CodeChunk(content="", start_line=1, end_line=1, token_count=0, metadata={})
+
+
+@pytest.fixture(scope="module")
+def embedder():
+    """Shared OpenAIEmbedder; tests only patch its client for their own duration."""
+    return OpenAIEmbedder(api_key="test-key")
+
+
+@pytest.fixture
+def mock_create(embedder, monkeypatch):
+    """AsyncMock replacing the shared embedder's client create() for one test.
+
+    Also gives the test full rate-limit buckets, so quota spent by earlier
+    tests on the shared embedder never makes a later one wait.
+    """
+    monkeypatch.setattr(embedder, "_request_limiter", AsyncRateLimiter(3_500))
+    monkeypatch.setattr(embedder, "_token_limiter", AsyncRateLimiter(1_000_000))
+    create = AsyncMock()
+    monkeypatch.setattr(embedder._embeddings.async_client, "create", create)
+    return create
 
 
 @pytest.fixture
@@ -13,11 +62,16 @@ def mock_openai_response():
     """Create mock OpenAI API response."""
 
     def _create_response(num_chunks: int, total_tokens: int):
-        """Create response with specified chunks and tokens."""
-        return {
-            "data": [{"embedding": [0.1] * 3072} for _ in range(num_chunks)],
+        """Create response with specified chunks and tokens.
+
+        A SimpleNamespace stands in for the SDK response: embed_chunks only
+        calls model_dump(), so a full MagicMock is not needed.
+        """
+        payload = {
+            "data": [{"embedding": _VEC_3072_A} for _ in range(num_chunks)],
             "usage": {"total_tokens": total_tokens},
         }
+        return SimpleNamespace(model_dump=lambda: payload)
 
     return _create_response
 
@@ -26,200 +80,420 @@ def mock_openai_response():
 class TestCostDistribution:
     """Test cost distribution across chunks in a batch."""
 
-    async def test_batch_cost_distribution_equal_chunks(self, mock_openai_response):
+    async def test_batch_cost_distribution_equal_chunks(
+        self, embedder, mock_create, mock_openai_response
+    ):
         """Cost is distributed proportionally across equal-sized chunks."""
         # ARRANGE - 3 chunks, 200 tokens each = 600 total
-        chunks = [
-            CodeChunk(
-                content="x" * 800,
-                start_line=1,
-                end_line=10,
-                token_count=200,
-                metadata={"chunk_index": i},
-            )
-            for i in range(3)
-        ]
-
-        embedder = OpenAIEmbedder(api_key="test-key")
+        chunks = list(_CHUNKS_EQUAL)
 
         # Mock API response: 600 total tokens
-        mock_response = mock_openai_response(num_chunks=3, total_tokens=600)
+        mock_create.return_value = mock_openai_response(num_chunks=3, total_tokens=600)
 
-        with patch.object(
-            embedder._embeddings.async_client, "create", new_callable=AsyncMock
-        ) as mock_create:
-            mock_create.return_value = MagicMock(model_dump=lambda: mock_response)
-
-            # ACT
-            embeddings = await embedder.embed_chunks(chunks, "test_sha")
+        # ACT
+        embeddings = await embedder.embed_chunks(chunks, "test_sha")
 
-            # ASSERT - Each chunk gets 1/3 of total cost
-            total_cost = sum(e.cost_usd for e in embeddings)
-            expected_total = (600 / 1_000_000) * 0.13  # $0.000078
+        # ASSERT - Each chunk gets 1/3 of total cost
+        total_cost = sum(e.cost_usd for e in embeddings)
+        expected_total = (600 / 1_000_000) * 0.13  # $0.000078
 
-            # Verify total matches expected
-            assert abs(total_cost - expected_total) < 0.0000001
+        # Verify total matches expected
+        assert abs(total_cost - expected_total) < 0.0000001
 
-            # Verify each chunk gets equal share (200/600 = 1/3)
-            expected_per_chunk = expected_total / 3
-            for emb in embeddings:
-                assert abs(emb.cost_usd - expected_per_chunk) < 0.0000001
+        # Verify each chunk gets equal share (200/600 = 1/3)
+        expected_per_chunk = expected_total / 3
+        for emb in embeddings:
+            assert abs(emb.cost_usd - expected_per_chunk) < 0.0000001
 
-    async def test_batch_cost_distribution_unequal_chunks(self, mock_openai_response):
+    async def test_batch_cost_distribution_unequal_chunks(
+        self, embedder, mock_create, mock_openai_response
+    ):
         """Cost is distributed proportionally across unequal-sized chunks."""
         # ARRANGE - 3 chunks with different token counts
-        chunks = [
-            CodeChunk(content="x" * 400, start_line=1, end_line=10, token_count=100, metadata={}),
-            CodeChunk(content="x" * 800, start_line=11, end_line=20, token_count=200, metadata={}),
-            CodeChunk(content="x" * 1200, start_line=21, end_line=30, token_count=300, metadata={}),
-        ]
-
-        embedder = OpenAIEmbedder(api_key="test-key")
+        chunks = list(_CHUNKS_UNEQUAL)
 
         # Mock API response: 600 total tokens
-        mock_response = mock_openai_response(num_chunks=3, total_tokens=600)
-
-        with patch.object(
-            embedder._embeddings.async_client, "create", new_callable=AsyncMock
-        ) as mock_create:
-            mock_create.return_value = MagicMock(model_dump=lambda: mock_response)
-
-            # ACT
-            embeddings = await embedder.embed_chunks(chunks, "test_sha")
-
-            # ASSERT - Total cost correct
-            total_cost = sum(e.cost_usd for e in embeddings)
-            expected_total = (600 / 1_000_000) * 0.13  # $0.000078
-            assert abs(total_cost - expected_total) < 0.0000001
-
-            # Verify proportional distribution
-            # Chunk 0: 100/600 = 16.67% of cost
-            # Chunk 1: 200/600 = 33.33% of cost
-            # Chunk 2: 300/600 = 50.00% of cost
-            assert abs(embeddings[0].cost_usd - (expected_total * 100 / 600)) < 0.0000001
-            assert abs(embeddings[1].cost_usd - (expected_total * 200 / 600)) < 0.0000001
-            assert abs(embeddings[2].cost_usd - (expected_total * 300 / 600)) < 0.0000001
-
-    async def test_single_chunk_batch(self, mock_openai_response):
+        mock_create.return_value = mock_openai_response(num_chunks=3, total_tokens=600)
+
+        # ACT
+        embeddings = await embedder.embed_chunks(chunks, "test_sha")
+
+        # ASSERT - Total cost correct
+        total_cost = sum(e.cost_usd for e in embeddings)
+        expected_total = (600 / 1_000_000) * 0.13  # $0.000078
+        assert abs(total_cost - expected_total) < 0.0000001
+
+        # Verify proportional distribution
+        # Chunk 0: 100/600 = 16.67% of cost
+        # Chunk 1: 200/600 = 33.33% of cost
+        # Chunk 2: 300/600 = 50.00% of cost
+        assert abs(embeddings[0].cost_usd - (expected_total * 100 / 600)) < 0.0000001
+        assert abs(embeddings[1].cost_usd - (expected_total * 200 / 600)) < 0.0000001
+        assert abs(embeddings[2].cost_usd - (expected_total * 300 / 600)) < 0.0000001
+
+    async def test_single_chunk_batch(self, embedder, mock_create, mock_openai_response):
         """Single chunk gets full cost (no division errors)."""
         # ARRANGE
-        chunks = [
-            CodeChunk(
-                content="x" * 2400,
-                start_line=1,
-                end_line=10,
-                token_count=600,
-                metadata={},
-            )
-        ]
-
-        embedder = OpenAIEmbedder(api_key="test-key")
+        chunks = [_CHUNK_600]
 
         # Mock API response: 600 tokens
-        mock_response = mock_openai_response(num_chunks=1, total_tokens=600)
+        mock_create.return_value = mock_openai_response(num_chunks=1, total_tokens=600)
 
-        with patch.object(
-            embedder._embeddings.async_client, "create", new_callable=AsyncMock
-        ) as mock_create:
-            mock_create.return_value = MagicMock(model_dump=lambda: mock_response)
+        # ACT
+        embeddings = await embedder.embed_chunks(chunks, "test_sha")
 
-            # ACT
-            embeddings = await embedder.embed_chunks(chunks, "test_sha")
+        # ASSERT - Single chunk gets full cost
+        expected_cost = (600 / 1_000_000) * 0.13
+        assert len(embeddings) == 1
+        assert abs(embeddings[0].cost_usd - expected_cost) < 0.0000001
 
-            # ASSERT - Single chunk gets full cost
-            expected_cost = (600 / 1_000_000) * 0.13
-            assert len(embeddings) == 1
-            assert abs(embeddings[0].cost_usd - expected_cost) < 0.0000001
+        # ASSERT - Vector returned as a float32 array, not a Python list
+        assert embeddings[0].vector.dtype == np.float32
+        assert embeddings[0].vector.shape == (3072,)
 
-    async def test_empty_batch_returns_empty_list(self):
+    async def test_empty_batch_returns_empty_list(self, embedder):
         """Empty batch returns empty list without errors."""
-        # ARRANGE
-        embedder = OpenAIEmbedder(api_key="test-key")
-
         # ACT
         embeddings = await embedder.embed_chunks([], "test_sha")
 
         # ASSERT
         assert embeddings == []
 
-    async def test_fallback_to_tiktoken_when_no_api_tokens(self):
+    async def test_fallback_to_tiktoken_when_no_api_tokens(self, embedder, mock_create):
         """Falls back to tiktoken estimates when api_token_count is None."""
         # ARRANGE
-        chunks = [
-            CodeChunk(content="x" * 400, start_line=1, end_line=10, token_count=100, metadata={}),
-            CodeChunk(content="x" * 800, start_line=11, end_line=20, token_count=200, metadata={}),
-        ]
-
-        embedder = OpenAIEmbedder(api_key="test-key")
+        chunks = list(_CHUNKS_UNEQUAL[:2])
 
         # Mock API response WITHOUT usage data
-        mock_response = {
+        payload = {
             "data": [
-                {"embedding": [0.1] * 3072},
-                {"embedding": [0.2] * 3072},
+                {"embedding": _VEC_3072_A},
+                {"embedding": _VEC_3072_B},
             ],
             # No "usage" key - simulates API not returning token count
         }
+        mock_create.return_value = SimpleNamespace(model_dump=lambda: payload)
 
-        with patch.object(
-            embedder._embeddings.async_client, "create", new_callable=AsyncMock
-        ) as mock_create:
-            mock_create.return_value = MagicMock(model_dump=lambda: mock_response)
-
-            # ACT
-            embeddings = await embedder.embed_chunks(chunks, "test_sha")
+        # ACT
+        embeddings = await embedder.embed_chunks(chunks, "test_sha")
 
-            # ASSERT - Uses tiktoken estimates
-            # Chunk 0: 100 tokens → cost = (100 / 1M) * 0.13
-            # Chunk 1: 200 tokens → cost = (200 / 1M) * 0.13
-            expected_cost_0 = (100 / 1_000_000) * 0.13
-            expected_cost_1 = (200 / 1_000_000) * 0.13
+        # ASSERT - Uses tiktoken estimates
+        # Chunk 0: 100 tokens → cost = (100 / 1M) * 0.13
+        # Chunk 1: 200 tokens → cost = (200 / 1M) * 0.13
+        expected_cost_0 = (100 / 1_000_000) * 0.13
+        expected_cost_1 = (200 / 1_000_000) * 0.13
 
-            assert abs(embeddings[0].cost_usd - expected_cost_0) < 0.0000001
-            assert abs(embeddings[1].cost_usd - expected_cost_1) < 0.0000001
+        assert abs(embeddings[0].cost_usd - expected_cost_0) < 0.0000001
+        assert abs(embeddings[1].cost_usd - expected_cost_1) < 0.0000001
 
-    async def test_zero_tokens_edge_case(self, mock_openai_response):
+    async def test_zero_tokens_edge_case(self, embedder, mock_create, mock_openai_response):
         """Handles zero tokens gracefully (no division by zero)."""
         # ARRANGE
+        chunks = [_CHUNK_EMPTY]
+
+        # Mock API response: 0 tokens
+        mock_create.return_value = mock_openai_response(num_chunks=1, total_tokens=0)
+
+        # ACT
+        embeddings = await embedder.embed_chunks(chunks, "test_sha")
+
+        # ASSERT - No division by zero, cost is 0
+        assert len(embeddings) == 1
+        assert embeddings[0].cost_usd == 0.0
+
+
+def _batch_response(num_inputs: int, total_tokens: int = 10):
+    """SDK-like response with one vector per input."""
+    payload = {
+        "data": [{"embedding": _VEC_3072_A} for _ in range(num_inputs)],
+        "usage": {"total_tokens": total_tokens},
+    }
+    return SimpleNamespace(model_dump=lambda: payload)
+
+
+def _numbered_chunks(count: int) -> list[CodeChunk]:
+    return [
+        CodeChunk(content=f"c{i}", start_line=i, end_line=i, token_count=5, metadata={})
+        for i in range(count)
+    ]
+
+
+@pytest.mark.anyio
+class TestBatchDispatch:
+    """Test splitting large inputs (by chunk count or tokens) into concurrent requests."""
+
+    async def test_large_input_split_into_ordered_batches(self, embedder, mock_create, monkeypatch):
+        """Each request carries at most MAX_BATCH_SIZE inputs; results keep input order."""
+        # ARRANGE
+        monkeypatch.setattr(embedder, "MAX_BATCH_SIZE", 2)
+        mock_create.side_effect = lambda *, input, **_: _batch_response(len(input))
+
+        # ACT
+        embeddings = await embedder.embed_chunks(_numbered_chunks(5), "test_sha")
+
+        # ASSERT
+        assert [call.kwargs["input"] for call in mock_create.call_args_list] == [
+            ["c0", "c1"],
+            ["c2", "c3"],
+            ["c4"],
+        ]
+        assert [e.chunk_index for e in embeddings] == [0, 1, 2, 3, 4]
+        assert {e.blob_sha for e in embeddings} == {"test_sha"}
+
+    async def test_batches_are_in_flight_together(self, embedder, mock_create, monkeypatch):
+        """All batch requests are awaiting the API at the same time."""
+        # ARRANGE - each request blocks until all three have started
+        monkeypatch.setattr(embedder, "MAX_BATCH_SIZE", 2)
+        started = 0
+        all_started = asyncio.Event()
+
+        async def fake_create(*, input, **_):
+            nonlocal started
+            started += 1
+            if started == 3:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=5)
+            return _batch_response(len(input))
+
+        mock_create.side_effect = fake_create
+
+        # ACT
+        embeddings = await embedder.embed_chunks(_numbered_chunks(6), "test_sha")
+
+        # ASSERT - a sequential dispatcher would have timed out waiting
+        assert len(embeddings) == 6
+
+    async def test_max_concurrency_bounds_in_flight_requests(
+        self, embedder, mock_create, monkeypatch
+    ):
+        """No more than max_concurrency requests are outstanding at once."""
+        # ARRANGE
+        monkeypatch.setattr(embedder, "MAX_BATCH_SIZE", 1)
+        monkeypatch.setattr(embedder, "max_concurrency", 2)
+        in_flight = peak = 0
+
+        async def fake_create(*, input, **_):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _batch_response(len(input))
+
+        mock_create.side_effect = fake_create
+
+        # ACT
+        await embedder.embed_chunks(_numbered_chunks(6), "test_sha")
+
+        # ASSERT
+        assert mock_create.call_count == 6
+        assert peak == 2
+
+    async def test_batches_stay_under_token_limit(self, embedder, mock_create):
+        """Chunks summing past 300k tokens are split so no request exceeds the limit."""
+        # ARRANGE - 4 x 100k tokens: only three fit in one request
+        chunks = [
+            CodeChunk(content=f"big{i}", start_line=1, end_line=1, token_count=100_000, metadata={})
+            for i in range(4)
+        ]
+        mock_create.side_effect = lambda *, input, **_: _batch_response(len(input))
+
+        # ACT
+        embeddings = await embedder.embed_chunks(chunks, "test_sha")
+
+        # ASSERT
+        inputs = [call.kwargs["input"] for call in mock_create.call_args_list]
+        assert inputs == [["big0", "big1", "big2"], ["big3"]]
+        assert [e.chunk_index for e in embeddings] == [0, 1, 2, 3]
+
+    async def test_chunk_over_token_budget_sent_alone(self, embedder, mock_create, monkeypatch):
+        """A chunk larger than the budget gets its own request instead of being dropped."""
+        # ARRANGE
+        monkeypatch.setattr(embedder, "max_tokens_per_batch", 10)
         chunks = [
-            CodeChunk(content="", start_line=1, end_line=1, token_count=0, metadata={}),
+            CodeChunk(content=f"c{i}", start_line=1, end_line=1, token_count=tokens, metadata={})
+            for i, tokens in enumerate([3, 20, 3, 4])
         ]
+        mock_create.side_effect = lambda *, input, **_: _batch_response(len(input))
+
+        # ACT
+        embeddings = await embedder.embed_chunks(chunks, "test_sha")
+
+        # ASSERT
+        inputs = [call.kwargs["input"] for call in mock_create.call_args_list]
+        assert inputs == [["c0"], ["c1"], ["c2", "c3"]]
+        assert len(embeddings) == 4
+
+    async def test_iter_yields_batches_as_they_complete(self, embedder, mock_create, monkeypatch):
+        """aembed_chunks_iter hands over a finished batch while an earlier one is pending."""
+        # ARRANGE - the first batch blocks until something has been yielded
+        monkeypatch.setattr(embedder, "MAX_BATCH_SIZE", 2)
+        released = asyncio.Event()
+
+        async def fake_create(*, input, **_):
+            if input[0] == "c0":
+                await asyncio.wait_for(released.wait(), timeout=5)
+            return _batch_response(len(input))
+
+        mock_create.side_effect = fake_create
 
+        # ACT
+        order = []
+        async for embedding in embedder.aembed_chunks_iter(_numbered_chunks(4), "test_sha"):
+            order.append(embedding.chunk_index)
+            released.set()
+
+        # ASSERT - completion order, and embed_chunks would still restore input order
+        assert order == [2, 3, 0, 1]
+
+    async def test_failed_batch_cancels_in_flight_batches(self, embedder, mock_create, monkeypatch):
+        """One failing request cancels its siblings and surfaces the original error."""
+        # ARRANGE
+        monkeypatch.setattr(embedder, "MAX_BATCH_SIZE", 1)
+        cancelled = []
+
+        async def fake_create(*, input, **_):
+            if input == ["c0"]:
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(input[0])
+                raise
+            return _batch_response(len(input))
+
+        mock_create.side_effect = fake_create
+
+        # ACT & ASSERT
+        with pytest.raises(RuntimeError, match="boom"):
+            await embedder.embed_chunks(_numbered_chunks(3), "test_sha")
+        assert sorted(cancelled) == ["c1", "c2"]
+
+    def test_invalid_max_tokens_per_batch_rejected(self):
+        """max_tokens_per_batch below 1 is a configuration error."""
+        with pytest.raises(ValueError, match="max_tokens_per_batch must be >= 1"):
+            OpenAIEmbedder(api_key="test-key", max_tokens_per_batch=0)
+
+    def test_invalid_max_concurrency_rejected(self):
+        """max_concurrency below 1 is a configuration error."""
+        with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+            OpenAIEmbedder(api_key="test-key", max_concurrency=0)
+
+
+class TestLazyClient:
+    """Test deferred construction of the LangChain client."""
+
+    def test_client_built_on_first_use(self):
+        """Constructing an embedder does not build the LangChain client."""
+        # ARRANGE & ACT
         embedder = OpenAIEmbedder(api_key="test-key")
 
-        # Mock API response: 0 tokens
-        mock_response = mock_openai_response(num_chunks=1, total_tokens=0)
+        # ASSERT - nothing built yet; first access builds and keeps one client
+        assert "_embeddings" not in vars(embedder)
+        client = embedder._embeddings
+        assert embedder._embeddings is client
+        assert client.model == "text-embedding-3-large"
 
-        with patch.object(
-            embedder._embeddings.async_client, "create", new_callable=AsyncMock
-        ) as mock_create:
-            mock_create.return_value = MagicMock(model_dump=lambda: mock_response)
 
-            # ACT
-            embeddings = await embedder.embed_chunks(chunks, "test_sha")
+@pytest.mark.anyio
+class TestDimensionValidation:
+    """Test rejection of vectors with the wrong dimension count."""
+
+    @pytest.mark.parametrize(
+        ("vectors", "got"),
+        [
+            ([(0.1,) * 1536, (0.1,) * 1536], 1536),  # wrong model
+            ([_VEC_3072_A, (0.1,) * 1536], 1536),  # ragged response
+        ],
+        ids=["uniform", "ragged"],
+    )
+    async def test_dimension_mismatch_raises_error(self, embedder, mock_create, vectors, got):
+        """Any vector without DIMENSIONS components fails the whole batch."""
+        # ARRANGE
+        payload = {"data": [{"embedding": v} for v in vectors], "usage": {"total_tokens": 10}}
+        mock_create.return_value = SimpleNamespace(model_dump=lambda: payload)
 
-            # ASSERT - No division by zero, cost is 0
-            assert len(embeddings) == 1
-            assert embeddings[0].cost_usd == 0.0
+        # ACT & ASSERT
+        with pytest.raises(DimensionMismatchError, match=f"Expected 3072 dimensions, got {got}"):
+            await embedder.embed_chunks(_numbered_chunks(2), "test_sha")
+
+    @pytest.mark.parametrize("returned", [0, 1, 3])
+    async def test_response_count_mismatch_raises_error(self, embedder, mock_create, returned):
+        """A response with more or fewer vectors than inputs fails the batch."""
+        # ARRANGE
+        payload = {
+            "data": [{"embedding": _VEC_3072_A} for _ in range(returned)],
+            "usage": {"total_tokens": 10},
+        }
+        mock_create.return_value = SimpleNamespace(model_dump=lambda: payload)
+
+        # ACT & ASSERT
+        with pytest.raises(APIError, match=f"Expected 2 embeddings, got {returned}"):
+            await embedder.embed_chunks(_numbered_chunks(2), "test_sha")
+
+
+@pytest.mark.anyio
+class TestRateLimiting:
+    """Test client-side throttling to the per-minute quotas."""
+
+    async def test_back_to_back_batches_wait_for_token_quota(
+        self, embedder, mock_create, monkeypatch
+    ):
+        """A second batch that would overdraw tokens/min waits for the bucket to refill."""
+        # ARRANGE - fake clock advanced only by the limiter's sleeps; a 300k
+        # tokens/min bucket holds one 200k-token batch but not two
+        now = 0.0
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay):
+            nonlocal now
+            sleeps.append(delay)
+            now += delay
+
+        monkeypatch.setattr("gitctx.models.ratelimit.asyncio.sleep", fake_sleep)
+        monkeypatch.setattr(
+            embedder, "_token_limiter", AsyncRateLimiter(300_000, clock=lambda: now)
+        )
+        monkeypatch.setattr(embedder, "max_tokens_per_batch", 200_000)
+        chunks = [
+            CodeChunk(content=f"big{i}", start_line=1, end_line=1, token_count=100_000, metadata={})
+            for i in range(4)
+        ]
+        mock_create.side_effect = lambda *, input, **_: _batch_response(len(input))
+
+        # ACT
+        embeddings = await embedder.embed_chunks(chunks, "test_sha")
+
+        # ASSERT - first batch goes out at once; the second waits for the
+        # 100k missing tokens to refill at 5k/s = 20s
+        assert mock_create.call_count == 2
+        assert sleeps == [pytest.approx(20.0)]
+        assert len(embeddings) == 4
+
+    def test_invalid_quota_rejected(self):
+        """A non-positive per-minute quota is a configuration error."""
+        with pytest.raises(ValueError, match="rate_per_minute must be > 0"):
+            OpenAIEmbedder(api_key="test-key", tokens_per_minute=0)
 
 
 class TestEstimateCost:
     """Test estimate_cost() method directly."""
 
-    def test_estimate_cost_1_million_tokens(self):
-        """1 million tokens costs $0.13."""
-        embedder = OpenAIEmbedder(api_key="test-key")
-        cost = embedder.estimate_cost(1_000_000)
-        assert abs(cost - 0.13) < 0.0000001
-
-    def test_estimate_cost_1000_tokens(self):
-        """1000 tokens costs $0.00013."""
-        embedder = OpenAIEmbedder(api_key="test-key")
-        cost = embedder.estimate_cost(1000)
-        assert abs(cost - 0.00013) < 0.0000001
+    @pytest.mark.parametrize(
+        ("tokens", "expected"),
+        [
+            (1_000_000, 0.13),  # $0.13 per 1M tokens
+            (500_000, 0.065),
+            (1000, 0.00013),
+            (200, 0.000026),
+            (12_345, 0.00160485),
+            (0, 0.0),
+        ],
+    )
+    def test_estimate_cost(self, embedder, tokens, expected):
+        """Cost scales linearly at $0.13 per million tokens, with no float drift."""
+        # ACT
+        cost = embedder.estimate_cost(tokens)
 
-    def test_estimate_cost_zero_tokens(self):
-        """Zero tokens costs $0."""
-        embedder = OpenAIEmbedder(api_key="test-key")
-        cost = embedder.estimate_cost(0)
-        assert cost == 0.0
+        # ASSERT - integer pricing makes these exact, not just approximately equal
+        assert cost == expected
@@ -0,0 +1,181 @@
+"""Unit tests for BatchingEmbedder."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from gitctx.indexing.types import CodeChunk, Embedding
+from gitctx.models.batching import BatchingEmbedder
+from gitctx.models.errors import APIError
+
+
+def _chunks(n: int, prefix: str) -> list[CodeChunk]:
+    return [
+        CodeChunk(content=f"{prefix}_{i}", start_line=1, end_line=1, token_count=5, metadata={})
+        for i in range(n)
+    ]
+
+
+def _fake_embedder() -> AsyncMock:
+    """Embedder that encodes each chunk's content length into its vector."""
+
+    async def embed_chunks(chunks, blob_sha):
+        return [
+            Embedding(
+                vector=[float(len(chunk.content))],
+                token_count=chunk.token_count,
+                model="test-model",
+                cost_usd=0.0001,
+                blob_sha=blob_sha,
+                chunk_index=idx,
+            )
+            for idx, chunk in enumerate(chunks)
+        ]
+
+    embedder = AsyncMock()
+    embedder.embed_chunks.side_effect = embed_chunks
+    return embedder
+
+
+@pytest.mark.anyio
+class TestBatchingEmbedder:
+    """Test request merging and result splitting."""
+
+    async def test_concurrent_submissions_share_one_call(self):
+        """Concurrent blobs are embedded with a single underlying request."""
+        # ARRANGE
+        inner = _fake_embedder()
+        batcher = BatchingEmbedder(inner, batch_size=100, flush_interval_ms=5)
+
+        # ACT
+        first, second = await asyncio.gather(
+            batcher.embed_chunks(_chunks(2, "a"), "sha_a"),
+            batcher.embed_chunks(_chunks(3, "bb"), "sha_b"),
+        )
+
+        # ASSERT - one merged call with all 5 chunks, not labelled as either blob
+        assert inner.embed_chunks.await_count == 1
+        assert len(inner.embed_chunks.await_args.args[0]) == 5
+        assert inner.embed_chunks.await_args.args[1] not in {"sha_a", "sha_b"}
+
+        # ASSERT - results split back with per-blob metadata
+        assert [(e.blob_sha, e.chunk_index) for e in first] == [("sha_a", 0), ("sha_a", 1)]
+        assert [(e.blob_sha, e.chunk_index) for e in second] == [
+            ("sha_b", 0),
+            ("sha_b", 1),
+            ("sha_b", 2),
+        ]
+        assert [e.vector for e in second] == [[4.0], [4.0], [4.0]]
+
+    async def test_batch_size_splits_requests(self):
+        """Pending chunks beyond batch_size go out in separate requests."""
+        # ARRANGE
+        inner = _fake_embedder()
+        batcher = BatchingEmbedder(inner, batch_size=4, flush_interval_ms=5)
+
+        # ACT
+        results = await asyncio.gather(
+            *(batcher.embed_chunks(_chunks(2, f"c{i}"), f"sha_{i}") for i in range(3))
+        )
+
+        # ASSERT - 6 chunks at batch_size=4 → 2 requests (4 + 2)
+        assert inner.embed_chunks.await_count == 2
+        assert [len(r) for r in results] == [2, 2, 2]
+
+    async def test_error_propagates_to_every_submission(self):
+        """A failed batch raises in every caller that joined it."""
+        # ARRANGE
+        inner = AsyncMock()
+        inner.embed_chunks.side_effect = RuntimeError("API down")
+        batcher = BatchingEmbedder(inner, flush_interval_ms=5)
+
+        # ACT
+        results = await asyncio.gather(
+            batcher.embed_chunks(_chunks(1, "a"), "sha_a"),
+            batcher.embed_chunks(_chunks(1, "b"), "sha_b"),
+            return_exceptions=True,
+        )
+
+        # ASSERT
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_failing_submission_does_not_fail_its_batch_mates(self):
+        """Only the submission that fails on its own raises; the other still succeeds."""
+        # ARRANGE - provider rejects any request containing the "bad" chunk
+        inner = _fake_embedder()
+        embed = inner.embed_chunks.side_effect
+
+        async def embed_rejecting_bad(chunks, blob_sha):
+            if any(chunk.content.startswith("bad") for chunk in chunks):
+                raise APIError("Invalid input")
+            return await embed(chunks, blob_sha)
+
+        inner.embed_chunks.side_effect = embed_rejecting_bad
+        batcher = BatchingEmbedder(inner, batch_size=100, flush_interval_ms=5)
+
+        # ACT
+        good, bad = await asyncio.gather(
+            batcher.embed_chunks(_chunks(2, "good"), "sha_good"),
+            batcher.embed_chunks(_chunks(1, "bad"), "sha_bad"),
+            return_exceptions=True,
+        )
+
+        # ASSERT - merged call failed, then each submission was retried alone
+        assert inner.embed_chunks.await_count == 3
+        assert isinstance(bad, APIError)
+        assert [(e.blob_sha, e.chunk_index) for e in good] == [("sha_good", 0), ("sha_good", 1)]
+
+    async def test_short_response_raises_for_every_submission(self):
+        """A provider response missing embeddings fails the batch instead of misaligning it."""
+        # ARRANGE - provider drops the last embedding of the merged batch
+        inner = _fake_embedder()
+        embed = inner.embed_chunks.side_effect
+
+        async def embed_short(chunks, blob_sha):
+            return (await embed(chunks, blob_sha))[:-1]
+
+        inner.embed_chunks.side_effect = embed_short
+        batcher = BatchingEmbedder(inner, flush_interval_ms=5)
+
+        # ACT
+        results = await asyncio.gather(
+            batcher.embed_chunks(_chunks(2, "a"), "sha_a"),
+            batcher.embed_chunks(_chunks(1, "b"), "sha_b"),
+            return_exceptions=True,
+        )
+
+        # ASSERT
+        assert all(isinstance(r, APIError) for r in results)
+
+    async def test_empty_chunks_skip_api(self):
+        """Empty submissions return immediately without an API call."""
+        inner = _fake_embedder()
+        batcher = BatchingEmbedder(inner)
+
+        assert await batcher.embed_chunks([], "sha") == []
+        inner.embed_chunks.assert_not_called()
+
+
+class TestBatchingEmbedderConfig:
+    """Test constructor validation and delegation."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"batch_size": 0}, "batch_size"),
+            ({"flush_interval_ms": -1}, "flush_interval_ms"),
+        ],
+    )
+    def test_invalid_config_rejected(self, kwargs, match):
+        """Out-of-range settings raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            BatchingEmbedder(Mock(), **kwargs)
+
+    def test_estimate_cost_delegates(self):
+        """estimate_cost is answered by the wrapped embedder."""
+        inner = Mock()
+        inner.estimate_cost.return_value = 0.13
+
+        assert BatchingEmbedder(inner).estimate_cost(1_000_000) == 0.13
+        inner.estimate_cost.assert_called_once_with(1_000_000)
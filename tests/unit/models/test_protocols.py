@@ -1,5 +1,6 @@
 """Unit tests for EmbedderProtocol."""
 
+import numpy as np
 import pytest
 
 from gitctx.indexing.types import Embedding
@@ -33,18 +34,19 @@ class TestEmbedderProtocol:
         """Test embedding dimension validation for different models."""
         if expected_valid:
             embedding = Embedding(
-                vector=[0.1] * dimensions,
+                vector=np.zeros(dimensions, dtype=np.float32),
                 token_count=100,
                 model="test-model",
                 cost_usd=0.00001,
                 blob_sha="sha",
                 chunk_index=0,
             )
-            assert len(embedding.vector) == dimensions
+            assert embedding.vector.shape == (dimensions,)
+            assert embedding.vector.dtype == np.float32
         else:
             # For 0 dimensions, embedding creation works but vector is empty
             embedding = Embedding(
-                vector=[],
+                vector=np.zeros(0, dtype=np.float32),
                 token_count=100,
                 model="test-model",
                 cost_usd=0.00001,
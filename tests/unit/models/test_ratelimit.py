@@ -0,0 +1,74 @@
+"""Unit tests for AsyncRateLimiter."""
+
+import pytest
+
+from gitctx.models.ratelimit import AsyncRateLimiter
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    """Fake clock whose time only advances through the limiter's sleeps.
+
+    Returns (clock, sleeps): pass clock to AsyncRateLimiter; sleeps records
+    every delay the limiter waited for.
+    """
+    now = 0.0
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        nonlocal now
+        sleeps.append(delay)
+        now += delay
+
+    monkeypatch.setattr("gitctx.models.ratelimit.asyncio.sleep", fake_sleep)
+    return (lambda: now), sleeps
+
+
+@pytest.mark.anyio
+class TestAsyncRateLimiter:
+    """Test token-bucket throttling."""
+
+    async def test_burst_up_to_quota_does_not_wait(self, fake_time):
+        """A full bucket serves the whole quota immediately."""
+        # ARRANGE
+        clock, sleeps = fake_time
+        limiter = AsyncRateLimiter(60, clock=clock)
+
+        # ACT
+        for _ in range(60):
+            await limiter.acquire()
+
+        # ASSERT
+        assert sleeps == []
+
+    async def test_waits_for_refill_when_empty(self, fake_time):
+        """Once drained, acquire() waits exactly as long as the deficit takes to refill."""
+        # ARRANGE - 60/min refills 1 unit per second
+        clock, sleeps = fake_time
+        limiter = AsyncRateLimiter(60, clock=clock)
+        await limiter.acquire(60)
+
+        # ACT
+        await limiter.acquire(5)
+
+        # ASSERT
+        assert sleeps == [pytest.approx(5.0)]
+
+    async def test_request_larger_than_quota_is_clamped(self, fake_time):
+        """An amount above the quota waits for a full bucket instead of forever."""
+        # ARRANGE
+        clock, sleeps = fake_time
+        limiter = AsyncRateLimiter(60, clock=clock)
+        await limiter.acquire(60)
+
+        # ACT
+        await limiter.acquire(1_000)
+
+        # ASSERT
+        assert sleeps == [pytest.approx(60.0)]
+
+    @pytest.mark.parametrize("rate", [0, -1])
+    def test_non_positive_rate_rejected(self, rate):
+        """The quota must be positive."""
+        with pytest.raises(ValueError, match="rate_per_minute must be > 0"):
+            AsyncRateLimiter(rate)
@@ -25,3 +25,15 @@ def store(tmp_path: Path) -> LanceDBStore:
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     db_path.parent.mkdir(parents=True, exist_ok=True)
     return LanceDBStore(db_path)
+
+
+@pytest.fixture
+def mock_get_embedder(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the get_embedder() QueryEmbedder calls, so no provider is built.
+
+    The provider it returns is mock_get_embedder.return_value; set its
+    embed_query.return_value / side_effect per test.
+    """
+    get_embedder = Mock()
+    monkeypatch.setattr("gitctx.search.embeddings.get_embedder", get_embedder)
+    return get_embedder
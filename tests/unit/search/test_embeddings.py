@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import numpy as np
 import openai
@@ -41,7 +41,9 @@ def test_token_limit_exceeded_raises_validation_error(settings: Mock, store: Lan
         embedder.embed_query(long_query)
 
 
-def test_valid_query_passes_validation(settings: Mock, test_embedding_vector) -> None:
+def test_valid_query_passes_validation(
+    settings: Mock, mock_get_embedder: Mock, test_embedding_vector
+) -> None:
     """Test that valid query passes validation and returns embedding."""
 
     # Mock store with cache methods
@@ -50,26 +52,22 @@ def test_valid_query_passes_validation(settings: Mock, test_embedding_vector) ->
 
     # Mock the embedder to return a vector
     expected_vector = test_embedding_vector()
+    mock_get_embedder.return_value.embed_query.return_value = expected_vector
 
-    # Patch OpenAIProvider to avoid real API calls
-    with patch("gitctx.models.providers.openai.OpenAIProvider") as MockProvider:
-        mock_instance = Mock()
-        mock_instance.embed_query.return_value = expected_vector
-        MockProvider.return_value = mock_instance
-
-        with patch("gitctx.models.factory.get_embedder", return_value=mock_instance):
-            embedder = QueryEmbedder(settings, mock_store)
-            result = embedder.embed_query("valid test query")
+    embedder = QueryEmbedder(settings, mock_store)
+    result = embedder.embed_query("valid test query")
 
-            # Verify embedding was generated
-            assert result.shape == (3072,)
-            assert np.array_equal(result, expected_vector)
+    # Verify embedding was generated
+    assert result.shape == (3072,)
+    assert np.array_equal(result, expected_vector)
 
-            # Verify cache was called
-            mock_store.cache_query_embedding.assert_called_once()
+    # Verify cache was called
+    mock_store.cache_query_embedding.assert_called_once()
 
 
-def test_cache_hit_skips_api_call(settings: Mock, test_embedding_vector) -> None:
+def test_cache_hit_skips_api_call(
+    settings: Mock, mock_get_embedder: Mock, test_embedding_vector
+) -> None:
     """Test that cache hit skips API call."""
 
     # Mock store with cached embedding
@@ -77,16 +75,17 @@ def test_cache_hit_skips_api_call(settings: Mock, test_embedding_vector) -> None
     cached_vector = test_embedding_vector()
     mock_store.get_query_embedding.return_value = cached_vector
 
-    with patch("gitctx.models.factory.get_embedder") as mock_get_embedder:
-        embedder = QueryEmbedder(settings, mock_store)
-        result = embedder.embed_query("cached query")
+    embedder = QueryEmbedder(settings, mock_store)
+    result = embedder.embed_query("cached query")
 
-        # API should NOT be called
-        assert not mock_get_embedder.called
-        assert np.array_equal(result, cached_vector)
+    # API should NOT be called
+    assert not mock_get_embedder.called
+    assert np.array_equal(result, cached_vector)
 
 
-def test_cache_miss_calls_api(settings: Mock, test_embedding_vector) -> None:
+def test_cache_miss_calls_api(
+    settings: Mock, mock_get_embedder: Mock, test_embedding_vector
+) -> None:
     """Test that cache miss calls API."""
 
     # Mock store with no cached embedding
@@ -94,22 +93,20 @@ def test_cache_miss_calls_api(settings: Mock, test_embedding_vector) -> None:
     mock_store.get_query_embedding.return_value = None
 
     expected_vector = test_embedding_vector()
+    provider = mock_get_embedder.return_value
+    provider.embed_query.return_value = expected_vector
 
-    with patch("gitctx.models.providers.openai.OpenAIProvider") as MockProvider:
-        mock_instance = Mock()
-        mock_instance.embed_query.return_value = expected_vector
-        MockProvider.return_value = mock_instance
-
-        with patch("gitctx.models.factory.get_embedder", return_value=mock_instance):
-            embedder = QueryEmbedder(settings, mock_store)
-            result = embedder.embed_query("new query")
+    embedder = QueryEmbedder(settings, mock_store)
+    result = embedder.embed_query("new query")
 
-            # API should be called
-            assert mock_instance.embed_query.called
-            assert np.array_equal(result, expected_vector)
+    # API should be called
+    assert provider.embed_query.called
+    assert np.array_equal(result, expected_vector)
 
 
-def test_generated_embedding_cached(settings: Mock, test_embedding_vector) -> None:
+def test_generated_embedding_cached(
+    settings: Mock, mock_get_embedder: Mock, test_embedding_vector
+) -> None:
     """Test that generated embedding is cached."""
 
     # Mock store
@@ -117,21 +114,16 @@ def test_generated_embedding_cached(settings: Mock, test_embedding_vector) -> No
     mock_store.get_query_embedding.return_value = None
 
     generated_vector = test_embedding_vector()
+    mock_get_embedder.return_value.embed_query.return_value = generated_vector
 
-    with patch("gitctx.models.providers.openai.OpenAIProvider") as MockProvider:
-        mock_instance = Mock()
-        mock_instance.embed_query.return_value = generated_vector
-        MockProvider.return_value = mock_instance
-
-        with patch("gitctx.models.factory.get_embedder", return_value=mock_instance):
-            embedder = QueryEmbedder(settings, mock_store)
-            embedder.embed_query("new query for caching")
+    embedder = QueryEmbedder(settings, mock_store)
+    embedder.embed_query("new query for caching")
 
-            # Cache should be called with the generated vector
-            mock_store.cache_query_embedding.assert_called_once()
-            call_args = mock_store.cache_query_embedding.call_args[0]
-            assert call_args[1] == "new query for caching"
-            assert np.array_equal(call_args[2], generated_vector)
+    # Cache should be called with the generated vector
+    mock_store.cache_query_embedding.assert_called_once()
+    call_args = mock_store.cache_query_embedding.call_args[0]
+    assert call_args[1] == "new query for caching"
+    assert np.array_equal(call_args[2], generated_vector)
 
 
 @pytest.mark.parametrize(
@@ -172,7 +164,7 @@ def test_generated_embedding_cached(settings: Mock, test_embedding_vector) -> No
     ],
 )
 def test_api_errors_transformed(
-    settings: Mock, exception: Exception, expected_message: str
+    settings: Mock, mock_get_embedder: Mock, exception: Exception, expected_message: str
 ) -> None:
     """Test that API errors are transformed to EmbeddingError."""
     from gitctx.search.embeddings import QueryEmbedder
@@ -181,20 +173,16 @@ def test_api_errors_transformed(
     mock_store = Mock()
     mock_store.get_query_embedding.return_value = None
 
-    # Mock at both levels to prevent real API calls
-    with patch("gitctx.models.providers.openai.OpenAIProvider") as MockProvider:
-        mock_embedder = Mock()
-        mock_embedder.embed_query.side_effect = exception
-        MockProvider.return_value = mock_embedder
+    # Provider raises the API error (no real API calls)
+    mock_get_embedder.return_value.embed_query.side_effect = exception
 
-        with patch("gitctx.models.factory.get_embedder", return_value=mock_embedder):
-            embedder = QueryEmbedder(settings, mock_store)
+    embedder = QueryEmbedder(settings, mock_store)
 
-            with pytest.raises(EmbeddingError, match=expected_message):
-                embedder.embed_query("test query")
+    with pytest.raises(EmbeddingError, match=expected_message):
+        embedder.embed_query("test query")
 
 
-def test_authentication_error_transformation(settings: Mock) -> None:
+def test_authentication_error_transformation(settings: Mock, mock_get_embedder: Mock) -> None:
     """Test that AuthenticationError is transformed to EmbeddingError."""
 
     # Mock store with no cache
@@ -209,20 +197,16 @@ def test_authentication_error_transformation(settings: Mock) -> None:
     )
 
     # Mock embedder to raise AuthenticationError
-    with patch("gitctx.models.providers.openai.OpenAIProvider") as MockProvider:
-        mock_embedder = Mock()
-        mock_embedder.embed_query.side_effect = auth_error
-        MockProvider.return_value = mock_embedder
+    mock_get_embedder.return_value.embed_query.side_effect = auth_error
 
-        with patch("gitctx.models.factory.get_embedder", return_value=mock_embedder):
-            embedder = QueryEmbedder(settings, mock_store)
+    embedder = QueryEmbedder(settings, mock_store)
 
-            # ASSERT - Transformed to EmbeddingError with user-friendly message
-            with pytest.raises(EmbeddingError, match="API key rejected"):
-                embedder.embed_query("test query")
+    # ASSERT - Transformed to EmbeddingError with user-friendly message
+    with pytest.raises(EmbeddingError, match="API key rejected"):
+        embedder.embed_query("test query")
 
 
-def test_non_5xx_api_status_error_reraise(settings: Mock) -> None:
+def test_non_5xx_api_status_error_reraise(settings: Mock, mock_get_embedder: Mock) -> None:
     """Test that non-5xx APIStatusError is re-raised unchanged."""
 
     # Mock store with no cache
@@ -237,20 +221,16 @@ def test_non_5xx_api_status_error_reraise(settings: Mock) -> None:
     )
 
     # Mock embedder to raise client error
-    with patch("gitctx.models.providers.openai.OpenAIProvider") as MockProvider:
-        mock_embedder = Mock()
-        mock_embedder.embed_query.side_effect = client_error
-        MockProvider.return_value = mock_embedder
+    mock_get_embedder.return_value.embed_query.side_effect = client_error
 
-        with patch("gitctx.models.factory.get_embedder", return_value=mock_embedder):
-            embedder = QueryEmbedder(settings, mock_store)
+    embedder = QueryEmbedder(settings, mock_store)
 
-            # ASSERT - Re-raised as APIStatusError (not transformed)
-            with pytest.raises(openai.APIStatusError):
-                embedder.embed_query("test query")
+    # ASSERT - Re-raised as APIStatusError (not transformed)
+    with pytest.raises(openai.APIStatusError):
+        embedder.embed_query("test query")
 
 
-def test_generic_exception_catchall(settings: Mock) -> None:
+def test_generic_exception_catchall(settings: Mock, mock_get_embedder: Mock) -> None:
     """Test that unexpected exceptions are caught and transformed."""
 
     # Mock store with no cache
@@ -261,16 +241,10 @@ def test_generic_exception_catchall(settings: Mock) -> None:
     unexpected_error = ValueError("Something unexpected happened")
 
     # Mock embedder to raise unexpected error
-    with patch("gitctx.models.providers.openai.OpenAIProvider") as MockProvider:
-        mock_embedder = Mock()
-        mock_embedder.embed_query.side_effect = unexpected_error
-        MockProvider.return_value = mock_embedder
-
-        with patch("gitctx.models.factory.get_embedder", return_value=mock_embedder):
-            embedder = QueryEmbedder(settings, mock_store)
-
-            # ASSERT - Transformed to EmbeddingError with original message
-            with pytest.raises(
-                EmbeddingError, match="Unexpected error during embedding generation"
-            ):
-                embedder.embed_query("test query")
+    mock_get_embedder.return_value.embed_query.side_effect = unexpected_error
+
+    embedder = QueryEmbedder(settings, mock_store)
+
+    # ASSERT - Transformed to EmbeddingError with original message
+    with pytest.raises(EmbeddingError, match="Unexpected error during embedding generation"):
+        embedder.embed_query("test query")
@@ -1,23 +1,53 @@
-"""Unit tests for EmbeddingCache."""
+"""Unit tests for EmbeddingCache.
+
+Tests run spread across xdist workers in any order. The module-scoped
+cache_root is shared, so each test must confine itself to its own
+cache_model directory (or its own tmp_path).
+"""
+
+import struct
 
 import numpy as np
 import pytest
 import zstandard as zstd
 
 from gitctx.indexing.types import Embedding
-from gitctx.storage.embedding_cache import EmbeddingCache
+from gitctx.storage.embedding_cache import EmbeddingCache, chunk_content_key
 
 # zstd magic number: 0x28B52FFD (little-endian byte sequence)
 ZSTD_MAGIC_BYTES = b"\x28\xb5\x2f\xfd"
 
+# Reference vectors in the cache's on-disk dtype, so roundtrips compare exactly
+_REF_VEC_A = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+_REF_VEC_B = np.array([0.4, 0.5, 0.6], dtype=np.float32)
+_REF_VEC_A.flags.writeable = False
+_REF_VEC_B.flags.writeable = False
+
+
+def _cache_file(root, model, sha, suffix=".safetensors.zst"):
+    """On-disk location of a cache entry (the layout these tests pin down)."""
+    return root / "embeddings" / model / f"{sha}{suffix}"
+
+
+@pytest.fixture(scope="module")
+def cache_root(tmp_path_factory):
+    """One cache root per module; tests stay isolated through their own model dir."""
+    return tmp_path_factory.mktemp("emb_cache")
+
+
+@pytest.fixture
+def cache_model(request):
+    """Model name unique to the requesting test, so entries never collide under cache_root."""
+    return f"test-model-{request.node.name}"
+
 
 class TestEmbeddingCache:
     """Test EmbeddingCache storage and retrieval."""
 
-    def test_cache_miss_returns_none(self, tmp_path):
+    def test_cache_miss_returns_none(self, cache_root, cache_model):
         """Test cache returns None for missing blob SHA."""
         # ARRANGE
-        cache = EmbeddingCache(tmp_path, model="test-model")
+        cache = EmbeddingCache(cache_root, model=cache_model)
 
         # ACT
         result = cache.get("nonexistent_sha")
@@ -25,13 +55,13 @@ class TestEmbeddingCache:
         # ASSERT
         assert result is None
 
-    def test_cache_hit_returns_embeddings(self, tmp_path):
+    def test_cache_hit_returns_embeddings(self, cache_root, cache_model):
         """Test cache returns stored embeddings."""
         # ARRANGE
-        cache = EmbeddingCache(tmp_path, model="test-model")
+        cache = EmbeddingCache(cache_root, model=cache_model)
         embeddings = [
             Embedding(
-                vector=[0.1, 0.2, 0.3],
+                vector=_REF_VEC_A,
                 token_count=50,
                 model="test-model",
                 cost_usd=0.0000065,
@@ -47,15 +77,43 @@ class TestEmbeddingCache:
         # ASSERT
         assert result is not None
         assert len(result) == 1
-        # Float32 precision - use approximate comparison
         assert len(result[0].vector) == 3
-        assert pytest.approx(result[0].vector, rel=1e-5) == [0.1, 0.2, 0.3]
+        # Reference is already float32, so the stored vector must match bit for bit
+        assert np.array_equal(result[0].vector, _REF_VEC_A)
+        assert result[0].vector.dtype == np.float32  # Returned as-is, no list conversion
         assert result[0].token_count == 50
 
-    def test_cache_set_creates_file(self, tmp_path):
+    def test_cache_hit_vectors_view_one_buffer(self, cache_root, cache_model):
+        """Cached vectors are read-only views of the decompressed entry, not copies."""
+        # ARRANGE
+        cache = EmbeddingCache(cache_root, model=cache_model)
+        cache.set(
+            "test_sha",
+            [
+                Embedding(
+                    vector=np.full(4, i, dtype=np.float32),
+                    token_count=1,
+                    model="test-model",
+                    cost_usd=0.0,
+                    blob_sha="test_sha",
+                    chunk_index=i,
+                )
+                for i in range(2)
+            ],
+        )
+
+        # ACT
+        result = cache.get("test_sha")
+
+        # ASSERT
+        assert result is not None
+        assert [r.vector.tolist() for r in result] == [[0.0] * 4, [1.0] * 4]
+        assert not any(r.vector.flags.owndata or r.vector.flags.writeable for r in result)
+
+    def test_cache_set_creates_file(self, cache_root, cache_model):
         """Test cache creates compressed safetensor file."""
         # ARRANGE
-        cache = EmbeddingCache(tmp_path, model="test-model")
+        cache = EmbeddingCache(cache_root, model=cache_model)
         embeddings = [
             Embedding(
                 vector=[0.1, 0.2],
@@ -71,23 +129,23 @@ class TestEmbeddingCache:
         cache.set("abc123", embeddings)
 
         # ASSERT
-        cache_file = tmp_path / "embeddings" / "test-model" / "abc123.safetensors.zst"
+        cache_file = _cache_file(cache_root, cache_model, "abc123")
         assert cache_file.exists()
 
-    def test_cache_directory_created(self, tmp_path):
+    def test_cache_directory_created(self, cache_root, cache_model):
         """Test cache creates directory structure."""
         # ARRANGE & ACT
-        _ = EmbeddingCache(tmp_path, model="test-model")
+        _ = EmbeddingCache(cache_root, model=cache_model)
 
         # ASSERT
-        cache_dir = tmp_path / "embeddings" / "test-model"
+        cache_dir = cache_root / "embeddings" / cache_model
         assert cache_dir.exists()
         assert cache_dir.is_dir()
 
-    def test_cache_key_is_blob_sha(self, tmp_path):
+    def test_cache_key_is_blob_sha(self, cache_root, cache_model):
         """Test cache uses blob SHA as filename."""
         # ARRANGE
-        cache = EmbeddingCache(tmp_path, model="test-model")
+        cache = EmbeddingCache(cache_root, model=cache_model)
         embeddings = [
             Embedding(
                 vector=[0.5],
@@ -103,16 +161,16 @@ class TestEmbeddingCache:
         cache.set("unique_sha_456", embeddings)
 
         # ASSERT
-        cache_file = tmp_path / "embeddings" / "test-model" / "unique_sha_456.safetensors.zst"
+        cache_file = _cache_file(cache_root, cache_model, "unique_sha_456")
         assert cache_file.exists()
 
-    def test_cache_roundtrip(self, tmp_path):
+    def test_cache_roundtrip(self, cache_root, cache_model):
         """Test cache roundtrip: set then get returns same data."""
         # ARRANGE
-        cache = EmbeddingCache(tmp_path, model="roundtrip-model")
+        cache = EmbeddingCache(cache_root, model=cache_model)
         original_embeddings = [
             Embedding(
-                vector=[0.1, 0.2, 0.3],
+                vector=_REF_VEC_A,
                 token_count=75,
                 model="roundtrip-model",
                 cost_usd=0.00000975,
@@ -120,7 +178,7 @@ class TestEmbeddingCache:
                 chunk_index=0,
             ),
             Embedding(
-                vector=[0.4, 0.5, 0.6],
+                vector=_REF_VEC_B,
                 token_count=100,
                 model="roundtrip-model",
                 cost_usd=0.000013,
@@ -136,24 +194,87 @@ class TestEmbeddingCache:
         # ASSERT
         assert loaded_embeddings is not None
         assert len(loaded_embeddings) == 2
-        # Float32 precision - use approximate comparison
-        assert pytest.approx(loaded_embeddings[0].vector, rel=1e-5) == original_embeddings[0].vector
+        # float32 references survive the roundtrip exactly
+        assert np.array_equal(loaded_embeddings[0].vector, _REF_VEC_A)
         assert loaded_embeddings[0].token_count == original_embeddings[0].token_count
-        assert pytest.approx(loaded_embeddings[1].vector, rel=1e-5) == original_embeddings[1].vector
+        assert np.array_equal(loaded_embeddings[1].vector, _REF_VEC_B)
 
-    def test_cache_handles_corrupted_files(self, tmp_path):
+    def test_cache_handles_corrupted_files(self, cache_root, cache_model):
         """Test cache handles corrupted compressed files gracefully."""
         # ARRANGE
-        cache = EmbeddingCache(tmp_path, model="test-model")
-        cache_file = tmp_path / "embeddings" / "test-model" / "corrupted.safetensors.zst"
+        cache = EmbeddingCache(cache_root, model=cache_model)
+        cache_file = _cache_file(cache_root, cache_model, "corrupted")
         cache_file.parent.mkdir(parents=True, exist_ok=True)
-        cache_file.write_text("CORRUPTED DATA")
+        cache_file.write_bytes(b"CORRUPTED DATA")
 
         # ACT & ASSERT
         # Should return None on decompression failure
         result = cache.get("corrupted")
         assert result is None
 
+    def test_cache_handles_oversized_header_length(self, cache_root, cache_model):
+        """Test a valid zstd frame whose safetensors header length overruns the data."""
+        # ARRANGE - 8-byte header length claiming 2**63 bytes, no header follows
+        cache = EmbeddingCache(cache_root, model=cache_model)
+        cache_file = _cache_file(cache_root, cache_model, "truncated")
+        cache_file.write_bytes(zstd.ZstdCompressor().compress(struct.pack("<Q", 2**63)))
+
+        # ACT
+        result = cache.get("truncated")
+
+        # ASSERT
+        assert result is None
+
+
+class TestEmbeddingCacheAgetChunks:
+    """Test parallel batch lookup."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("count", [0, 8])
+    async def test_aget_chunks_returns_hits_only(self, tmp_path, count):
+        """Cached content keys are returned with their embedding; misses are omitted."""
+        # ARRANGE - count cached chunks plus one never-stored key
+        cache = EmbeddingCache(tmp_path, model="test-model", max_workers=4)
+        keys = [chunk_content_key(f"def f{i}(): pass") for i in range(count)]
+        for i, key in enumerate(keys):
+            cache.set_chunk(
+                key,
+                Embedding(
+                    vector=np.full(4, i, dtype=np.float32),
+                    token_count=i,
+                    model="test-model",
+                    cost_usd=0.0,
+                    blob_sha=key,
+                    chunk_index=0,
+                ),
+            )
+        missing = chunk_content_key("never embedded")
+
+        # ACT
+        hits = await cache.aget_chunks([*keys, missing])
+
+        # ASSERT
+        assert sorted(hits) == sorted(keys)
+        assert all(hits[key].token_count == i for i, key in enumerate(keys))
+        cache.close()
+
+    @pytest.mark.anyio
+    async def test_aget_chunks_reuses_one_executor(self, tmp_path):
+        """Lookups share the cache's reader pool; close() shuts it down."""
+        # ARRANGE
+        cache = EmbeddingCache(tmp_path, model="test-model")
+        keys = [chunk_content_key(f"def f{i}(): pass") for i in range(3)]
+
+        # ACT
+        await cache.aget_chunks(keys)
+        executor = cache._executor
+        await cache.aget_chunks(keys)
+
+        # ASSERT
+        assert cache._executor is executor
+        cache.close()
+        assert "_executor" not in cache.__dict__
+
 
 class TestEmbeddingCacheCompression:
     """Test EmbeddingCache compression with zstd."""
@@ -179,9 +300,9 @@ class TestEmbeddingCacheCompression:
         cache.set("test_sha", embeddings)
 
         # ASSERT
-        compressed_file = tmp_path / "embeddings" / "test-model" / "test_sha.safetensors.zst"
+        compressed_file = _cache_file(tmp_path, "test-model", "test_sha")
         assert compressed_file.exists()
-        uncompressed_file = tmp_path / "embeddings" / "test-model" / "test_sha.safetensors"
+        uncompressed_file = _cache_file(tmp_path, "test-model", "test_sha", suffix=".safetensors")
         assert not uncompressed_file.exists()
 
     def test_set_compresses_safetensors_bytes(self, tmp_path, test_embedding_vector):
@@ -203,7 +324,7 @@ class TestEmbeddingCacheCompression:
         cache.set("compress_sha", embeddings)
 
         # ASSERT - File should start with zstd magic bytes
-        compressed_file = tmp_path / "embeddings" / "test-model" / "compress_sha.safetensors.zst"
+        compressed_file = _cache_file(tmp_path, "test-model", "compress_sha")
         compressed_bytes = compressed_file.read_bytes()
         assert compressed_bytes[:4] == ZSTD_MAGIC_BYTES
 
@@ -309,7 +430,7 @@ class TestEmbeddingCacheCompression:
         cache.set("dir_sha", embeddings)
 
         # ASSERT
-        cache_file = cache_dir / "embeddings" / "test-model" / "dir_sha.safetensors.zst"
+        cache_file = _cache_file(cache_dir, "test-model", "dir_sha")
         assert cache_file.exists()
 
     def test_set_overwrites_existing_cache_file(self, tmp_path, test_embedding_vector):
@@ -367,7 +488,7 @@ class TestEmbeddingCacheCompression:
         cache.set("size_sha", embeddings)
 
         # ASSERT
-        compressed_file = tmp_path / "embeddings" / "test-model" / "size_sha.safetensors.zst"
+        compressed_file = _cache_file(tmp_path, "test-model", "size_sha")
         compressed_size = compressed_file.stat().st_size
 
         # Decompress and check uncompressed size
@@ -426,7 +547,7 @@ class TestEmbeddingCacheCompression:
         # ASSERT
         assert loaded is not None
         # Verify file is compressed (starts with zstd magic)
-        compressed_file = tmp_path / "embeddings" / "test-model" / "decompress_sha.safetensors.zst"
+        compressed_file = _cache_file(tmp_path, "test-model", "decompress_sha")
         assert compressed_file.read_bytes()[:4] == ZSTD_MAGIC_BYTES
 
     def test_get_reconstructs_embeddings_identically(self, tmp_path, test_embedding_vector):
@@ -542,7 +663,7 @@ class TestEmbeddingCacheCompression:
         """Test get() returns None for corrupted compressed data."""
         # ARRANGE
         cache = EmbeddingCache(tmp_path, model="test-model")
-        corrupted_file = tmp_path / "embeddings" / "test-model" / "corrupted.safetensors.zst"
+        corrupted_file = _cache_file(tmp_path, "test-model", "corrupted")
         corrupted_file.parent.mkdir(parents=True, exist_ok=True)
         corrupted_file.write_bytes(b"CORRUPTED_ZSTD_DATA")
 
@@ -556,7 +677,7 @@ class TestEmbeddingCacheCompression:
         """Test get() logs warning on decompression failure."""
         # ARRANGE
         cache = EmbeddingCache(tmp_path, model="test-model")
-        corrupted_file = tmp_path / "embeddings" / "test-model" / "log_test.safetensors.zst"
+        corrupted_file = _cache_file(tmp_path, "test-model", "log_test")
         corrupted_file.parent.mkdir(parents=True, exist_ok=True)
         corrupted_file.write_bytes(b"INVALID_DATA")
 
@@ -571,9 +692,9 @@ class TestEmbeddingCacheCompression:
         """Test get() returns None for old .safetensors files (backward compat)."""
         # ARRANGE
         cache = EmbeddingCache(tmp_path, model="test-model")
-        old_file = tmp_path / "embeddings" / "test-model" / "old_blob.safetensors"
+        old_file = _cache_file(tmp_path, "test-model", "old_blob", suffix=".safetensors")
         old_file.parent.mkdir(parents=True, exist_ok=True)
-        old_file.write_text("OLD_SAFETENSORS_DATA")
+        old_file.write_bytes(b"OLD_SAFETENSORS_DATA")
 
         # ACT
         result = cache.get("old_blob")
@@ -601,6 +722,178 @@ class TestEmbeddingCacheCompression:
         cache.set("magic_sha", embeddings)
 
         # ASSERT
-        compressed_file = tmp_path / "embeddings" / "test-model" / "magic_sha.safetensors.zst"
+        compressed_file = _cache_file(tmp_path, "test-model", "magic_sha")
         magic_bytes = compressed_file.read_bytes()[:4]
         assert magic_bytes == ZSTD_MAGIC_BYTES
+
+
+class TestEmbeddingCacheQuantization:
+    """Test optional int8 quantization of cached vectors."""
+
+    @staticmethod
+    def _embeddings(vector, count: int = 1) -> list[Embedding]:
+        return [
+            Embedding(
+                vector=vector,
+                token_count=50,
+                model="test-model",
+                cost_usd=0.0000065,
+                blob_sha="quant_sha",
+                chunk_index=i,
+            )
+            for i in range(count)
+        ]
+
+    def test_quantized_roundtrip_within_tolerance(self, tmp_path, test_embedding_vector):
+        """Quantized vectors dequantize to float32 within 1% of the peak value."""
+        # ARRANGE
+        cache = EmbeddingCache(tmp_path, model="test-model", quantized=True)
+        original = test_embedding_vector().astype(np.float32)
+
+        # ACT
+        cache.set("quant_sha", self._embeddings(original))
+        loaded = cache.get("quant_sha")
+
+        # ASSERT
+        assert loaded is not None
+        assert loaded[0].vector.dtype == np.float32
+        assert loaded[0].vector.shape == original.shape
+        assert np.max(np.abs(loaded[0].vector - original)) < 0.01 * np.max(np.abs(original))
+        assert loaded[0].token_count == 50
+
+    def test_quantized_roundtrip_preserves_cosine_similarity(self, tmp_path):
+        """Dequantized vectors keep cosine similarity >= 0.999 with the original."""
+        # ARRANGE - deterministic mixed-sign vector, like real embeddings
+        cache = EmbeddingCache(tmp_path, model="test-model", quantized=True)
+        original = np.sin(np.arange(3072, dtype=np.float32)) * np.float32(0.05)
+
+        # ACT
+        cache.set("quant_sha", self._embeddings(original))
+        loaded = cache.get("quant_sha")
+
+        # ASSERT
+        assert loaded is not None
+        restored = loaded[0].vector
+        cosine = np.dot(original, restored) / (np.linalg.norm(original) * np.linalg.norm(restored))
+        assert cosine >= 0.999
+
+    def test_quantized_entry_is_smaller(self, tmp_path, test_embedding_vector):
+        """Quantized entries take roughly a quarter of the float32 payload."""
+        # ARRANGE
+        vector = test_embedding_vector().astype(np.float32)
+        full = EmbeddingCache(tmp_path / "full", model="test-model")
+        quant = EmbeddingCache(tmp_path / "quant", model="test-model", quantized=True)
+
+        # ACT
+        full.set("quant_sha", self._embeddings(vector, count=4))
+        quant.set("quant_sha", self._embeddings(vector, count=4))
+
+        # ASSERT - compare uncompressed safetensors payloads
+        def payload_size(cache: EmbeddingCache) -> int:
+            compressed = (cache.cache_dir / "quant_sha.safetensors.zst").read_bytes()
+            return len(zstd.ZstdDecompressor().decompress(compressed))
+
+        assert payload_size(quant) < payload_size(full) / 3
+
+    def test_quantized_entries_readable_without_flag(self, tmp_path, test_embedding_vector):
+        """Entries record how they were written; any cache instance can read them."""
+        # ARRANGE
+        vector = test_embedding_vector().astype(np.float32)
+        EmbeddingCache(tmp_path, model="test-model", quantized=True).set(
+            "quant_sha", self._embeddings(vector)
+        )
+
+        # ACT
+        loaded = EmbeddingCache(tmp_path, model="test-model").get("quant_sha")
+
+        # ASSERT
+        assert loaded is not None
+        assert np.allclose(loaded[0].vector, vector, atol=0.01)
+
+    def test_zero_vector_quantizes_cleanly(self, tmp_path):
+        """An all-zero vector survives quantization (no divide-by-zero)."""
+        # ARRANGE
+        cache = EmbeddingCache(tmp_path, model="test-model", quantized=True)
+
+        # ACT
+        cache.set("quant_sha", self._embeddings(np.zeros(8, dtype=np.float32)))
+        loaded = cache.get("quant_sha")
+
+        # ASSERT
+        assert loaded is not None
+        assert np.array_equal(loaded[0].vector, np.zeros(8, dtype=np.float32))
+
+    @pytest.mark.parametrize("peak", [1e-7, 1e7])
+    def test_extreme_peak_quantizes_to_finite_values(self, tmp_path, peak):
+        """Peaks outside float16 range round-trip without inf/NaN."""
+        # ARRANGE - mixed-sign vector whose largest component is peak
+        cache = EmbeddingCache(tmp_path, model="test-model", quantized=True)
+        original = np.linspace(-peak, peak, 8, dtype=np.float32)
+
+        # ACT
+        cache.set("quant_sha", self._embeddings(original))
+        loaded = cache.get("quant_sha")
+
+        # ASSERT
+        assert loaded is not None
+        assert np.all(np.isfinite(loaded[0].vector))
+        assert np.allclose(loaded[0].vector, original, rtol=0, atol=0.01 * peak)
+
+    def test_legacy_float16_scale_dequantizes(self):
+        """Entries written with a float16 scale still decode."""
+        q = np.array([127, -64, 0], dtype=np.int8)
+
+        restored = EmbeddingCache._dequantize(q, np.array([0.5], dtype=np.float16))
+
+        assert restored.dtype == np.float32
+        assert restored.tolist() == [63.5, -32.0, 0.0]
+
+
+class TestEmbeddingCacheChunks:
+    """Test content-addressed chunk entries."""
+
+    def test_chunk_round_trip_by_content_key(self, tmp_path):
+        """A chunk embedding is retrievable by its content key only."""
+        # ARRANGE
+        cache = EmbeddingCache(tmp_path, model="test-model")
+        key = chunk_content_key("def foo(): pass")
+        embedding = Embedding(
+            vector=np.arange(8, dtype=np.float32),
+            token_count=5,
+            model="test-model",
+            cost_usd=0.0001,
+            blob_sha="blob_sha",
+            chunk_index=3,
+        )
+
+        # ACT
+        cache.set_chunk(key, embedding)
+        loaded = cache.get_chunk(key)
+
+        # ASSERT
+        assert loaded is not None
+        assert np.array_equal(loaded.vector, embedding.vector)
+        assert loaded.token_count == 5
+        assert cache.get_chunk(chunk_content_key("def bar(): pass")) is None
+        assert cache.get(key) is None  # Chunk entries never shadow blob entries
+
+    def test_chunk_entries_fan_out_by_key_prefix(self, tmp_path):
+        """Chunk entries are sharded into 2-char subdirectories, written atomically."""
+        # ARRANGE
+        cache = EmbeddingCache(tmp_path, model="test-model")
+        key = chunk_content_key("x = 1")
+        embedding = Embedding(
+            vector=np.ones(4, dtype=np.float32),
+            token_count=3,
+            model="test-model",
+            cost_usd=0.0,
+            blob_sha="blob_sha",
+            chunk_index=0,
+        )
+
+        # ACT
+        cache.set_chunk(key, embedding)
+
+        # ASSERT
+        shard = cache.cache_dir / "chunks" / key[:2]
+        assert [p.name for p in shard.iterdir()] == [f"{key}.safetensors.zst"]
@@ -135,16 +135,12 @@ def test_dimension_validation_raises_error_on_mismatch(tmp_path: Path, isolated_
     store1 = LanceDBStore(db_path, embedding_dimensions=3072)
     assert store1.count() == 0
 
-    # Try to open with different dimensions - should raise error
-    with pytest.raises(DimensionMismatchError) as exc_info:
+    # Try to open with different dimensions - should raise error naming both sizes and the fix
+    with pytest.raises(
+        DimensionMismatchError, match=r"Dimension mismatch.*3072.*1536.*gitctx index --force"
+    ):
         _ = LanceDBStore(db_path, embedding_dimensions=1536)
 
-    # Verify error message format
-    assert "Dimension mismatch" in str(exc_info.value)
-    assert "3072" in str(exc_info.value)
-    assert "1536" in str(exc_info.value)
-    assert "gitctx index --force" in str(exc_info.value)
-
 
 def test_count_returns_zero_on_exception(tmp_path: Path, isolated_env):
     """count() returns 0 if count_rows() raises exception."""
@@ -197,8 +193,6 @@ def test_add_chunks_batch_denormalizes_blob_location(
     tmp_path: Path, isolated_env, mock_embedding, mock_blob_location
 ):
     """add_chunks_batch denormalizes BlobLocation metadata into each chunk."""
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -261,8 +255,6 @@ def test_add_chunks_batch_empty_blob_locations_warning(
     tmp_path: Path, isolated_env, mock_embedding, caplog
 ):
     """add_chunks_batch logs warning and skips chunks with missing blob locations."""
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -361,8 +353,6 @@ def test_batch_insertion_performance_5000_chunks(
     import os
     import time
 
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -404,8 +394,6 @@ def test_optimize_creates_ivf_pq_index_at_256_vectors(
     tmp_path: Path, isolated_env, mock_embedding, mock_blob_location
 ):
     """optimize() creates IVF-PQ index when count >= 256."""
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -435,8 +423,6 @@ def test_optimize_skips_indexing_below_256_vectors(
     """optimize() skips indexing when count < 256."""
     import logging
 
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     # Set log level to capture INFO messages
     caplog.set_level(logging.INFO)
 
@@ -466,8 +452,6 @@ def test_search_returns_denormalized_metadata(
     tmp_path: Path, isolated_env, mock_embedding, mock_blob_location
 ):
     """search() returns results with all 19 denormalized fields."""
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -589,8 +573,6 @@ def test_incremental_updates_preserve_existing_chunks(
     tmp_path: Path, isolated_env, mock_embedding, mock_blob_location
 ):
     """Incremental updates preserve existing chunks (old data unchanged)."""
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -643,8 +625,6 @@ def test_save_index_state_stores_metadata(
     tmp_path: Path, isolated_env, mock_embedding, mock_blob_location
 ):
     """save_index_state() stores complete metadata."""
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -677,8 +657,6 @@ def test_save_index_state_upsert_pattern(
     tmp_path: Path, isolated_env, mock_embedding, mock_blob_location
 ):
     """save_index_state() replaces old state (upsert)."""
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -718,8 +696,6 @@ def test_query_returns_complete_blob_location_context(
     tmp_path: Path, isolated_env, mock_embedding, mock_blob_location
 ):
     """Query results include all 11 BlobLocation fields."""
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -764,8 +740,6 @@ def test_statistics_language_breakdown(
     tmp_path: Path, isolated_env, mock_embedding, mock_blob_location
 ):
     """get_statistics() returns language counts."""
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -811,8 +785,6 @@ def test_performance_insertion_speed(
     import os
     import time
 
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 
@@ -845,8 +817,6 @@ def test_performance_search_latency(
     import os
     import time
 
-    from gitctx.storage.lancedb_store import LanceDBStore
-
     db_path = tmp_path / ".gitctx" / "db" / "lancedb"
     store = LanceDBStore(db_path)
 